@@ -0,0 +1,508 @@
+import json
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Tuple
+
+
+# Titel mit angehängtem Erscheinungsjahr, z.B. "Dune (2021)"
+TITLE_YEAR_PATTERN = re.compile(r"^(?P<title>.*?)\s*\((?P<year>\d{4})\)\s*$")
+
+
+def split_title_year(title: str) -> Tuple[str, str | None]:
+    """
+    Trennt ein angehängtes Erscheinungsjahr vom Filmtitel.
+    :param title: Filmtitel, z.B. "Dune (2021)".
+    :return: Ein Tuple aus Titel und Jahr (oder None), z.B. ("Dune", "2021")
+    """
+    match = TITLE_YEAR_PATTERN.match(title)
+    if match:
+        return match.group("title"), match.group("year")
+    return title.strip(), None
+
+
+def make_title_alias(title: str, year: str | None = None) -> str:
+    """
+    Erstellt den normalisierten Alias-Schlüssel eines Titels, sodass z.B.
+    "Dune", "dune " und " DUNE" auf denselben Cache-Eintrag zeigen.
+    :param title: Filmtitel.
+    :param year: Optionales Erscheinungsjahr.
+    :return: Der Alias-Schlüssel, z.B. "dune" oder "dune|2021"
+    """
+    alias = " ".join(unicodedata.normalize("NFKC", title).casefold().split())
+    return f"{alias}|{year}" if year else alias
+
+
+class MovieCache:
+    """
+    Basisklasse für die Cache-Backends der Filmdaten.
+    Der OmdbApiHandler arbeitet nur mit dieser Schnittstelle und muss nicht
+    wissen, wie und wo die Daten gespeichert werden.
+    """
+
+    def get_entry(self, key: str) -> Tuple[Dict, float] | None:
+        """
+        Liefert die gespeicherten Filmdaten zusammen mit dem Zeitpunkt
+        (Unix-Timestamp), an dem sie von der API geholt wurden.
+        """
+        raise NotImplementedError
+
+    def get(self, key: str) -> Dict | None:
+        entry = self.get_entry(key)
+        return entry[0] if entry else None
+
+    def set(self, key: str, value: Dict, fetched_at: float | None = None) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def get_alias(self, alias: str) -> str | None:
+        """
+        Liefert die imdbID, unter der ein normalisierter Titel gespeichert ist.
+        """
+        raise NotImplementedError
+
+    def set_alias(self, alias: str, imdb_id: str) -> None:
+        raise NotImplementedError
+
+    def evict(self, max_entries: int, older_than: float | None = None) -> int:
+        """
+        Entfernt abgelaufene Einträge und begrenzt den Cache auf `max_entries`
+        Einträge, wobei die ältesten Einträge zuerst gelöscht werden.
+        :return: Anzahl der entfernten Einträge
+        """
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+
+class JsonFileCache(MovieCache):
+    """
+    Das ursprüngliche Cache-Format: alle Filme liegen in einer einzigen JSON-Datei,
+    die beim Start vollständig geladen und bei jeder Änderung komplett neu
+    geschrieben wird. Nur noch für kleine, lokale Setups gedacht.
+    """
+
+    # Reservierte Schlüssel, unter denen Abrufzeitpunkte und Titel-Aliase liegen
+    fetched_at_key = "__fetched_at__"
+    aliases_key = "__aliases__"
+
+    def __init__(self, file_path: Path):
+        self.file_path = file_path
+        self._lock = threading.Lock()
+        self.data = {}
+        self.fetched_at = {}
+        self.aliases = {}
+
+        if self.file_path.exists():
+            with open(self.file_path, "r") as file:
+                try:
+                    self.data = json.loads(file.read())
+                except json.JSONDecodeError:
+                    print(f"Could not read cached movie data.")
+
+            # Alte Dateien ohne Zeitstempel: das Änderungsdatum der Datei wird verwendet
+            file_mtime = self.file_path.stat().st_mtime
+            self.fetched_at = self.data.pop(self.fetched_at_key, {})
+            self.aliases = self.data.pop(self.aliases_key, {})
+            for key in self.data:
+                self.fetched_at.setdefault(key, file_mtime)
+
+    def _write_file(self) -> None:
+        with open(self.file_path, "w") as file:
+            file.write(
+                json.dumps(
+                    {
+                        **self.data,
+                        self.fetched_at_key: self.fetched_at,
+                        self.aliases_key: self.aliases,
+                    }
+                )
+            )
+
+    def get_entry(self, key: str) -> Tuple[Dict, float] | None:
+        if key not in self.data:
+            return None
+        return self.data[key], self.fetched_at.get(key, 0.0)
+
+    def set(self, key: str, value: Dict, fetched_at: float | None = None) -> None:
+        with self._lock:
+            self.data[key] = value
+            self.fetched_at[key] = fetched_at or time.time()
+            self._write_file()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self.fetched_at.pop(key, None)
+            if self.data.pop(key, None) is not None:
+                self._write_file()
+
+    def clear(self) -> None:
+        with self._lock:
+            self.data = {}
+            self.fetched_at = {}
+            self.aliases = {}
+            if self.file_path.exists():
+                self.file_path.unlink()
+
+    def get_alias(self, alias: str) -> str | None:
+        return self.aliases.get(alias, None)
+
+    def set_alias(self, alias: str, imdb_id: str) -> None:
+        with self._lock:
+            if self.aliases.get(alias) != imdb_id:
+                self.aliases[alias] = imdb_id
+                self._write_file()
+
+    def evict(self, max_entries: int, older_than: float | None = None) -> int:
+        with self._lock:
+            if older_than is None:
+                older_than = 0.0
+
+            # Neueste Einträge zuerst, abgelaufene werden gar nicht behalten
+            keys_by_age = sorted(
+                self.data, key=lambda key: self.fetched_at.get(key, 0.0), reverse=True
+            )
+            kept_keys = [
+                key
+                for key in keys_by_age
+                if self.fetched_at.get(key, 0.0) >= older_than
+            ][:max_entries]
+            evicted_keys = set(keys_by_age) - set(kept_keys)
+
+            for key in evicted_keys:
+                self.data.pop(key, None)
+                self.fetched_at.pop(key, None)
+
+            if evicted_keys:
+                self._write_file()
+
+        return len(evicted_keys)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+
+class SqliteMovieCache(MovieCache):
+    """
+    Cache-Backend auf Basis von SQLite im WAL-Modus.
+    Jeder neue Film ist ein einzelnes INSERT (O(1) statt die ganze Datei neu zu
+    schreiben), mehrere Prozesse (z.B. mehrere Streamlit-Sessions) können
+    gleichzeitig lesen und schreiben und Einträge werden erst beim ersten
+    Zugriff aus der Datenbank geladen.
+    """
+
+    def __init__(self, db_path: Path, legacy_json_path: Path | None = None):
+        """
+        Konstruktor für die SqliteMovieCache-Klasse.
+        :param db_path: Pfad der SQLite-Datenbank.
+        :param legacy_json_path: Pfad der alten MovieData.cache.json, deren
+                                 Einträge einmalig übernommen werden.
+        """
+        self.db_path = db_path
+        # Jeder Thread bekommt eine eigene Verbindung, da sqlite3-Verbindungen
+        # nicht zwischen Threads geteilt werden sollen
+        self._local = threading.local()
+
+        connection = self._connection()
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS movies ("
+            "key TEXT PRIMARY KEY, data TEXT NOT NULL, fetched_at REAL NOT NULL)"
+        )
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS aliases ("
+            "alias TEXT PRIMARY KEY, imdb_id TEXT NOT NULL)"
+        )
+        connection.commit()
+
+        if legacy_json_path is not None:
+            self._migrate_json_file(legacy_json_path)
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+
+        if connection is None:
+            connection = sqlite3.connect(self.db_path, timeout=30)
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+
+        return connection
+
+    def _migrate_json_file(self, json_path: Path) -> None:
+        """
+        Übernimmt die Einträge aus dem alten JSON-Cache in die Datenbank und
+        benennt die JSON-Datei danach um, damit die Migration nur einmal läuft.
+        """
+        if not json_path.exists():
+            return
+
+        try:
+            with open(json_path, "r") as file:
+                legacy_data = json.loads(file.read())
+        except json.JSONDecodeError:
+            print(f"Could not read cached movie data for migration.")
+            return
+
+        fetched_at = legacy_data.pop(JsonFileCache.fetched_at_key, {})
+        aliases = legacy_data.pop(JsonFileCache.aliases_key, {})
+        now = time.time()
+
+        # Der alte Cache ist nach Titeln geordnet, die Datenbank nach imdbID.
+        # Die Titel werden deshalb als Aliase übernommen.
+        movie_rows = []
+        for key, value in legacy_data.items():
+            if not isinstance(value, dict):
+                continue
+
+            imdb_id = value.get("imdbID", key)
+            movie_rows.append((imdb_id, json.dumps(value), fetched_at.get(key, now)))
+            if imdb_id != key:
+                aliases.setdefault(make_title_alias(*split_title_year(key)), imdb_id)
+
+        connection = self._connection()
+        with connection:
+            connection.executemany(
+                "INSERT OR IGNORE INTO movies (key, data, fetched_at) VALUES (?, ?, ?)",
+                movie_rows,
+            )
+            connection.executemany(
+                "INSERT OR IGNORE INTO aliases (alias, imdb_id) VALUES (?, ?)",
+                list(aliases.items()),
+            )
+
+        json_path.rename(json_path.with_suffix(".json.migrated"))
+        print(f"Migrated {len(legacy_data)} cached movies from {json_path.name}")
+
+    def get_entry(self, key: str) -> Tuple[Dict, float] | None:
+        row = (
+            self._connection()
+            .execute("SELECT data, fetched_at FROM movies WHERE key = ?", (key,))
+            .fetchone()
+        )
+        return (json.loads(row[0]), row[1]) if row else None
+
+    def set(self, key: str, value: Dict, fetched_at: float | None = None) -> None:
+        connection = self._connection()
+        with connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO movies (key, data, fetched_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value), fetched_at or time.time()),
+            )
+
+    def delete(self, key: str) -> None:
+        connection = self._connection()
+        with connection:
+            connection.execute("DELETE FROM movies WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        connection = self._connection()
+        with connection:
+            connection.execute("DELETE FROM movies")
+            connection.execute("DELETE FROM aliases")
+
+    def get_alias(self, alias: str) -> str | None:
+        row = (
+            self._connection()
+            .execute("SELECT imdb_id FROM aliases WHERE alias = ?", (alias,))
+            .fetchone()
+        )
+        return row[0] if row else None
+
+    def set_alias(self, alias: str, imdb_id: str) -> None:
+        connection = self._connection()
+        with connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO aliases (alias, imdb_id) VALUES (?, ?)",
+                (alias, imdb_id),
+            )
+
+    def evict(self, max_entries: int, older_than: float | None = None) -> int:
+        connection = self._connection()
+        with connection:
+            evicted = 0
+            if older_than is not None:
+                evicted += connection.execute(
+                    "DELETE FROM movies WHERE fetched_at < ?", (older_than,)
+                ).rowcount
+
+            evicted += connection.execute(
+                "DELETE FROM movies WHERE key IN ("
+                "SELECT key FROM movies ORDER BY fetched_at DESC LIMIT -1 OFFSET ?)",
+                (max_entries,),
+            ).rowcount
+
+        return evicted
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM movies").fetchone()[0]
+
+
+class TtlLruCache(MovieCache):
+    """
+    Speicher-Cache mit LRU-Verdrängung und Ablaufzeit (TTL) vor einem
+    persistenten Backend. Häufig genutzte Filme werden direkt aus dem Speicher
+    bedient, das Backend wird nur bei einem Speicher-Miss gelesen.
+
+    Ein Eintrag ist
+      - frisch, solange er jünger als `ttl` Sekunden ist,
+      - veraltet (stale), solange er jünger als `ttl + stale_ttl` ist: er wird
+        weiterhin ausgeliefert, sollte aber im Hintergrund neu geladen werden,
+      - abgelaufen, wenn er älter ist: er gilt dann als Cache-Miss.
+    """
+
+    def __init__(
+        self,
+        backend: MovieCache,
+        ttl: float,
+        stale_ttl: float,
+        max_entries: int,
+        max_persisted_entries: int,
+    ):
+        """
+        Konstruktor für die TtlLruCache-Klasse.
+        :param backend: Persistentes Cache-Backend (SQLite oder JSON).
+        :param ttl: Sekunden, die ein Eintrag als frisch gilt.
+        :param stale_ttl: Zusätzliche Sekunden, in denen ein veralteter Eintrag
+                          noch ausgeliefert wird.
+        :param max_entries: Maximale Anzahl an Einträgen im Speicher.
+        :param max_persisted_entries: Maximale Anzahl an Einträgen im Backend.
+        """
+        self.backend = backend
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max(1, max_entries)
+        self.max_persisted_entries = max_persisted_entries
+
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._writes_since_eviction = 0
+
+        # Beim Start werden abgelaufene Einträge aus dem Backend entfernt
+        self._evict_backend()
+
+    def _evict_backend(self) -> None:
+        self._writes_since_eviction = 0
+        evicted = self.backend.evict(
+            max_entries=self.max_persisted_entries,
+            older_than=time.time() - self.ttl - self.stale_ttl,
+        )
+        if evicted:
+            print(f"Evicted {evicted} movies from the cache")
+
+    def _remember(self, key: str, entry: Tuple[Dict, float]) -> None:
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def _find_entry(self, key: str) -> Tuple[Dict, float] | None:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                return entry
+
+        entry = self.backend.get_entry(key)
+        if entry is not None:
+            self._remember(key, entry)
+
+        return entry
+
+    def _is_expired(self, fetched_at: float) -> bool:
+        return time.time() - fetched_at > self.ttl + self.stale_ttl
+
+    def lookup(self, key: str) -> Tuple[Dict | None, bool]:
+        """
+        Sucht einen Film im Cache.
+        :param key: Cache-Schlüssel.
+        :return: Ein Tuple aus den Filmdaten (oder None bei einem Miss) und der
+                 Angabe, ob der Eintrag veraltet ist und neu geladen werden sollte
+        """
+        entry = self._find_entry(key)
+
+        if entry is None or self._is_expired(entry[1]):
+            return None, False
+
+        value, fetched_at = entry
+        return value, time.time() - fetched_at > self.ttl
+
+    def get_entry(self, key: str) -> Tuple[Dict, float] | None:
+        entry = self._find_entry(key)
+
+        if entry is None or self._is_expired(entry[1]):
+            return None
+
+        return entry
+
+    def set(self, key: str, value: Dict, fetched_at: float | None = None) -> None:
+        fetched_at = fetched_at or time.time()
+        self.backend.set(key, value, fetched_at=fetched_at)
+        self._remember(key, (value, fetched_at))
+
+        # Die Größe des Backends wird nicht bei jedem Schreiben geprüft
+        self._writes_since_eviction += 1
+        if self._writes_since_eviction >= 500:
+            self._evict_backend()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._memory.pop(key, None)
+        self.backend.delete(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+        self.backend.clear()
+
+    def get_alias(self, alias: str) -> str | None:
+        return self.backend.get_alias(alias)
+
+    def set_alias(self, alias: str, imdb_id: str) -> None:
+        self.backend.set_alias(alias, imdb_id)
+
+    def evict(self, max_entries: int, older_than: float | None = None) -> int:
+        return self.backend.evict(max_entries=max_entries, older_than=older_than)
+
+    def __len__(self) -> int:
+        return len(self.backend)
+
+
+def create_movie_cache(config) -> MovieCache:
+    """
+    Erstellt das in der Config gewählte Cache-Backend.
+    :param config: Instanz der Config-Klasse.
+    :return: Eine Instanz eines MovieCache-Backends
+    """
+    api_path = config.project_path.joinpath("api")
+    json_path = api_path.joinpath("MovieData.cache.json")
+
+    if config.movie_cache_backend == "json":
+        backend = JsonFileCache(file_path=json_path)
+    else:
+        backend = SqliteMovieCache(
+            db_path=api_path.joinpath("MovieData.cache.sqlite"),
+            legacy_json_path=json_path,
+        )
+
+    return TtlLruCache(
+        backend=backend,
+        ttl=config.movie_cache_ttl,
+        stale_ttl=config.movie_cache_stale_ttl,
+        max_entries=config.movie_cache_max_entries,
+        max_persisted_entries=config.movie_cache_max_persisted_entries,
+    )
@@ -0,0 +1,128 @@
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Einfacher, thread-sicherer Token-Bucket als Rate Limiter.
+    Pro Sekunde werden `rate` Tokens nachgefüllt, höchstens aber `capacity`
+    Tokens gespeichert. Jeder API-Aufruf verbraucht ein Token. Ist der Bucket
+    leer, wartet der aufrufende Thread, bis wieder ein Token verfügbar ist.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        """
+        Konstruktor für die TokenBucket-Klasse.
+        :param rate: Anzahl der Tokens, die pro Sekunde nachgefüllt werden.
+        :param capacity: Maximale Anzahl an Tokens (erlaubter Burst).
+        """
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self.tokens = float(self.capacity)
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.last_refill) * self.rate
+        )
+        self.last_refill = now
+
+    def acquire(self) -> None:
+        """
+        Blockiert so lange, bis ein Token verbraucht werden kann.
+        Bei einer Rate <= 0 ist das Limit deaktiviert.
+        """
+        if self.rate <= 0:
+            return
+
+        while True:
+            with self._lock:
+                self._refill()
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                # Wartezeit bis zum nächsten vollen Token
+                wait_time = (1 - self.tokens) / self.rate
+
+            time.sleep(wait_time)
+
+
+class CircuitBreaker:
+    """
+    Thread-sicherer Circuit Breaker für eine externe API.
+    Nach `failure_threshold` aufeinanderfolgenden Fehlern wird der Breaker
+    geöffnet: für `cooldown` Sekunden werden keine Anfragen mehr gesendet.
+    Danach wird eine einzelne Testanfrage zugelassen (half-open). Ist sie
+    erfolgreich, wird der Breaker wieder geschlossen, sonst erneut geöffnet.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, cooldown: float):
+        """
+        Konstruktor für die CircuitBreaker-Klasse.
+        :param failure_threshold: Anzahl aufeinanderfolgender Fehler, nach denen
+                                  der Breaker geöffnet wird (0 = deaktiviert).
+        :param cooldown: Sekunden, die der Breaker geöffnet bleibt.
+        """
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.state = self.CLOSED
+        self.failure_count = 0
+        self.opened_at = 0.0
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        """Ob zurzeit keine Anfragen gesendet werden (auch während der Testanfrage)."""
+        return self.state != self.CLOSED
+
+    def allow_request(self) -> bool:
+        """
+        Prüft, ob eine Anfrage gesendet werden darf. Nach Ablauf der Wartezeit
+        darf genau ein Thread die Testanfrage senden.
+        """
+        if self.failure_threshold <= 0:
+            return True
+
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+
+            if (
+                self.state == self.OPEN
+                and time.monotonic() - self.opened_at >= self.cooldown
+            ):
+                self.state = self.HALF_OPEN
+                self._trial_running = False
+
+            if self.state == self.HALF_OPEN and not self._trial_running:
+                self._trial_running = True
+                return True
+
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = self.CLOSED
+            self.failure_count = 0
+            self._trial_running = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failure_count += 1
+            self._trial_running = False
+
+            if self.state == self.HALF_OPEN or (
+                self.failure_threshold > 0
+                and self.failure_count >= self.failure_threshold
+            ):
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
@@ -1,8 +1,49 @@
 import requests
 import json
-from pathlib import Path
-from typing import Dict, List
+import math
+import random
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Dict, Iterator, List, Tuple
+from requests.adapters import HTTPAdapter
 from config import Config
+from api.cache import create_movie_cache, make_title_alias, split_title_year
+from api.limiter import CircuitBreaker, TokenBucket
+from metrics import METRICS
+
+
+IMDB_ID_PATTERN = re.compile(r"^tt\d{7,}$")
+
+# HTTP-Status, bei denen eine Anfrage nach einer Wartezeit wiederholt wird
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+# Maximale Anzahl gemerkter nicht gefundener Titel
+MAX_NOT_FOUND_ENTRIES = 10_000
+# Anzahl der Treffer je Seite der OMDb-Suche (s=), die API erlaubt höchstens 100 Seiten
+SEARCH_PAGE_SIZE = 10
+MAX_SEARCH_PAGES = 100
+
+
+def is_imdb_id(value: str) -> bool:
+    """Prüft, ob der Wert eine imdbID wie "tt1160419" ist."""
+    return isinstance(value, str) and IMDB_ID_PATTERN.match(value.strip()) is not None
+
+
+class MovieFetchFailed(dict):
+    """
+    Leeres Ergebnis einer Filmabfrage, die an einem Fehler gescheitert ist
+    (Timeout, 429/5xx nach allen Wiederholungen, ungültige Antwort oder offener
+    Circuit Breaker). Wie {} für einen nicht gefundenen Film ist es leer, über
+    is_fetch_failure können Aufrufer die beiden Fälle aber unterscheiden.
+    """
+
+
+def is_fetch_failure(movie_data: Dict) -> bool:
+    """Ob ein leeres Ergebnis auf einen Fehler statt "nicht gefunden" zurückgeht."""
+    return isinstance(movie_data, MovieFetchFailed)
 
 
 class OmdbApiHandler:
@@ -13,82 +54,610 @@ class OmdbApiHandler:
     die Authentifizierung funktioniert oder Endpoints aufgebaut sind.
     """
 
-    def __init__(self):
-        self.config = Config()
+    def __init__(self, config: Config | None = None):
+        """
+        Konstruktor für die OmdbApiHandler-Klasse.
+        :param config: Optionale Config, z.B. mit einer anderen API-URL für Tests
+                       und Benchmarks (Standard: Config()).
+        """
+        self.config = config or Config()
+
+        # Das Cache-Backend (SQLite oder JSON) wird über die Config gewählt
+        self.movie_data_cache = create_movie_cache(self.config)
 
-        self.cache_file_location = Config.project_path.joinpath("api").joinpath("MovieData.cache.json")
-        self._load_movie_data_cache()
+        # Der Rate Limiter wird von allen Threads geteilt, damit das Limit
+        # des API-Keys auch bei parallelen Anfragen eingehalten wird
+        self.rate_limiter = TokenBucket(
+            rate=self.config.omdb_rate_limit, capacity=self.config.omdb_rate_burst
+        )
 
-    def _load_movie_data_cache(self):
-        self.movie_data_cache = {}
+        # Eine gemeinsame Session hält die Verbindungen zur API offen (Keep-Alive),
+        # der Pool ist so groß wie die Anzahl paralleler Anfragen
+        self.session = requests.Session()
+        self.session.mount(
+            "http://",
+            HTTPAdapter(pool_connections=1, pool_maxsize=self.config.omdb_max_workers),
+        )
+        self.session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=1, pool_maxsize=self.config.omdb_max_workers),
+        )
 
-        if self.cache_file_location.exists():
-            with open(self.cache_file_location, "r") as file:
+        # Ist die API nicht erreichbar, werden nur noch gecachte Filme geliefert
+        self.circuit_breaker = CircuitBreaker(
+            failure_threshold=self.config.omdb_breaker_threshold,
+            cooldown=self.config.omdb_breaker_cooldown,
+        )
 
-                try:
-                    self.movie_data_cache = json.loads(file.read())
-                except json.JSONDecodeError:
-                    print(f"Could not read cached movie data.")
+        # Nicht gefundene Titel bzw. imdbIDs (Schlüssel -> Ablaufzeit), damit ein
+        # falscher Titel nicht bei jedem Laden erneut angefragt wird
+        self._not_found: Dict[str, float] = {}
+        self._not_found_lock = threading.Lock()
 
-    def _update_movie_data_cache_file(self):
-        with open(self.cache_file_location, "w") as file:
-            file.write(json.dumps(self.movie_data_cache))
+        # Veraltete Cache-Einträge werden in einem eigenen Thread neu geladen
+        self._revalidation_executor = ThreadPoolExecutor(max_workers=1)
+        self._revalidating = set()
+        self._revalidation_lock = threading.Lock()
 
     def _invalidate_cached_movie_data(self):
-        self.cache_file_location.unlink()
+        self.movie_data_cache.clear()
+
+    def _revalidate_in_background(self, imdb_id: str) -> None:
+        """
+        Lädt einen veralteten Film im Hintergrund neu, ohne den Aufrufer zu blockieren.
+        Jeder Film wird dabei höchstens einmal gleichzeitig neu geladen.
+        """
+        # Im Cache-only-Modus wird nichts neu geladen
+        if self.circuit_breaker.is_open:
+            return
+
+        with self._revalidation_lock:
+            if imdb_id in self._revalidating:
+                return
+            self._revalidating.add(imdb_id)
+
+        METRICS.increment("omdb_revalidations_total")
+
+        def revalidate():
+            try:
+                self._request_movie_data(parameters={"i": imdb_id})
+            finally:
+                with self._revalidation_lock:
+                    self._revalidating.discard(imdb_id)
+
+        self._revalidation_executor.submit(revalidate)
+
+    def _get_cached_movie(self, imdb_id: str) -> Dict | None:
+        movie_data, is_stale = self.movie_data_cache.lookup(imdb_id)
+
+        # Veraltete Daten werden sofort ausgeliefert und im Hintergrund erneuert
+        if movie_data and is_stale:
+            self._revalidate_in_background(imdb_id)
+
+        METRICS.increment(
+            "cache_requests_total",
+            cache="movie",
+            result="miss" if not movie_data else "stale" if is_stale else "hit",
+        )
+        return movie_data
+
+    def _is_known_not_found(self, key: str) -> bool:
+        with self._not_found_lock:
+            expires_at = self._not_found.get(key)
+            if expires_at is None:
+                return False
+            if expires_at > time.monotonic():
+                return True
+            del self._not_found[key]
+            return False
+
+    def _remember_not_found(self, key: str) -> None:
+        if self.config.omdb_not_found_ttl <= 0:
+            return
+
+        now = time.monotonic()
+        with self._not_found_lock:
+            if len(self._not_found) >= MAX_NOT_FOUND_ENTRIES:
+                self._not_found = {
+                    not_found_key: expires_at
+                    for not_found_key, expires_at in self._not_found.items()
+                    if expires_at > now
+                }
+                # Sind alle Einträge noch gültig, wird der älteste entfernt
+                if len(self._not_found) >= MAX_NOT_FOUND_ENTRIES:
+                    del self._not_found[next(iter(self._not_found))]
+
+            self._not_found[key] = now + self.config.omdb_not_found_ttl
 
     def get_movie_data(self, movie_title: str) -> Dict:
         """
         Diese Funktion ruft die API auf und holt die Filmdaten basierend auf
-        dem angegebenen Filmtitel.
-        :param movie_title: der Filmtitel.
+        dem angegebenen Filmtitel. Der Titel wird normalisiert und über den
+        Alias-Index auf die imdbID abgebildet, sodass z.B. "Dune" und "dune "
+        denselben Cache-Eintrag verwenden. Ein angehängtes Jahr wie in
+        "Dune (2021)" wird als Jahr an die API übergeben.
+        Nicht gefundene Titel werden für OMDB_NOT_FOUND_TTL Sekunden nicht
+        erneut angefragt.
+        :param movie_title: der Filmtitel (oder eine imdbID wie "tt1160419").
+        :return: Ein Dictionary mit den Informationen des angegebenen Films
+        """
+        if is_imdb_id(movie_title):
+            return self.get_movie_data_by_id(imdb_id=movie_title.strip())
+
+        title, year = split_title_year(movie_title)
+        alias = make_title_alias(title, year)
+
+        imdb_id = self.movie_data_cache.get_alias(alias)
+        if imdb_id:
+            movie_data = self._get_cached_movie(imdb_id)
+            if movie_data:
+                return movie_data
+
+            # Der Alias zeigt bereits auf einen Film, er wird über seine imdbID neu
+            # geladen. Eine Suche nach dem Titel könnte einen anderen Film liefern.
+            return self._request_movie_data(
+                parameters={"i": imdb_id}, aliases=[alias], not_found_key=imdb_id
+            )
+        elif self._is_known_not_found(alias):
+            METRICS.increment("cache_requests_total", cache="movie", result="not_found")
+            return {}
+        else:
+            METRICS.increment("cache_requests_total", cache="movie", result="miss")
+
+        parameters = {"t": title}
+        if year:
+            parameters["y"] = year
+
+        return self._request_movie_data(
+            parameters=parameters, aliases=[alias], not_found_key=alias
+        )
+
+    def get_movie_data_by_id(self, imdb_id: str) -> Dict:
+        """
+        Diese Funktion holt die Filmdaten eindeutig über die imdbID
+        (z.B. die Spalte "Const" einer IMDb-Liste).
+        :param imdb_id: die imdbID, z.B. "tt1160419".
         :return: Ein Dictionary mit den Informationen des angegebenen Films
         """
-        movie_data = self.movie_data_cache.get(movie_title, None)
+        if self._is_known_not_found(imdb_id):
+            METRICS.increment("cache_requests_total", cache="movie", result="not_found")
+            return {}
+
+        movie_data = self._get_cached_movie(imdb_id)
 
         if movie_data:
             return movie_data
 
-        parameters = {"t": movie_title, "apikey": self.config.api_key}
+        return self._request_movie_data(
+            parameters={"i": imdb_id}, not_found_key=imdb_id
+        )
+
+    def _retry_delay(self, attempt: int, response: requests.Response | None) -> float:
+        """
+        Wartezeit vor der nächsten Wiederholung: exponentieller Backoff mit
+        zufälligem Jitter ("full jitter"), damit parallele Threads nicht gleichzeitig
+        erneut anfragen. Ein Retry-After-Header der API wird eingehalten.
+        :param attempt: Nummer der fehlgeschlagenen Anfrage (0 = erste Anfrage).
+        :param response: Antwort der API oder None bei einem Verbindungsfehler.
+        :return: Wartezeit in Sekunden
+        """
+        max_delay = self.config.omdb_backoff_max
+        delay = random.uniform(
+            0, min(max_delay, self.config.omdb_backoff_base * 2**attempt)
+        )
+
+        if response is not None:
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                delay = max(delay, min(float(retry_after), max_delay))
+
+        return delay
+
+    def _send_request(self, parameters: Dict[str, str]) -> Dict:
+        """
+        Sendet eine Anfrage über die gemeinsame Session. Timeouts, Verbindungsfehler,
+        429 und 5xx werden bis zu OMDB_MAX_RETRIES-mal mit Backoff wiederholt.
+        :param parameters: Parameter der Anfrage inklusive API-Key.
+        :return: Die JSON-Antwort der API
+        :raises requests.exceptions.RequestException: wenn alle Versuche fehlschlagen
+        """
+        timeout = (self.config.omdb_connect_timeout, self.config.omdb_read_timeout)
+        max_retries = max(0, self.config.omdb_max_retries)
+
+        for attempt in range(max_retries + 1):
+            with METRICS.span("omdb_rate_limit_wait"):
+                self.rate_limiter.acquire()
+
+            response = None
+            try:
+                with METRICS.span("omdb_request"):
+                    response = self.session.get(
+                        self.config.api_url, params=parameters, timeout=timeout
+                    )
+
+                if response.status_code not in RETRY_STATUS_CODES:
+                    response.raise_for_status()
+                    return response.json()
+
+                retry_reason = str(response.status_code)
+                if attempt == max_retries:
+                    response.raise_for_status()
+
+            except (
+                requests.exceptions.Timeout,
+                requests.exceptions.ConnectionError,
+            ) as error:
+                retry_reason = type(error).__name__
+                if attempt == max_retries:
+                    raise
+
+            METRICS.increment("omdb_retries_total", reason=retry_reason)
+            time.sleep(self._retry_delay(attempt, response))
+
+    def _request_movie_data(
+        self,
+        parameters: Dict[str, str],
+        aliases: List[str] | None = None,
+        not_found_key: str | None = None,
+    ) -> Dict:
+        """
+        Fragt die Filmdaten direkt bei der API an und speichert sie unter der
+        imdbID im Cache. Die übergebenen Aliase und der offizielle Titel werden
+        im Alias-Index auf die imdbID abgebildet. Ist der Circuit Breaker
+        geöffnet, wird keine Anfrage gesendet.
+        :param parameters: Suchparameter der API ("t" und "y" oder "i").
+        :param aliases: Normalisierte Titel, die auf diesen Film zeigen sollen.
+        :param not_found_key: Schlüssel, unter dem ein nicht gefundener Film
+                              gemerkt wird (Alias oder imdbID).
+        :return: Ein Dictionary mit den Informationen des angegebenen Films
+        """
+        if not self.circuit_breaker.allow_request():
+            METRICS.increment("omdb_requests_total", status="circuit_open")
+            return MovieFetchFailed()
+
+        parameters = {**parameters, "apikey": self.config.api_key}
 
         try:
-            request = requests.get(self.config.api_url, params=parameters)
-            response = request.json()
+            response = self._send_request(parameters)
+            self.circuit_breaker.record_success()
 
             if "Response" in response.keys():
+                METRICS.increment(
+                    "omdb_requests_total",
+                    status="found" if response["Response"] == "True" else "not_found",
+                )
+
                 if response["Response"] == "True":
-                    self.movie_data_cache[movie_title] = response
-                    self._update_movie_data_cache_file()
+                    imdb_id = response.get("imdbID")
+
+                    if imdb_id:
+                        self.movie_data_cache.set(imdb_id, response)
+
+                        for alias in (aliases or []) + [
+                            make_title_alias(
+                                response.get("Title", ""), response.get("Year")
+                            )
+                        ]:
+                            self.movie_data_cache.set_alias(alias, imdb_id)
+
                     return response
                 else:
+                    if not_found_key:
+                        self._remember_not_found(not_found_key)
                     return {}
 
         except (
             requests.exceptions.RequestException,
             requests.exceptions.HTTPError,
             requests.exceptions.ConnectionError,
+            json.JSONDecodeError,
         ) as error:
-            print(f"Something went wrong while calling the api {error}")
-            return {}
+            self.circuit_breaker.record_failure()
+            METRICS.increment("omdb_requests_total", status="error")
+            METRICS.increment("omdb_errors_total", error=type(error).__name__)
+            return MovieFetchFailed()
 
-    def get_movie_info_from_list(self, movie_title_list: List[str]) -> List[dict]:
+        # Eine Antwort ohne "Response" ist weder ein Treffer noch "nicht gefunden"
+        return MovieFetchFailed()
+
+    def _fetch_movie_safely(self, movie_title: str) -> Dict:
         """
-        Diese Funktion iteriert durch die gegebene Filmliste und holt für jeden Film
-        einzeln die Filmdaten über die API.
-        :param movie_title_list: Liste an Filmtiteln.
-        :return: Eine Liste mit einem Dictionary an Filmdaten je Film
+        Holt die Filmdaten für einen Titel, ohne dass ein Fehler bei diesem Titel
+        das Laden der restlichen Liste abbricht.
+        :param movie_title: der Filmtitel.
+        :return: Ein Dictionary mit den Filmdaten, ein leeres Dictionary oder
+                 MovieFetchFailed bei einem Fehler
         """
-        movie_info_list = []
+        # Fehler einzelner Titel werden nur gezählt (omdb_errors_total), damit die
+        # Worker-Threads nicht für jeden Titel eine Zeile ausgeben
+        try:
+            return self.get_movie_data(movie_title=movie_title)
+        except Exception as error:
+            METRICS.increment("omdb_errors_total", error=type(error).__name__)
+            return MovieFetchFailed()
+
+    def iter_movie_data(
+        self, movie_title_list: List[str], max_workers: int | None = None
+    ) -> Iterator[Tuple[str, Dict]]:
+        """
+        Diese Funktion holt die Filmdaten der gegebenen Filmliste und liefert für
+        jeden Eintrag ein Tuple aus Eingabe und Ergebnis, in der Reihenfolge der
+        Eingabe. Die Anfragen laufen parallel in einem Thread-Pool mit höchstens
+        `max_workers` gleichzeitigen Anfragen, das Rate Limit des API-Keys wird
+        dabei über den gemeinsamen Token-Bucket eingehalten.
+        :param movie_title_list: Liste an Filmtiteln oder imdbIDs.
+        :param max_workers: Maximale Anzahl paralleler Anfragen
+                            (Standard: Config.omdb_max_workers, 1 = seriell).
+        :return: Ein Iterator über Tuples aus Filmtitel bzw. imdbID und den
+                 Filmdaten (leeres Dictionary, wenn der Film nicht gefunden wurde)
+        """
+        if max_workers is None:
+            max_workers = self.config.omdb_max_workers
 
-        if movie_title_list:
+        if max_workers <= 1:
             for movie in movie_title_list:
-                print(f"Fetching data from OmdbAPI for movie {movie}")
+                yield movie, self._fetch_movie_safely(movie)
+            return
 
-                movie_dict = self.get_movie_data(movie_title=movie)
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        movie_iterator = iter(movie_title_list)
+        try:
+            # Es sind höchstens 2 * max_workers Titel gleichzeitig eingereiht: genug,
+            # damit der Pool nicht leer läuft, aber auch bei sehr langen Listen
+            # keine Tausende Futures. Die Ergebnisse werden in der Reihenfolge der
+            # Eingabe eingesammelt.
+            pending = deque(
+                (movie, executor.submit(self._fetch_movie_safely, movie))
+                for movie in islice(movie_iterator, 2 * max_workers)
+            )
 
-                if len(movie_dict) > 0:
-                    movie_info_list.append(movie_dict)
-        else:
+            while pending:
+                movie, future = pending.popleft()
+                movie_data = future.result()
+
+                # Für jeden fertigen Titel wird der nächste eingereiht, bevor der
+                # Aufrufer das Ergebnis verarbeitet
+                for next_movie in islice(movie_iterator, 1):
+                    pending.append(
+                        (
+                            next_movie,
+                            executor.submit(self._fetch_movie_safely, next_movie),
+                        )
+                    )
+
+                yield movie, movie_data
+        finally:
+            # Wird der Iterator vorzeitig verlassen (z.B. durch einen Streamlit-Rerun),
+            # werden die noch ausstehenden Anfragen verworfen
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def iter_movie_info_chunks(
+        self,
+        movie_title_list: List[str],
+        chunk_size: int | None = None,
+        max_workers: int | None = None,
+    ) -> Iterator[Tuple[int, List[dict]]]:
+        """
+        Diese Funktion holt die Filmdaten der gegebenen Filmliste und liefert sie
+        schrittweise zurück, sobald ein Block von `chunk_size` Titeln fertig ist.
+        So kann die App bereits die ersten Ergebnisse anzeigen, während der Rest
+        der Liste noch geladen wird (siehe iter_movie_data).
+        :param movie_title_list: Liste an Filmtiteln oder imdbIDs.
+        :param chunk_size: Anzahl der Titel pro Block (Standard: Config.omdb_stream_chunk_size).
+        :param max_workers: Maximale Anzahl paralleler Anfragen
+                            (Standard: Config.omdb_max_workers, 1 = seriell).
+        :return: Ein Iterator über Tuples aus der Anzahl bereits verarbeiteter
+                 Titel und den gefundenen Filmdaten des Blocks
+        """
+        if not movie_title_list:
             print("No movie titles provided")
+            return
+
+        if chunk_size is None:
+            chunk_size = self.config.omdb_stream_chunk_size
+
+        chunk_size = max(1, chunk_size)
+        movie_data_chunk = []
+        processed_count = found_count = 0
+
+        for processed_count, (_, movie_dict) in enumerate(
+            self.iter_movie_data(movie_title_list, max_workers=max_workers), start=1
+        ):
+            if len(movie_dict) > 0:
+                movie_data_chunk.append(movie_dict)
+                found_count += 1
+
+            if processed_count % chunk_size == 0 or processed_count == len(
+                movie_title_list
+            ):
+                yield processed_count, movie_data_chunk
+                movie_data_chunk = []
+
+        # Eine Zusammenfassung je Liste, Details je Titel liefern die Metriken
+        print(f"OMDb: {found_count} of {processed_count} titles found")
+
+    def get_movie_info_from_list(
+        self, movie_title_list: List[str], max_workers: int | None = None
+    ) -> List[dict]:
+        """
+        Diese Funktion holt für jeden Film der gegebenen Filmliste die Filmdaten
+        über die API und gibt sie gesammelt zurück (siehe iter_movie_info_chunks).
+        Die Reihenfolge der Ergebnisse entspricht der Reihenfolge der Eingabe.
+        :param movie_title_list: Liste an Filmtiteln oder imdbIDs.
+        :param max_workers: Maximale Anzahl paralleler Anfragen
+                            (Standard: Config.omdb_max_workers, 1 = seriell).
+        :return: Eine Liste mit einem Dictionary an Filmdaten je Film
+        """
+        movie_info_list = []
+
+        for _, movie_dict_list in self.iter_movie_info_chunks(
+            movie_title_list=movie_title_list, max_workers=max_workers
+        ):
+            movie_info_list.extend(movie_dict_list)
 
         return movie_info_list
+
+    def _request_search_page(self, parameters: Dict[str, str], page: int) -> Dict:
+        """
+        Fragt eine Seite der OMDb-Suche ab. Wie bei _request_movie_data wird keine
+        Anfrage gesendet, solange der Circuit Breaker geöffnet ist.
+        :param parameters: Suchparameter der API ("s" und optional "type" und "y").
+        :param page: Nummer der Seite, beginnend bei 1.
+        :return: Die JSON-Antwort der API oder ein leeres Dictionary bei einem Fehler
+        """
+        if not self.circuit_breaker.allow_request():
+            METRICS.increment("omdb_search_pages_total", status="circuit_open")
+            return {}
+
+        parameters = {**parameters, "page": str(page), "apikey": self.config.api_key}
+
+        try:
+            response = self._send_request(parameters)
+            self.circuit_breaker.record_success()
+        except (requests.exceptions.RequestException, json.JSONDecodeError) as error:
+            self.circuit_breaker.record_failure()
+            METRICS.increment("omdb_search_pages_total", status="error")
+            METRICS.increment("omdb_errors_total", error=type(error).__name__)
+            return {}
+
+        METRICS.increment(
+            "omdb_search_pages_total",
+            status="found" if response.get("Response") == "True" else "not_found",
+        )
+        return response
+
+    def search_imdb_ids(
+        self,
+        search_term: str,
+        media_type: str | None = None,
+        year: str | int | None = None,
+        max_pages: int | None = None,
+    ) -> List[str]:
+        """
+        Sucht über die OMDb-Suche (s=) alle passenden Titel und liefert ihre imdbIDs.
+        Die erste Seite liefert die Gesamtzahl der Treffer, die restlichen Seiten
+        werden danach parallel über den Thread-Pool abgefragt. Rate Limit, Retries
+        und Circuit Breaker gelten wie bei den übrigen Anfragen.
+        :param search_term: Suchbegriff, z.B. "Star Wars".
+        :param media_type: Optionaler Typ: "movie", "series" oder "episode".
+        :param year: Optionales Erscheinungsjahr.
+        :param max_pages: Maximale Anzahl abgefragter Seiten zu je 10 Treffern
+                          (Standard: Config.omdb_search_max_pages).
+        :return: Liste der gefundenen imdbIDs ohne Duplikate, in der Reihenfolge
+                 der Suchergebnisse
+        """
+        search_term = search_term.strip()
+        if not search_term:
+            return []
+
+        parameters = {"s": search_term}
+        if media_type:
+            parameters["type"] = media_type
+        if year:
+            parameters["y"] = str(year)
+
+        if max_pages is None:
+            max_pages = self.config.omdb_search_max_pages
+        max_pages = min(max(1, max_pages), MAX_SEARCH_PAGES)
+
+        with METRICS.span("omdb_search"):
+            first_page = self._request_search_page(parameters, page=1)
+            if first_page.get("Response") != "True":
+                return []
+
+            try:
+                total_results = int(first_page.get("totalResults", 0))
+            except ValueError:
+                total_results = 0
+
+            page_count = min(max_pages, math.ceil(total_results / SEARCH_PAGE_SIZE))
+            search_pages = [first_page]
+
+            if page_count > 1:
+                max_workers = max(1, min(self.config.omdb_max_workers, page_count - 1))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    search_pages.extend(
+                        executor.map(
+                            lambda page: self._request_search_page(parameters, page),
+                            range(2, page_count + 1),
+                        )
+                    )
+
+        # Titel können auf mehreren Seiten auftauchen, wenn sich die Trefferliste
+        # während der Abfrage verschiebt
+        imdb_ids = dict.fromkeys(
+            result.get("imdbID", "")
+            for search_page in search_pages
+            for result in search_page.get("Search", [])
+            if isinstance(result, dict) and is_imdb_id(result.get("imdbID", ""))
+        )
+        return list(imdb_ids)
+
+    def split_cached_imdb_ids(self, imdb_ids: List[str]) -> Tuple[List[str], List[str]]:
+        """
+        Teilt eine Liste von imdbIDs in bereits gecachte und noch fehlende Filme auf.
+        Es wird keine Anfrage gesendet und keine Revalidierung angestoßen.
+        :param imdb_ids: Liste an imdbIDs.
+        :return: Tuple aus den gecachten und den fehlenden imdbIDs
+        """
+        cached_ids, missing_ids = [], []
+
+        for imdb_id in imdb_ids:
+            if imdb_id in self.movie_data_cache:
+                cached_ids.append(imdb_id)
+            else:
+                missing_ids.append(imdb_id)
+
+        return cached_ids, missing_ids
+
+    def search_movie_list(
+        self,
+        search_term: str,
+        media_type: str | None = None,
+        year: str | int | None = None,
+        max_pages: int | None = None,
+    ) -> List[str]:
+        """
+        Erstellt aus einer OMDb-Suche eine Filmliste für iter_movie_info_chunks.
+        Die gecachten Filme stehen am Anfang der Liste, damit sie sofort angezeigt
+        werden; nur die fehlenden Filme werden danach einzeln über "i=" angefragt.
+        :param search_term: Suchbegriff, z.B. "Star Wars".
+        :param media_type: Optionaler Typ: "movie", "series" oder "episode".
+        :param year: Optionales Erscheinungsjahr.
+        :param max_pages: Maximale Anzahl abgefragter Seiten (siehe search_imdb_ids).
+        :return: Liste an imdbIDs
+        """
+        imdb_ids = self.search_imdb_ids(
+            search_term, media_type=media_type, year=year, max_pages=max_pages
+        )
+        cached_ids, missing_ids = self.split_cached_imdb_ids(imdb_ids)
+
+        METRICS.increment("omdb_search_results_total", len(cached_ids), cache="hit")
+        METRICS.increment("omdb_search_results_total", len(missing_ids), cache="miss")
+        print(
+            f"OMDb search for {search_term}: {len(imdb_ids)} titles, "
+            f"{len(cached_ids)} cached, {len(missing_ids)} to fetch"
+        )
+        return cached_ids + missing_ids
+
+    def get_movie_info_from_search(
+        self,
+        search_term: str,
+        media_type: str | None = None,
+        year: str | int | None = None,
+        max_pages: int | None = None,
+    ) -> List[dict]:
+        """
+        Holt die vollständigen Filmdaten aller Treffer einer OMDb-Suche
+        (siehe search_movie_list und get_movie_info_from_list).
+        :param search_term: Suchbegriff, z.B. "Star Wars".
+        :param media_type: Optionaler Typ: "movie", "series" oder "episode".
+        :param year: Optionales Erscheinungsjahr.
+        :param max_pages: Maximale Anzahl abgefragter Seiten (siehe search_imdb_ids).
+        :return: Eine Liste mit einem Dictionary an Filmdaten je Film
+        """
+        return self.get_movie_info_from_list(
+            self.search_movie_list(
+                search_term, media_type=media_type, year=year, max_pages=max_pages
+            )
+        )
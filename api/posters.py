@@ -0,0 +1,347 @@
+import base64
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Set, Tuple
+
+import requests
+from PIL import Image
+
+from metrics import METRICS
+
+# Größen der Vorschaubilder (Breite, Höhe) in Pixeln, das Seitenverhältnis bleibt erhalten
+POSTER_SIZES: Dict[str, Tuple[int, int]] = {
+    "table": (60, 90),
+    "detail": (300, 450),
+}
+THUMBNAIL_FORMAT = "WEBP"
+THUMBNAIL_MIME_TYPE = "image/webp"
+
+
+class PosterCache:
+    """
+    Lädt die Poster der Filme einmal herunter und speichert verkleinerte Vorschaubilder
+    auf der Festplatte. Das Dashboard zeigt danach nur noch lokale Daten an, statt bei
+    jedem Rerun die großen Originalbilder von Amazon einzubinden.
+
+    Die Vorschaubilder werden inhaltsadressiert abgelegt: der Dateiname ist der
+    SHA-256 der Originaldatei, gleiche Poster unter verschiedenen URLs werden nur
+    einmal gespeichert. Die Zuordnung URL -> Hash liegt in index.json.
+    Überschreitet der Cache die maximale Größe, werden die am längsten nicht
+    verwendeten Bilder gelöscht.
+    """
+
+    def __init__(
+        self,
+        cache_path: Path,
+        max_bytes: int,
+        max_workers: int = 8,
+        timeout: float = 10,
+        failure_ttl: float = 600,
+    ):
+        """
+        Konstruktor für die PosterCache-Klasse.
+        :param cache_path: Ordner für die Vorschaubilder.
+        :param max_bytes: Maximale Gesamtgröße der Vorschaubilder in Bytes.
+        :param max_workers: Maximale Anzahl gleichzeitiger Downloads.
+        :param timeout: Timeout eines Downloads in Sekunden.
+        :param failure_ttl: Sekunden, bevor ein fehlgeschlagener Download erneut versucht wird.
+        """
+        self.cache_path = cache_path
+        self.cache_path.mkdir(parents=True, exist_ok=True)
+        self.index_path = cache_path.joinpath("index.json")
+
+        self.max_bytes = max_bytes
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        self.failure_ttl = failure_ttl
+
+        self._lock = threading.Lock()
+        self._session = requests.Session()
+        self._index: Dict[str, str] = self._load_index()
+        # Fehlgeschlagene Downloads (URL -> Zeitpunkt), damit ein nicht erreichbarer
+        # Server nicht bei jedem Rerun erneut auf den Timeout wartet
+        self._failed: Dict[str, float] = {}
+        # Hashes, deren Vorschaubilder bereits geprüft wurden, und bereits
+        # kodierte Data-URLs je (Hash, Größe). Beide werden bei evict bereinigt.
+        self._cached_digests: Set[str] = set()
+        self._data_urls: Dict[Tuple[str, str], str] = {}
+
+    def _load_index(self) -> Dict[str, str]:
+        if self.index_path.exists():
+            try:
+                with open(self.index_path, "r") as file:
+                    return json.load(file)
+            except (OSError, json.JSONDecodeError):
+                pass
+        return {}
+
+    def _save_index(self) -> None:
+        """
+        Schreibt den Index atomar, ein Abbruch hinterlässt keine halbe Datei.
+        Alle Sessions teilen sich einen PosterCache, die temporäre Datei wird
+        daher unter dem Lock geschrieben und ersetzt.
+        """
+        with self._lock:
+            temporary_path = self.index_path.with_suffix(".json.tmp")
+            with open(temporary_path, "w") as file:
+                json.dump(self._index, file)
+            os.replace(temporary_path, self.index_path)
+
+    def _thumbnail_path(self, digest: str, size_name: str) -> Path:
+        return self.cache_path.joinpath(
+            digest[:2], f"{digest}-{size_name}.{THUMBNAIL_FORMAT.lower()}"
+        )
+
+    def _is_cached(self, digest: str | None) -> bool:
+        if digest is None:
+            return False
+        if digest in self._cached_digests:
+            return True
+
+        if all(
+            self._thumbnail_path(digest, size_name).exists()
+            for size_name in POSTER_SIZES
+        ):
+            self._cached_digests.add(digest)
+            return True
+
+        return False
+
+    def _store_thumbnails(self, image_bytes: bytes) -> str:
+        """
+        Erstellt alle Vorschaubilder eines Posters und gibt den Hash des Originals zurück.
+        """
+        digest = hashlib.sha256(image_bytes).hexdigest()
+        if self._is_cached(digest):
+            return digest
+
+        with Image.open(io.BytesIO(image_bytes)) as image:
+            image = image.convert("RGB")
+
+            for size_name, size in POSTER_SIZES.items():
+                thumbnail = image.copy()
+                thumbnail.thumbnail(size)
+
+                thumbnail_path = self._thumbnail_path(digest, size_name)
+                thumbnail_path.parent.mkdir(exist_ok=True)
+                temporary_path = thumbnail_path.with_suffix(".tmp")
+                thumbnail.save(temporary_path, format=THUMBNAIL_FORMAT, quality=80)
+                os.replace(temporary_path, thumbnail_path)
+
+        return digest
+
+    def _fetch(self, url: str) -> str | None:
+        """
+        Liefert den Hash eines Posters und lädt es herunter, falls es noch nicht
+        im Cache liegt.
+        """
+        with self._lock:
+            digest = self._index.get(url)
+            failed_at = self._failed.get(url)
+
+        if self._is_cached(digest):
+            return digest
+
+        if failed_at is not None and time.time() - failed_at < self.failure_ttl:
+            return None
+
+        try:
+            with METRICS.span("poster_download"):
+                response = self._session.get(url, timeout=self.timeout)
+                response.raise_for_status()
+                digest = self._store_thumbnails(response.content)
+            METRICS.increment("poster_downloads_total", status="ok")
+
+        except (requests.RequestException, OSError) as error:
+            METRICS.increment("poster_downloads_total", status="error")
+            METRICS.increment("poster_errors_total", error=type(error).__name__)
+            with self._lock:
+                self._failed[url] = time.time()
+            return None
+
+        with self._lock:
+            self._index[url] = digest
+            self._failed.pop(url, None)
+
+        return digest
+
+    def _download_missing(
+        self, urls: Iterable[str]
+    ) -> Tuple[Dict[str, str | None], bool]:
+        """
+        Lädt alle noch fehlenden Poster parallel herunter, ohne den Cache zu verkleinern.
+        :return: Dictionary URL -> Hash und ob neue Poster heruntergeladen wurden
+        """
+        unique_urls = [
+            url
+            for url in dict.fromkeys(urls)
+            if isinstance(url, str) and url.startswith("http")
+        ]
+
+        with self._lock:
+            digests = {url: self._index.get(url) for url in unique_urls}
+
+        missing_urls = [
+            url for url, digest in digests.items() if not self._is_cached(digest)
+        ]
+        METRICS.increment(
+            "cache_requests_total",
+            len(digests) - len(missing_urls),
+            cache="poster",
+            result="hit",
+        )
+        METRICS.increment(
+            "cache_requests_total", len(missing_urls), cache="poster", result="miss"
+        )
+
+        if missing_urls:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(missing_urls))
+            ) as executor:
+                digests.update(
+                    zip(missing_urls, executor.map(self._fetch, missing_urls))
+                )
+
+            self._save_index()
+
+        return digests, bool(missing_urls)
+
+    def prefetch(self, urls: Iterable[str]) -> Dict[str, str | None]:
+        """
+        Lädt alle noch fehlenden Poster parallel herunter.
+        :param urls: Poster-URLs, "N/A" und leere Werte werden übersprungen.
+        :return: Dictionary URL -> Hash (None, wenn der Download fehlgeschlagen ist)
+        """
+        digests, downloaded = self._download_missing(urls)
+        if downloaded:
+            self.evict()
+
+        return digests
+
+    def thumbnail(self, url: str, size_name: str = "detail") -> bytes | None:
+        """
+        Liefert ein Vorschaubild als Bytes, z.B. für st.image.
+        :param url: Poster-URL aus den OMDb-Daten.
+        :param size_name: Name der Größe aus POSTER_SIZES.
+        :return: Bilddaten oder None, wenn das Poster nicht verfügbar ist
+        """
+        if not isinstance(url, str) or not url.startswith("http"):
+            return None
+
+        digests, downloaded = self._download_missing([url])
+        digest = digests.get(url)
+
+        image_bytes = None
+        if digest is not None:
+            thumbnail_path = self._thumbnail_path(digest, size_name)
+            try:
+                # Die Änderungszeit dient als Zeitpunkt der letzten Verwendung
+                os.utime(thumbnail_path)
+                image_bytes = thumbnail_path.read_bytes()
+            except OSError:
+                pass
+
+        # Erst nach dem Lesen verkleinern, damit das angefragte Poster nicht fehlt
+        if downloaded:
+            self.evict()
+
+        return image_bytes
+
+    def data_urls(
+        self, urls: Iterable[str], size_name: str = "table"
+    ) -> List[str | None]:
+        """
+        Wandelt Poster-URLs in Data-URLs mit den lokalen Vorschaubildern um, z.B. für
+        st.column_config.ImageColumn.
+        :param urls: Poster-URLs aus den OMDb-Daten.
+        :param size_name: Name der Größe aus POSTER_SIZES.
+        :return: Liste mit einer Data-URL (oder None) je Eingabe
+        """
+        urls = list(urls)
+        digests, downloaded = self._download_missing(urls)
+
+        result = []
+        for url in urls:
+            digest = digests.get(url)
+            if digest is None:
+                result.append(None)
+                continue
+
+            data_url = self._data_urls.get((digest, size_name))
+            if data_url is None:
+                thumbnail_path = self._thumbnail_path(digest, size_name)
+                try:
+                    os.utime(thumbnail_path)
+                    image_bytes = thumbnail_path.read_bytes()
+                except OSError:
+                    result.append(None)
+                    continue
+
+                data_url = f"data:{THUMBNAIL_MIME_TYPE};base64," + base64.b64encode(
+                    image_bytes
+                ).decode("ascii")
+                self._data_urls[(digest, size_name)] = data_url
+
+            result.append(data_url)
+
+        # Erst nach dem Kodieren verkleinern, damit angefragte Poster nicht fehlen
+        if downloaded:
+            self.evict()
+
+        return result
+
+    def evict(self) -> int:
+        """
+        Löscht die am längsten nicht verwendeten Vorschaubilder, bis der Cache wieder
+        unter der maximalen Größe liegt.
+        :return: Anzahl der gelöschten Poster
+        """
+        thumbnail_files = []
+        for path in self.cache_path.glob(f"*/*.{THUMBNAIL_FORMAT.lower()}"):
+            try:
+                file_stat = path.stat()
+            except OSError:
+                # Bereits von einer anderen Session gelöscht
+                continue
+            thumbnail_files.append((file_stat.st_mtime, file_stat.st_size, path))
+        total_bytes = sum(size for _, size, _ in thumbnail_files)
+
+        if total_bytes <= self.max_bytes:
+            return 0
+
+        # Alle Größen eines Posters werden gemeinsam gelöscht
+        last_used: Dict[str, float] = {}
+        poster_bytes: Dict[str, int] = {}
+        for modified_at, size, path in thumbnail_files:
+            digest = path.stem.rsplit("-", 1)[0]
+            last_used[digest] = max(last_used.get(digest, 0), modified_at)
+            poster_bytes[digest] = poster_bytes.get(digest, 0) + size
+
+        evicted_digests = set()
+        for digest in sorted(last_used, key=last_used.get):
+            if total_bytes <= self.max_bytes:
+                break
+
+            self._cached_digests.discard(digest)
+            for size_name in POSTER_SIZES:
+                self._thumbnail_path(digest, size_name).unlink(missing_ok=True)
+                self._data_urls.pop((digest, size_name), None)
+
+            total_bytes -= poster_bytes[digest]
+            evicted_digests.add(digest)
+
+        with self._lock:
+            self._index = {
+                url: digest
+                for url, digest in self._index.items()
+                if digest not in evicted_digests
+            }
+        self._save_index()
+
+        return len(evicted_digests)
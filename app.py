@@ -1,17 +1,29 @@
+import time
 import streamlit as st
 import extra_streamlit_components as stx
 import pandas as pd
 from config import Config
 from design.styler import DesignHandler
-from api.omdb import OmdbApiHandler
-from tabs.overview import initial_setup, create_overview_graphs
-from tabs.details import create_details
+from metrics import METRICS
+from process.dataset_store import list_movie_datasets
+from tabs.overview import (
+    initial_setup,
+    create_overview_graphs,
+    load_prepared_dataset,
+    get_session_dataset,
+    set_session_dataset,
+    show_load_job,
+)
+from tabs.debug import create_metrics_panel
 
 # Initialisierung von Klassen und Konfigurationen
 config = Config()
-api = OmdbApiHandler()
 designer = DesignHandler()
 
+# Optionaler Prometheus-Endpunkt, wird nur einmal pro Prozess gestartet
+if METRICS.enabled:
+    METRICS.start_http_server(config.metrics_port)
+
 # Anpassung der Streamlit-Seiteneinstellungen
 st.set_page_config(
     page_title="Film Analyse Dashboard", page_icon=":clapper:", layout="wide"
@@ -21,11 +33,12 @@ st.set_page_config(
 designer.add_custom_css()
 
 
-# Initialisierung von Session State Variablen
-if "movie_data_raw_df" not in st.session_state:
-    st.session_state["movie_data_raw_df"] = pd.DataFrame()
+# Initialisierung von Session State Variablen. Die Filmdaten selbst liegen in der
+# prozessweiten DatasetRegistry, die Session hält nur eine Lease darauf.
+if "dataset_lease" not in st.session_state:
+    st.session_state["dataset_lease"] = None
+    st.session_state["load_job_key"] = None
     st.session_state["input_movie_titles"] = ""
-    st.session_state["cleaned"] = False
     st.session_state["active_tab"] = "Overview"
 
 # Seitenlayout und Inhalte
@@ -42,6 +55,27 @@ movie_titles = st.sidebar.text_area(
 st.sidebar.subheader("ODER")
 movie_file_upload = st.sidebar.file_uploader("Laden Sie eine IMDB Liste hoch")
 
+# Alle Treffer einer OMDb-Suche laden, z.B. "Star Wars" oder alle Titel eines Jahres
+st.sidebar.subheader("ODER")
+search_term = st.sidebar.text_input("OMDb durchsuchen", placeholder="z.B. Star Wars")
+col_search_type, col_search_year = st.sidebar.columns(2)
+search_type = col_search_type.selectbox(
+    "Typ", ["movie", "series", "episode", "alle"], disabled=not search_term
+)
+search_year = col_search_year.text_input("Jahr", disabled=not search_term)
+
+# Mit ingest.py vorbereitete Datensätze können direkt geöffnet werden
+prepared_datasets = {
+    path.name: path for path in list_movie_datasets(config.dataset_path)
+}
+selected_dataset = None
+if prepared_datasets:
+    st.sidebar.subheader("ODER")
+    selected_dataset_name = st.sidebar.selectbox(
+        "Vorbereiteten Datensatz öffnen", ["-"] + list(prepared_datasets)
+    )
+    selected_dataset = prepared_datasets.get(selected_dataset_name)
+
 start_analysis = st.sidebar.button("Analyse Starten")
 
 # Navigation
@@ -53,26 +87,46 @@ chosen_id = stx.tab_bar(
     default=1,
 )
 
-print(f"chosen_id : {chosen_id}")
-
 
 # Wenn der 'Analyse Starten'-Button gedrückt wird
 if start_analysis:
-    if not st.session_state["movie_data_raw_df"].empty:
-        st.session_state["movie_data_raw_df"] = pd.DataFrame()
+    st.session_state["load_job_key"] = None
+    if get_session_dataset() is not None:
+        set_session_dataset(pd.DataFrame())
 
-        with st.spinner("Data loading..."):
-            initial_setup(movie_titles, api, movie_file_upload)
+    if selected_dataset is not None:
+        load_prepared_dataset(selected_dataset)
 
     else:
-        with st.spinner("Data loading..."):
-            initial_setup(movie_titles, api, movie_file_upload)
+        initial_setup(
+            movie_titles,
+            movie_file_upload,
+            search_term=search_term,
+            search_type=None if search_type == "alle" else search_type,
+            search_year=search_year.strip() if search_year.strip().isdigit() else None,
+        )
+
+# Fortschritt des Lade-Jobs der Session, der Job selbst läuft im Hintergrund
+load_job_running = show_load_job()
 
 # Wenn der Tab "Overview" gedrückt wurde
 if chosen_id == str(1):
-    if not st.session_state["movie_data_raw_df"].empty:
+    if get_session_dataset() is not None:
         create_overview_graphs()
 
 # Wenn der Tab "Detail" gedrückt wurde
 else:
+    # Der Detail-Tab lädt wordcloud, matplotlib und scipy, die Module werden
+    # erst beim ersten Öffnen des Tabs importiert
+    from tabs.details import create_details
+
     create_details()
+
+# Gesammelte Messwerte des Prozesses (nur mit METRICS_ENABLED=1)
+create_metrics_panel()
+
+# Solange der Lade-Job läuft, wird die Seite regelmäßig neu aufgebaut. Zwischen
+# den Abfragen bleibt die App bedienbar, z.B. für einen Wechsel des Tabs.
+if load_job_running:
+    time.sleep(config.load_job_poll_interval)
+    st.rerun()
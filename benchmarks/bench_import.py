@@ -0,0 +1,188 @@
+"""
+Benchmark und Regressionstest für den Kaltstart der App.
+
+Die Module, die app.py beim Start importiert, werden in einem neuen Interpreter
+mit `python -X importtime` geladen. Gemessen wird die Importzeit, die die
+Module des Projekts zusätzlich zu streamlit und den übrigen Startmodulen
+verursachen. Geprüft wird, dass diese Zeit im Budget bleibt und keines der
+schweren Module (plotly.express, wordcloud, matplotlib, scipy, statsmodels,
+pyphoton) schon beim Start geladen wird. Zum Vergleich wird der erste Lauf
+des Skripts über streamlit.testing gemessen. Schlägt eine Prüfung fehl, endet
+das Skript mit Exit-Code 1.
+
+Ausführen aus dem Projektordner:
+    python -m benchmarks.bench_import
+    python -m benchmarks.bench_import --budget-ms 80 --runs 7
+"""
+
+import argparse
+import ast
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+PROJECT_PATH = Path(__file__).resolve().parent.parent
+APP_PATH = PROJECT_PATH.joinpath("app.py")
+
+# Pakete des Projekts, alle anderen Importe zählen zur Grundlast
+PROJECT_PACKAGES = {"api", "config", "design", "metrics", "process", "tabs"}
+# Module, die erst beim ersten Gebrauch geladen werden dürfen
+DEFERRED_MODULES = [
+    "plotly.express",
+    "wordcloud",
+    "matplotlib",
+    "scipy",
+    "statsmodels",
+    "pyphoton",
+]
+# Erlaubte zusätzliche Importzeit der Projektmodule in Millisekunden
+BUDGET_MS = 150
+
+
+def startup_modules(app_path: Path = APP_PATH) -> List[str]:
+    """
+    Liest die Module, die app.py auf oberster Ebene importiert. Importe in
+    Funktionen oder Verzweigungen werden erst bei Bedarf ausgeführt und
+    zählen nicht zum Start.
+    """
+    modules = []
+
+    for node in ast.parse(app_path.read_text()).body:
+        if isinstance(node, ast.Import):
+            modules.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            modules.append(node.module)
+
+    return list(dict.fromkeys(modules))
+
+
+def measure_imports(modules: List[str]) -> Dict[str, Tuple[int, int]]:
+    """
+    Importiert die Module in einem neuen Interpreter mit -X importtime.
+    :return: Dictionary mit Modulname und Tuple aus eigener und kumulierter
+             Importzeit in Mikrosekunden
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import " + ", ".join(modules)],
+        cwd=PROJECT_PATH,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    import_times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+
+        self_time, cumulative_time, module_name = line[12:].split("|")
+        if not self_time.strip().isdigit():
+            # Kopfzeile "self [us] | cumulative | imported package"
+            continue
+
+        import_times[module_name.strip()] = (
+            int(self_time),
+            int(cumulative_time),
+        )
+
+    return import_times
+
+
+def measure_first_run() -> float:
+    """
+    Misst den ersten Lauf von app.py in einem neuen Interpreter, inklusive
+    aller Importe und der Initialisierung bis zur fertigen Seite.
+    :return: Dauer in Sekunden
+    """
+    script = (
+        "import time; start = time.perf_counter()\n"
+        "from streamlit.testing.v1 import AppTest\n"
+        f"app_test = AppTest.from_file({str(APP_PATH)!r}, default_timeout=120).run()\n"
+        "assert not app_test.exception, [e.value for e in app_test.exception]\n"
+        "print(time.perf_counter() - start)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=PROJECT_PATH,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def is_project_module(module_name: str) -> bool:
+    return module_name.split(".")[0] in PROJECT_PACKAGES
+
+
+def run_benchmark(budget_ms: float, runs: int) -> bool:
+    modules = startup_modules()
+    third_party_modules = [
+        module for module in modules if not is_project_module(module)
+    ]
+
+    overhead_runs = []
+    for _ in range(runs):
+        baseline_modules = set(measure_imports(third_party_modules))
+        import_times = measure_imports(modules)
+
+        # Alles, was erst durch die Projektmodule geladen wird, zählt zum Projekt
+        overhead_runs.append(
+            sum(
+                self_time
+                for module_name, (self_time, _) in import_times.items()
+                if module_name not in baseline_modules
+            )
+            / 1000
+        )
+
+    overhead_ms = statistics.median(overhead_runs)
+    total_ms = sum(self_time for self_time, _ in import_times.values()) / 1000
+    first_run = measure_first_run()
+
+    print(f"Startmodule: {', '.join(modules)}")
+    print()
+    print(f"{'Module des Projekts':<40} {'eigen ms':>10} {'kumuliert ms':>14}")
+    for module_name, (self_time, cumulative_time) in sorted(
+        import_times.items(), key=lambda item: -item[1][1]
+    ):
+        if is_project_module(module_name):
+            print(
+                f"{module_name:<40} {self_time / 1000:>10.1f} "
+                f"{cumulative_time / 1000:>14.1f}"
+            )
+
+    print()
+    print(f"{'Importzeit gesamt':<40} {total_ms:>10.1f} ms")
+    print(f"{'davon durch das Projekt (Median)':<40} {overhead_ms:>10.1f} ms")
+    print(f"{'Erster Lauf von app.py':<40} {first_run * 1000:>10.1f} ms")
+
+    checks = {
+        f"Importzeit des Projekts unter {budget_ms:g} ms": overhead_ms <= budget_ms
+    }
+    for module_name in DEFERRED_MODULES:
+        checks[f"{module_name} wird nicht beim Start geladen"] = (
+            module_name not in import_times
+        )
+
+    for check_name, passed in checks.items():
+        print(f"{'OK  ' if passed else 'FEHLER'} {check_name}")
+
+    return all(checks.values())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--budget-ms", type=float, default=BUDGET_MS)
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=5,
+        help="Anzahl der Messungen, gewertet wird der Median",
+    )
+    arguments = parser.parse_args()
+
+    if not run_benchmark(arguments.budget_ms, arguments.runs):
+        sys.exit(1)
@@ -0,0 +1,179 @@
+"""
+Benchmark und Regressionstest für das Einlesen großer Filmlisten.
+
+Erstellt einen synthetischen IMDb-Export mit allen Spalten eines echten Exports
+und vielen doppelten Einträgen. Verglichen werden das frühere Einlesen der ganzen
+Datei mit pd.read_csv und das blockweise Lesen über iter_movie_list_chunks.
+Beide laufen in einem eigenen Interpreter, gemessen werden Dauer und Zuwachs des
+Spitzen-RSS gegenüber dem Stand nach den Importen. Geprüft wird, dass beide
+dieselbe Liste liefern und der Speicherbedarf des blockweisen Lesens nicht mit
+der Dateigröße wächst. Schlägt eine Prüfung fehl, endet das Skript mit Exit-Code 1.
+
+Ausführen aus dem Projektordner:
+    python -m benchmarks.bench_movie_list
+    python -m benchmarks.bench_movie_list --rows 2000000 --unique 500000
+"""
+
+import argparse
+import csv
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+PROJECT_PATH = Path(__file__).resolve().parent.parent
+
+# Spalten eines IMDb-Listen-Exports
+EXPORT_COLUMNS = [
+    "Position",
+    "Const",
+    "Created",
+    "Modified",
+    "Description",
+    "Title",
+    "URL",
+    "Title Type",
+    "IMDb Rating",
+    "Runtime (mins)",
+    "Year",
+    "Genres",
+    "Num Votes",
+    "Release Date",
+    "Directors",
+]
+# Erlaubter Zuwachs des Spitzen-RSS beim blockweisen Lesen der kleinen und der
+# großen Datei in MB. Gewachsen sein dürfen nur die Menge der bekannten Einträge
+# und die Ergebnisliste.
+MAX_STREAMING_GROWTH_MB = 64
+
+# Wird in einem neuen Interpreter ausgeführt, damit sich die Messungen nicht
+# gegenseitig beeinflussen
+MEASURE_SCRIPT = """
+import json, resource, sys, time
+import pandas as pd
+from process.movie_list import iter_movie_list_chunks
+
+def read_full(path):
+    movie_df = pd.read_csv(path)
+    return list(dict.fromkeys(movie_df["Const"].dropna().tolist()))
+
+def read_streaming(path):
+    return [key for chunk in iter_movie_list_chunks(path, path) for key in chunk]
+
+import pyarrow.csv
+reader, path = sys.argv[1], sys.argv[2]
+baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+movie_list = read_full(path) if reader == "full" else read_streaming(path)
+duration = time.perf_counter() - start
+peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({
+    "seconds": duration,
+    "growth_mb": (peak_kb - baseline_kb) / 1024,
+    "count": len(movie_list),
+    "head": movie_list[:5],
+    "tail": movie_list[-5:],
+}))
+"""
+
+
+def write_export(csv_path: Path, row_count: int, unique_count: int) -> None:
+    """
+    Schreibt einen IMDb-Export, in dem sich die Filme nach `unique_count`
+    Zeilen wiederholen.
+    """
+    with open(csv_path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(EXPORT_COLUMNS)
+
+        for index in range(row_count):
+            movie_index = index % unique_count
+            writer.writerow(
+                [
+                    index + 1,
+                    f"tt{movie_index:07d}",
+                    "2023-01-01",
+                    "2023-01-02",
+                    "Eine längere Beschreibung, wie sie in Listen-Exporten vorkommt",
+                    f"Movie {movie_index}",
+                    f"https://www.imdb.com/title/tt{movie_index:07d}/",
+                    "Movie",
+                    7.1,
+                    118,
+                    1950 + movie_index % 70,
+                    "Action, Adventure, Drama",
+                    123456,
+                    "2021-10-22",
+                    "Jane Doe",
+                ]
+            )
+
+
+def measure(reader: str, csv_path: Path) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", MEASURE_SCRIPT, reader, str(csv_path)],
+        cwd=PROJECT_PATH,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout)
+
+
+def run_benchmark(row_count: int, unique_count: int) -> bool:
+    results = {}
+    checks = {}
+
+    with tempfile.TemporaryDirectory() as temporary_folder:
+        small_path = Path(temporary_folder, "small.csv")
+        large_path = Path(temporary_folder, "large.csv")
+        # Die kleine Datei ist größer als das, was der Reader vorausliest
+        small_rows = max(1, row_count // 4)
+        write_export(small_path, small_rows, unique_count)
+        write_export(large_path, row_count, unique_count)
+        file_size_mb = large_path.stat().st_size / 1024**2
+
+        for reader in ("full", "streaming"):
+            results[reader, "small"] = measure(reader, small_path)
+            results[reader, "large"] = measure(reader, large_path)
+
+    print(
+        f"IMDb-Export: {row_count} Zeilen, {unique_count} Filme, {file_size_mb:.0f} MB"
+    )
+    print(f"{'':<26} {'Zeilen':>10} {'Dauer s':>10} {'RSS-Zuwachs MB':>16}")
+    for (reader, size), result in results.items():
+        rows = small_rows if size == "small" else row_count
+        print(
+            f"{reader + ' / ' + size:<26} {rows:>10} {result['seconds']:>10.2f} "
+            f"{result['growth_mb']:>16.1f}"
+        )
+
+    full, streaming = results["full", "large"], results["streaming", "large"]
+    checks["beide Verfahren liefern dieselbe Liste"] = (
+        full["count"] == streaming["count"] == min(row_count, unique_count)
+        and full["head"] == streaming["head"]
+        and full["tail"] == streaming["tail"]
+    )
+    growth = streaming["growth_mb"] - results["streaming", "small"]["growth_mb"]
+    checks[
+        f"blockweises Lesen wächst um weniger als {MAX_STREAMING_GROWTH_MB} MB "
+        f"({growth:.1f} MB)"
+    ] = (growth < MAX_STREAMING_GROWTH_MB)
+
+    for check_name, passed in checks.items():
+        print(f"{'OK  ' if passed else 'FEHLER'} {check_name}")
+
+    return all(checks.values())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument(
+        "--unique", type=int, default=100_000, help="Anzahl verschiedener Filme"
+    )
+    arguments = parser.parse_args()
+
+    if not run_benchmark(arguments.rows, arguments.unique):
+        sys.exit(1)
@@ -0,0 +1,168 @@
+"""
+Benchmark und Regressionstest für das parallele Laden einer Filmliste.
+
+Ein HTTP-Server im selben Prozess ersetzt die OMDb API und beantwortet jede
+Anfrage mit einer festen Verzögerung. Dieselbe Liste wird einmal seriell
+(OMDB_MAX_WORKERS=1) und einmal mit `--workers` parallelen Anfragen über
+OmdbApiHandler.get_movie_info_from_list geladen, jeweils mit einem leeren Cache.
+Geprüft wird, dass beide Läufe die Filme in der Reihenfolge der Eingabe liefern,
+ein nicht gefundener und ein fehlerhafter Titel übersprungen werden, ohne das
+Laden abzubrechen, und der parallele Lauf mindestens um `--min-speedup`
+schneller ist. Schlägt eine Prüfung fehl, endet das Skript mit Exit-Code 1.
+
+Ausführen aus dem Projektordner:
+    python -m benchmarks.bench_omdb_concurrency
+    python -m benchmarks.bench_omdb_concurrency --titles 200 --workers 16
+"""
+
+import argparse
+import io
+import json
+import sys
+import tempfile
+import threading
+import time
+from contextlib import redirect_stdout
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import List
+from urllib.parse import parse_qs, urlparse
+
+from api.omdb import OmdbApiHandler
+from config import Config
+
+REQUEST_DELAY = 0.05
+# Titel, die die API nicht findet bzw. bei denen sie mit einem Fehler antwortet
+MISSING_TITLE = "Missing Movie"
+BROKEN_TITLE = "Broken Movie"
+# Mindestens erwartete Beschleunigung gegenüber dem seriellen Laden
+MIN_SPEEDUP = 3.0
+
+
+class OmdbRequestHandler(BaseHTTPRequestHandler):
+    # Keep-Alive, damit der Verbindungspool des OmdbApiHandler genutzt wird
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    request_count = 0
+    lock = threading.Lock()
+
+    def do_GET(self) -> None:
+        with self.lock:
+            OmdbRequestHandler.request_count += 1
+
+        time.sleep(REQUEST_DELAY)
+        query = {
+            key: values[0]
+            for key, values in parse_qs(urlparse(self.path).query).items()
+        }
+        title = query.get("t", "")
+
+        status = 200
+        if title == BROKEN_TITLE:
+            status, body = 500, {"Response": "False", "Error": "Internal error"}
+        elif title.startswith("Movie "):
+            index = int(title.split(" ")[1])
+            body = {
+                "Title": title,
+                "Year": "2000",
+                "imdbID": f"tt{index:07d}",
+                "Response": "True",
+            }
+        else:
+            body = {"Response": "False", "Error": "Movie not found!"}
+
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+def load_movies(api_url: str, titles: List[str], max_workers: int) -> tuple:
+    """
+    Lädt die Liste mit einem neuen OmdbApiHandler und leerem Cache.
+    :return: Tuple aus den geladenen Titeln und der Dauer in Sekunden
+    """
+    with tempfile.TemporaryDirectory() as temporary_folder:
+        temporary_path = Path(temporary_folder)
+        temporary_path.joinpath("api").mkdir()
+        api = OmdbApiHandler(
+            Config(
+                project_path=temporary_path,
+                api_url=api_url,
+                api_key="benchmark",
+                omdb_max_workers=max_workers,
+                omdb_rate_limit=0,
+                # Der fehlerhafte Titel soll weder wiederholt werden noch den
+                # Circuit Breaker öffnen
+                omdb_max_retries=0,
+                omdb_breaker_threshold=0,
+            )
+        )
+
+        with redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            movie_info_list = api.get_movie_info_from_list(titles)
+            duration = time.perf_counter() - start
+
+    return [movie["Title"] for movie in movie_info_list], duration
+
+
+def run_benchmark(title_count: int, max_workers: int, min_speedup: float) -> bool:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), OmdbRequestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    api_url = f"http://127.0.0.1:{server.server_port}/"
+
+    # Die fehlenden und fehlerhaften Titel stehen mitten in der Liste
+    titles = [f"Movie {index}" for index in range(title_count)]
+    titles[title_count // 3 : title_count // 3] = [MISSING_TITLE]
+    titles[title_count // 2 : title_count // 2] = [BROKEN_TITLE]
+    expected_titles = [f"Movie {index}" for index in range(title_count)]
+
+    serial_titles, serial_duration = load_movies(api_url, titles, max_workers=1)
+    serial_requests = OmdbRequestHandler.request_count
+    parallel_titles, parallel_duration = load_movies(
+        api_url, titles, max_workers=max_workers
+    )
+    parallel_requests = OmdbRequestHandler.request_count - serial_requests
+    server.shutdown()
+
+    speedup = serial_duration / parallel_duration
+    checks = {
+        "serieller Lauf in der Reihenfolge der Eingabe": (
+            serial_titles == expected_titles
+        ),
+        "paralleler Lauf in der Reihenfolge der Eingabe": (
+            parallel_titles == expected_titles
+        ),
+        "fehlende und fehlerhafte Titel übersprungen, je eine Anfrage": (
+            serial_requests == parallel_requests == len(titles)
+        ),
+        f"mindestens {min_speedup:g}x schneller als seriell ({speedup:.1f}x)": (
+            speedup >= min_speedup
+        ),
+    }
+
+    print(f"{len(titles)} Titel, {REQUEST_DELAY * 1000:.0f} ms je Anfrage")
+    print(f"{'Seriell (1 Worker)':<36} {serial_duration:>8.2f} s")
+    print(f"{f'Parallel ({max_workers} Worker)':<36} {parallel_duration:>8.2f} s")
+    for check_name, passed in checks.items():
+        print(f"{'OK  ' if passed else 'FEHLER'} {check_name}")
+
+    return all(checks.values())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--titles", type=int, default=80)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--min-speedup", type=float, default=MIN_SPEEDUP)
+    arguments = parser.parse_args()
+
+    if not run_benchmark(arguments.titles, arguments.workers, arguments.min_speedup):
+        sys.exit(1)
@@ -0,0 +1,381 @@
+"""
+Benchmark der gesamten Verarbeitung von der Filmliste bis zu den Grafiken des
+Overview-Tabs, mit synthetischen Katalogen von 100, 10.000 und 1.000.000 Filmen.
+
+Die OMDb API und die Photon API werden durch lokale HTTP-Server im selben Prozess
+ersetzt, es werden keine echten Anfragen gesendet und keine Caches im Projektordner
+verändert. Je Stufe werden die Laufzeit, der Durchsatz (Zeilen pro Sekunde) und der
+zusätzliche Spitzenverbrauch an Speicher ausgegeben:
+
+    omdb_fetch             OmdbApiHandler.get_movie_info_from_list, leerer Cache
+    omdb_fetch_cached      derselbe Aufruf, alle Filme im Cache
+    process_ratings_list   blockweise mit je einem DataFrame pro Block, wie beim
+                           Laden in der App
+    concat                 Zusammenfügen der Blöcke
+    explode_column         DataProcessor.explode_column auf den mehrwertigen Spalten
+    clean_int_values       DataProcessor.clean_int_values
+    normalize_movie_data   DataProcessor.normalize_movie_data
+    overview_aggregates    compute_overview_aggregates inklusive der Kennzahlen je Land
+    geo_map_data           create_geo_map_data für die Kennzahlen je Land
+                           (Photon-Stub)
+    charts                 alle Figures des Overview-Tabs ohne Streamlit
+
+Beim Speicher wird der höchste Resident Set Size (RSS) des Prozesses während der
+Stufe ausgegeben ("Peak MB") sowie dessen Zuwachs gegenüber dem Beginn der Stufe
+("Zuwachs MB"). Ein Hintergrund-Thread liest den RSS alle paar Millisekunden aus
+/proc/self/statm. Der Zuwachs zeigt nur Speicher, der neu vom Betriebssystem
+angefordert wurde, bereits freigegebener Speicher früherer Stufen wird
+wiederverwendet. tracemalloc wäre genauer, verdoppelt bei 1.000.000 Filmen aber den
+Speicherbedarf und verfälscht die Zeiten. Ohne /proc (z.B. unter Windows) wird nur
+die Zeit gemessen.
+
+Über den OMDb-Stub werden nur Kataloge bis --api-rows Filme geladen, größere
+Kataloge werden direkt erzeugt.
+
+Ausführen aus dem Projektordner:
+    python -m benchmarks.bench_pipeline
+    python -m benchmarks.bench_pipeline --sizes 100 10000
+"""
+
+import argparse
+import io
+import json
+import tempfile
+import threading
+import os
+import time
+from contextlib import contextmanager, redirect_stdout
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Iterator, List
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+from pyphoton import Photon
+
+from api.omdb import OmdbApiHandler
+from config import Config
+from process.aggregates import compute_overview_aggregates
+from process.countries import COUNTRY_CENTROIDS
+from process.processor import MULTI_VALUE_COLUMNS, DataProcessor
+from tabs import charts
+from tabs import overview
+
+GENRES = ["Drama", "Comedy", "Action", "Horror", "Sci-Fi", "Romance", "Thriller"]
+RATED = ["G", "PG", "PG-13", "R", "N/A"]
+# Bekannte Länder kommen aus der Offline-Tabelle, die erfundenen Namen werden
+# beim Photon-Stub angefragt
+COUNTRIES = list(COUNTRY_CENTROIDS)[:60] + [f"Freedonia {index}" for index in range(20)]
+PLOT_WORDS = [f"word{index}" for index in range(5_000)]
+CHUNK_SIZE = 10_000
+
+
+def create_omdb_record(index: int) -> dict:
+    """
+    Erstellt einen Film in der Form einer OMDb-Antwort. Alle Werte sind wie bei der
+    API Texte, die Werte werden aus dem Index abgeleitet und sind daher reproduzierbar.
+    """
+    genre_count = 1 + index % 3
+    ratings = [
+        {"Source": "Internet Movie Database", "Value": f"{1 + index * 7 % 90 / 10}/10"}
+    ]
+    if index % 3:
+        ratings.append({"Source": "Rotten Tomatoes", "Value": f"{index * 13 % 101}%"})
+    if index % 4:
+        ratings.append({"Source": "Metacritic", "Value": f"{index * 17 % 101}/100"})
+
+    return {
+        "Title": f"Movie {index}",
+        "Year": str(1950 + index % 74),
+        "Rated": RATED[index % len(RATED)],
+        "Released": f"{1 + index % 28:02d} Oct {1950 + index % 74}",
+        "Runtime": f"{80 + index % 90} min",
+        "Genre": ", ".join(
+            GENRES[(index + offset) % len(GENRES)] for offset in range(genre_count)
+        ),
+        "Director": f"Director {index % 5_000}",
+        "Writer": f"Writer {index % 7_000}, Writer {(index * 3) % 7_000}",
+        "Actors": ", ".join(
+            f"Actor {(index * 31 + offset) % 50_000}" for offset in range(3)
+        ),
+        "Plot": " ".join(
+            PLOT_WORDS[(index * 101 + offset * 37) % len(PLOT_WORDS)]
+            for offset in range(25)
+        ),
+        "Language": "English" if index % 5 else "English, French",
+        "Country": ", ".join(
+            COUNTRIES[(index * 7 + offset) % len(COUNTRIES)]
+            for offset in range(1 + index % 2)
+        ),
+        "Awards": "N/A",
+        "Poster": f"https://example.com/{index}.jpg",
+        "Ratings": ratings,
+        "Metascore": str(index * 17 % 101) if index % 4 else "N/A",
+        "imdbRating": f"{1 + index * 7 % 90 / 10:.1f}" if index % 50 else "N/A",
+        "imdbVotes": f"{index * 37 % 2_000_000:,}",
+        "imdbID": f"tt{index:07d}",
+        "Type": "movie",
+        "BoxOffice": f"${index * 7_919 % 900_000_000:,}" if index % 3 else "N/A",
+        "Response": "True",
+    }
+
+
+def iter_omdb_records(record_count: int) -> Iterator[List[dict]]:
+    """Liefert die synthetischen Filme in Blöcken von CHUNK_SIZE."""
+    for start in range(0, record_count, CHUNK_SIZE):
+        yield [
+            create_omdb_record(index)
+            for index in range(start, min(start + CHUNK_SIZE, record_count))
+        ]
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    """
+    Ersetzt die OMDb API (/?t=Movie 12 bzw. /?i=tt0000012) und die Photon API
+    (/api/?q=Freedonia 3) durch synthetische Antworten.
+    """
+
+    # Keep-Alive, damit der Verbindungspool des OmdbApiHandler genutzt wird. Ohne
+    # TCP_NODELAY wartet jede Antwort auf das verzögerte ACK des Clients (~40 ms).
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+
+        if url.path.startswith("/api"):
+            name = query.get("q", "")
+            body = {
+                "features": [
+                    {
+                        "geometry": {
+                            "coordinates": [
+                                hash(name) % 360 - 180,
+                                hash(name) % 180 - 90,
+                            ]
+                        },
+                        "properties": {"name": name, "type": "country"},
+                    }
+                ]
+            }
+        elif query.get("t", "").startswith("Movie "):
+            body = create_omdb_record(int(query["t"].split(" ")[1]))
+        elif query.get("i", "").startswith("tt"):
+            body = create_omdb_record(int(query["i"][2:]))
+        else:
+            body = {"Response": "False", "Error": "Movie not found!"}
+
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+def read_rss() -> int | None:
+    """Liefert den aktuellen RSS des Prozesses in Bytes oder None ohne /proc."""
+    try:
+        with open("/proc/self/statm", "r") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+class PeakMemorySampler:
+    """
+    Liest den RSS in einem Hintergrund-Thread und merkt sich das Maximum seit
+    dem letzten reset.
+    """
+
+    def __init__(self, interval: float = 0.002):
+        self.interval = interval
+        self.peak = read_rss() or 0
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+
+    def _sample(self) -> None:
+        while not self._stopped.wait(self.interval):
+            self.peak = max(self.peak, read_rss() or 0)
+
+    def reset(self) -> int:
+        """Setzt das Maximum auf den aktuellen RSS und gibt diesen zurück."""
+        self.peak = read_rss() or 0
+        return self.peak
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._thread.join()
+
+
+@dataclass
+class StageResult:
+    rows: int = 0
+    seconds: float = 0.0
+    peak_bytes: int | None = None
+    growth_bytes: int | None = None
+
+
+class StageRecorder:
+    """
+    Sammelt die Messwerte der Stufen. Eine Stufe kann mehrfach betreten werden
+    (z.B. einmal je Block), die Zeiten werden addiert, beim Speicher zählt das
+    höchste Maximum.
+    """
+
+    def __init__(self, sampler: PeakMemorySampler | None):
+        self.sampler = sampler
+        self.results: Dict[str, StageResult] = {}
+
+    @contextmanager
+    def stage(self, name: str, rows: int) -> Iterator[None]:
+        result = self.results.setdefault(name, StageResult())
+
+        if self.sampler is not None:
+            memory_before = self.sampler.reset()
+
+        start = time.perf_counter()
+        yield
+        result.seconds += time.perf_counter() - start
+        result.rows += rows
+
+        if self.sampler is not None:
+            # Einen letzten Wert lesen, falls die Stufe kürzer als das Intervall war
+            peak_bytes = max(self.sampler.peak, read_rss() or 0)
+            result.peak_bytes = max(result.peak_bytes or 0, peak_bytes)
+            result.growth_bytes = max(
+                result.growth_bytes or 0, peak_bytes - memory_before
+            )
+
+
+def run_pipeline(
+    record_count: int, stub_url: str, api_rows: int, recorder: StageRecorder
+) -> None:
+    """
+    Führt alle Stufen für einen Katalog mit `record_count` Filmen aus.
+    """
+    with tempfile.TemporaryDirectory() as temporary_folder:
+        temporary_path = Path(temporary_folder)
+        temporary_path.joinpath("api").mkdir()
+
+        if record_count <= api_rows:
+            api = OmdbApiHandler(
+                Config(
+                    project_path=temporary_path,
+                    api_url=stub_url,
+                    api_key="benchmark",
+                    omdb_rate_limit=0,
+                    movie_cache_backend="sqlite",
+                )
+            )
+            titles = [f"Movie {index}" for index in range(record_count)]
+
+            # Der Handler gibt jeden Titel aus, die Ausgabe wird verworfen
+            with redirect_stdout(io.StringIO()):
+                with recorder.stage("omdb_fetch", record_count):
+                    api.get_movie_info_from_list(titles)
+                with recorder.stage("omdb_fetch_cached", record_count):
+                    api.get_movie_info_from_list(titles)
+
+        movie_data_frames = []
+        for movie_data_chunk in iter_omdb_records(record_count):
+            with recorder.stage("process_ratings_list", len(movie_data_chunk)):
+                movie_data_frames.append(
+                    pd.DataFrame(DataProcessor.process_ratings_list(movie_data_chunk))
+                )
+            del movie_data_chunk
+
+        with recorder.stage("concat", record_count):
+            movie_data_df = pd.concat(movie_data_frames, ignore_index=True)
+        del movie_data_frames
+
+        exploded_input = movie_data_df.copy()
+        with recorder.stage("explode_column", record_count):
+            DataProcessor.explode_column(exploded_input, MULTI_VALUE_COLUMNS)
+        del exploded_input
+
+        cleaned_input = movie_data_df.copy()
+        with recorder.stage("clean_int_values", record_count):
+            DataProcessor.clean_int_values(cleaned_input)
+        del cleaned_input
+
+        with recorder.stage("normalize_movie_data", record_count):
+            normalized_data = DataProcessor.normalize_movie_data(movie_data_df)
+
+        with recorder.stage("overview_aggregates", record_count):
+            aggregates = compute_overview_aggregates(normalized_data)
+
+        # Der Prozessor des Overview-Tabs fragt unbekannte Länder beim Stub an und
+        # schreibt seinen Cache in den temporären Ordner
+        overview.processor._geo_locator = Photon(host=stub_url)
+        overview.processor.cache_file_path = temporary_path.joinpath("geo.json")
+        overview.processor._geocache = {}
+        with recorder.stage("geo_map_data", record_count):
+            geo_map_df = overview.create_geo_map_data(aggregates.country_stats)
+
+        with recorder.stage("charts", record_count):
+            charts.genre_counts_figure(aggregates.genre_counts)
+            charts.genre_ratings_figure(aggregates.genre_ratings)
+            charts.box_office_scatter_figure(aggregates)
+            charts.box_office_histogram_figure(aggregates.box_office_histogram)
+            charts.country_map_figure(geo_map_df)
+            charts.country_map_figure(geo_map_df, metric="BoxOffice", bubbles=True)
+
+
+def format_megabytes(value: int | None) -> str:
+    return "-" if value is None else f"{value / 1024**2:.1f}"
+
+
+def print_results(record_count: int, results: Dict[str, StageResult]) -> None:
+    print(f"\n{record_count:,} Filme")
+    print(
+        f"{'Stufe':<22} {'Sekunden':>10} {'Zeilen/s':>12} "
+        f"{'Peak MB':>10} {'Zuwachs MB':>11}"
+    )
+
+    for name, result in results.items():
+        throughput = result.rows / result.seconds if result.seconds else 0
+        print(
+            f"{name:<22} {result.seconds:>10.3f} {throughput:>12,.0f} "
+            f"{format_megabytes(result.peak_bytes):>10} "
+            f"{format_megabytes(result.growth_bytes):>11}"
+        )
+
+
+def run_benchmark(sizes: List[int], api_rows: int) -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubRequestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    stub_url = f"http://127.0.0.1:{server.server_port}/"
+    sampler = PeakMemorySampler() if read_rss() is not None else None
+
+    try:
+        for record_count in sizes:
+            recorder = StageRecorder(sampler)
+            run_pipeline(record_count, stub_url, api_rows, recorder)
+            print_results(record_count, recorder.results)
+    finally:
+        if sampler is not None:
+            sampler.stop()
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[100, 10_000, 1_000_000]
+    )
+    parser.add_argument(
+        "--api-rows",
+        type=int,
+        default=10_000,
+        help="Größter Katalog, der über den OMDb-Stub geladen wird",
+    )
+    arguments = parser.parse_args()
+
+    run_benchmark(arguments.sizes, arguments.api_rows)
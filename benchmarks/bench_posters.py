@@ -0,0 +1,139 @@
+"""
+Benchmark und Regressionstest für den Poster-Cache gegen einen lokalen Bildserver.
+
+Ein HTTP-Server im selben Prozess liefert synthetische JPEG-Poster mit einer
+künstlichen Verzögerung aus. Gemessen werden der erste, parallele Download, das
+Laden aus dem Cache und ein neuer Cache auf demselben Ordner. Geprüft wird
+außerdem, dass gleiche Bilder nur einmal gespeichert werden, nicht erreichbare
+Server nicht bei jedem Aufruf erneut abgefragt werden und die Größenbegrenzung
+eingehalten wird. Schlägt eine Prüfung fehl, endet das Skript mit Exit-Code 1.
+
+Ausführen aus dem Projektordner:
+    python -m benchmarks.bench_posters
+"""
+
+import io
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from PIL import Image
+
+from api.posters import PosterCache, THUMBNAIL_FORMAT
+
+POSTER_COUNT = 200
+# Anzahl unterschiedlicher Bilder, mehrere URLs teilen sich dasselbe Bild
+DISTINCT_IMAGES = 150
+REQUEST_DELAY = 0.05
+
+
+def create_poster(index: int) -> bytes:
+    """Erstellt ein JPEG in der Größe eines OMDb-Posters (300x445)."""
+    image = Image.new("RGB", (300, 445), (index % 256, (index * 7) % 256, 90))
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", quality=90)
+    return buffer.getvalue()
+
+
+class PosterRequestHandler(BaseHTTPRequestHandler):
+    posters = {index: create_poster(index) for index in range(DISTINCT_IMAGES)}
+    request_count = 0
+    lock = threading.Lock()
+
+    def do_GET(self) -> None:
+        with self.lock:
+            PosterRequestHandler.request_count += 1
+
+        time.sleep(REQUEST_DELAY)
+        index = int(self.path.strip("/").split(".")[0])
+        body = self.posters[index % DISTINCT_IMAGES]
+
+        self.send_response(200)
+        self.send_header("Content-Type", "image/jpeg")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+def cache_size(cache_path: Path) -> int:
+    return sum(
+        path.stat().st_size
+        for path in cache_path.glob(f"*/*.{THUMBNAIL_FORMAT.lower()}")
+    )
+
+
+def run_benchmark() -> bool:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), PosterRequestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    urls = [f"{base_url}/{index}.jpg" for index in range(POSTER_COUNT)]
+
+    checks = {}
+    with tempfile.TemporaryDirectory() as temporary_folder:
+        cache_path = Path(temporary_folder)
+        poster_cache = PosterCache(cache_path, max_bytes=50 * 1024 * 1024)
+
+        start = time.perf_counter()
+        data_urls = poster_cache.data_urls(urls)
+        cold_duration = time.perf_counter() - start
+        cold_requests = PosterRequestHandler.request_count
+
+        start = time.perf_counter()
+        poster_cache.data_urls(urls)
+        warm_duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        PosterCache(cache_path, max_bytes=50 * 1024 * 1024).data_urls(urls)
+        reload_duration = time.perf_counter() - start
+
+        checks["alle Poster geladen"] = all(data_urls)
+        checks["jede URL nur einmal geladen"] = (
+            PosterRequestHandler.request_count == cold_requests == POSTER_COUNT
+        )
+        checks["gleiche Bilder nur einmal gespeichert"] = (
+            len(list(cache_path.glob("*/*-table.*"))) == DISTINCT_IMAGES
+        )
+
+        # Nicht erreichbarer Server: der zweite Aufruf wartet nicht erneut
+        unreachable_url = "http://127.0.0.1:9/unreachable.jpg"
+        poster_cache.timeout = 1
+        poster_cache.thumbnail(unreachable_url)
+        start = time.perf_counter()
+        checks["nicht erreichbarer Server liefert None"] = (
+            poster_cache.thumbnail(unreachable_url) is None
+        )
+        checks["Fehler werden zwischengespeichert"] = time.perf_counter() - start < 0.1
+
+        # Größenbegrenzung: nur noch etwa die Hälfte der Poster passt in den Cache
+        full_size = cache_size(cache_path)
+        poster_cache.max_bytes = full_size // 2
+        evicted_count = poster_cache.evict()
+        checks["Cache unter der Größenbegrenzung"] = (
+            cache_size(cache_path) <= poster_cache.max_bytes
+        )
+        checks["verdrängte Poster werden neu geladen"] = all(
+            poster_cache.data_urls(urls[:DISTINCT_IMAGES])
+        )
+
+    server.shutdown()
+
+    print(f"{'Erster Download':<36} {cold_duration:>8.2f} s")
+    print(f"{'Aus dem Cache':<36} {warm_duration * 1000:>8.2f} ms")
+    print(f"{'Neuer Cache auf demselben Ordner':<36} {reload_duration * 1000:>8.2f} ms")
+    print(f"{'Cache-Größe':<36} {full_size / 1024:>8.1f} KB")
+    print(f"{'Verdrängte Poster':<36} {evicted_count:>8}")
+    for check_name, passed in checks.items():
+        print(f"{'OK  ' if passed else 'FEHLER'} {check_name}")
+
+    return all(checks.values())
+
+
+if __name__ == "__main__":
+    if not run_benchmark():
+        sys.exit(1)
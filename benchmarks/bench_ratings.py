@@ -0,0 +1,76 @@
+"""
+Benchmark für DataProcessor.process_ratings_list.
+
+Misst die Laufzeit für 1.000, 10.000 und 100.000 synthetische Filme und gibt die
+Zeit pro Film aus. Bei linearer Skalierung bleibt die Zeit pro Film annähernd
+konstant.
+
+Ausführen aus dem Projektordner:
+    python -m benchmarks.bench_ratings
+"""
+
+import random
+import time
+from typing import List
+
+from process.processor import DataProcessor
+
+
+def create_movie_records(record_count: int) -> List[dict]:
+    """
+    Erstellt synthetische Filmdaten mit einer OMDb-typischen Ratings-Liste.
+    Nicht jeder Film hat alle drei Bewertungsquellen.
+    """
+    random_generator = random.Random(42)
+    movie_list = []
+
+    for index in range(record_count):
+        ratings = [
+            {
+                "Source": "Internet Movie Database",
+                "Value": f"{random_generator.uniform(1, 10):.1f}/10",
+            }
+        ]
+        if index % 3:
+            ratings.append(
+                {
+                    "Source": "Rotten Tomatoes",
+                    "Value": f"{random_generator.randint(0, 100)}%",
+                }
+            )
+        if index % 4:
+            ratings.append(
+                {
+                    "Source": "Metacritic",
+                    "Value": f"{random_generator.randint(0, 100)}/100",
+                }
+            )
+
+        movie_list.append(
+            {"Title": f"Movie {index}", "imdbID": f"tt{index:07d}", "Ratings": ratings}
+        )
+
+    return movie_list
+
+
+def run_benchmark(record_counts: List[int], repeat: int = 3) -> None:
+    print(f"{'Filme':>10} {'Sekunden':>10} {'µs/Film':>10}")
+
+    for record_count in record_counts:
+        movie_list = create_movie_records(record_count)
+
+        # Bester von mehreren Durchläufen, um Ausreißer zu vermeiden
+        best_duration = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            DataProcessor.process_ratings_list(movie_list)
+            best_duration = min(best_duration, time.perf_counter() - start)
+
+        print(
+            f"{record_count:>10} {best_duration:>10.3f} "
+            f"{best_duration / record_count * 1_000_000:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    run_benchmark([1_000, 10_000, 100_000])
@@ -0,0 +1,83 @@
+"""
+Benchmark für das Panel "Ähnliche Filme" im Detail-Tab.
+
+Erstellt synthetische Kataloge mit 10.000, 50.000 und 100.000 Filmen, misst den
+einmaligen Aufbau des MovieSimilarityIndex und die mittlere Dauer einer
+Top-10-Abfrage.
+
+Ausführen aus dem Projektordner:
+    python -m benchmarks.bench_similarity
+"""
+
+import time
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from process.processor import DataProcessor
+from process.similarity import MovieSimilarityIndex
+from process.text_analytics import PlotTermMatrix
+
+GENRES = ["Drama", "Comedy", "Action", "Horror", "Sci-Fi", "Romance", "Thriller"]
+
+
+def create_movie_df(movie_count: int) -> pd.DataFrame:
+    """
+    Erstellt synthetische Filmdaten mit Genres, Besetzung, Regie und Plot.
+    """
+    random_generator = np.random.default_rng(42)
+    words = np.array([f"word{index}" for index in range(20_000)])
+    actors = np.array([f"Actor {index}" for index in range(movie_count // 2)])
+    directors = np.array([f"Director {index}" for index in range(movie_count // 6)])
+
+    return pd.DataFrame(
+        {
+            "Title": [f"Movie {index}" for index in range(movie_count)],
+            "imdbID": [f"tt{index:07d}" for index in range(movie_count)],
+            "Plot": [
+                " ".join(random_generator.choice(words, 40)) for _ in range(movie_count)
+            ],
+            "Genre": [
+                ", ".join(random_generator.choice(GENRES, 3, replace=False))
+                for _ in range(movie_count)
+            ],
+            "Actors": [
+                ", ".join(random_generator.choice(actors, 4))
+                for _ in range(movie_count)
+            ],
+            "Director": random_generator.choice(directors, movie_count),
+            "Year": random_generator.integers(1950, 2024, movie_count).astype(str),
+            "imdbRating": random_generator.uniform(1, 10, movie_count)
+            .round(1)
+            .astype(str),
+        }
+    )
+
+
+def run_benchmark(movie_counts: List[int], queries: int = 200) -> None:
+    print(f"{'Filme':>10} {'Aufbau s':>10} {'Abfrage ms':>12}")
+
+    for movie_count in movie_counts:
+        movie_df = create_movie_df(movie_count)
+        normalized_data = DataProcessor.normalize_movie_data(movie_df)
+        term_matrix = PlotTermMatrix.from_movies(movie_df, stopwords=[])
+
+        start = time.perf_counter()
+        similarity_index = MovieSimilarityIndex(normalized_data, term_matrix)
+        build_duration = time.perf_counter() - start
+
+        rows = np.random.default_rng(7).integers(0, movie_count, queries)
+        start = time.perf_counter()
+        for row in rows:
+            similarity_index.similar_movies(row, top_k=10)
+        query_duration = (time.perf_counter() - start) / queries
+
+        print(
+            f"{movie_count:>10} {build_duration:>10.2f} "
+            f"{query_duration * 1000:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    run_benchmark([10_000, 50_000, 100_000])
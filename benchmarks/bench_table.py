@@ -0,0 +1,122 @@
+"""
+Benchmark und Regressionstest für die Filmtabelle im Overview-Tab.
+
+Für synthetische Kataloge (siehe bench_pipeline) wird die Datenmenge verglichen,
+die Streamlit pro Rerun an den Browser sendet: früher die ganze (gefilterte)
+Tabelle, jetzt nur die sichtbare Seite aus MovieTableView. Gemessen werden die
+Größe der serialisierten Arrow-Daten und die Dauer eines Reruns mit Suche,
+Sortierung und Seitenwechsel. Die Poster werden nicht umgewandelt, angegeben
+ist nur die Anzahl der Poster, die umgewandelt werden müssten.
+
+Geprüft wird, dass die Größe einer Seite nicht mit dem Katalog wächst, eine
+Seite höchstens `--page-size` Zeilen enthält und die Zeilen richtig gefiltert
+und sortiert sind. Schlägt eine Prüfung fehl, endet das Skript mit Exit-Code 1.
+
+Ausführen aus dem Projektordner:
+    python -m benchmarks.bench_table
+    python -m benchmarks.bench_table --sizes 1000 100000 --page-size 100
+"""
+
+import argparse
+import sys
+import time
+from typing import List
+
+import pandas as pd
+from streamlit.type_util import data_frame_to_bytes
+
+from benchmarks.bench_pipeline import iter_omdb_records
+from process.processor import DataProcessor
+from process.search import MovieSearchIndex
+from process.table_view import MovieTableView
+
+SEARCH_TEXT = "drama"
+SORT_COLUMN = "imdbRating"
+# Erlaubtes Verhältnis der Seitengröße in Bytes zwischen größtem und kleinstem Katalog
+MAX_PAGE_GROWTH = 1.25
+
+
+def create_movies(record_count: int) -> pd.DataFrame:
+    """Erstellt und normalisiert einen synthetischen Katalog wie beim Laden in der App."""
+    movie_df = pd.concat(
+        pd.DataFrame(DataProcessor.process_ratings_list(records))
+        for records in iter_omdb_records(record_count)
+    )
+    return DataProcessor.normalize_movie_data(movie_df).movies
+
+
+def run_benchmark(sizes: List[int], page_size: int) -> bool:
+    checks = {}
+    page_bytes = []
+
+    print(
+        f"{'Filme':>10} {'Treffer':>10} {'Tabelle KB':>12} {'Seite KB':>10} "
+        f"{'Tabelle ms':>12} {'Seite ms':>10} {'Poster':>8} {'Aufbau ms':>10}"
+    )
+    for record_count in sizes:
+        movies = create_movies(record_count)
+        search_index = MovieSearchIndex(movies, column_name_list=["Title", "Genre"])
+
+        start = time.perf_counter()
+        table_view = MovieTableView(movies)
+        # Die erste Sortierung wird einmal pro Datensatz berechnet
+        table_view.sort_order(SORT_COLUMN, ascending=False)
+        setup_seconds = time.perf_counter() - start
+
+        # Früher: die ganze gefilterte Tabelle wurde serialisiert
+        start = time.perf_counter()
+        filtered_df = movies.iloc[search_index.search(SEARCH_TEXT)]
+        full_size = len(data_frame_to_bytes(filtered_df))
+        full_seconds = time.perf_counter() - start
+
+        # Jetzt: Suche, Sortierung und Seitenwechsel über Zeilennummern
+        start = time.perf_counter()
+        row_order = table_view.row_order(
+            search_index.search(SEARCH_TEXT), sort_column=SORT_COLUMN, ascending=False
+        )
+        table_page = table_view.page(
+            row_order, list(movies.columns), page=2, page_size=page_size
+        )
+        page_size_bytes = len(data_frame_to_bytes(table_page.rows))
+        page_seconds = time.perf_counter() - start
+        page_bytes.append(page_size_bytes)
+
+        print(
+            f"{record_count:>10} {len(filtered_df):>10} {full_size / 1024:>12.1f} "
+            f"{page_size_bytes / 1024:>10.1f} {full_seconds * 1000:>12.1f} "
+            f"{page_seconds * 1000:>10.1f} {len(table_page.rows):>8} "
+            f"{setup_seconds * 1000:>10.1f}"
+        )
+
+        ratings = table_page.rows[SORT_COLUMN].dropna()
+        checks[f"{record_count} Filme: höchstens {page_size} Zeilen je Seite"] = (
+            len(table_page.rows) <= page_size
+        )
+        checks[f"{record_count} Filme: Seite gefiltert und sortiert"] = bool(
+            table_page.rows["Genre"].str.contains("Drama").all()
+            and ratings.is_monotonic_decreasing
+            and table_page.page == min(2, table_page.page_count)
+        )
+
+    growth = max(page_bytes) / min(page_bytes)
+    checks[
+        f"Größe einer Seite wächst höchstens um Faktor {MAX_PAGE_GROWTH:g} "
+        f"({growth:.2f})"
+    ] = (growth <= MAX_PAGE_GROWTH)
+
+    for check_name, passed in checks.items():
+        print(f"{'OK  ' if passed else 'FEHLER'} {check_name}")
+
+    return all(checks.values())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000]
+    )
+    parser.add_argument("--page-size", type=int, default=50)
+    arguments = parser.parse_args()
+
+    if not run_benchmark(arguments.sizes, arguments.page_size):
+        sys.exit(1)
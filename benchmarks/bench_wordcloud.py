@@ -0,0 +1,89 @@
+"""
+Speicher-Regressionstest für die Wortwolke im Detail-Tab.
+
+Simuliert 500 Bewegungen des Schiebereglers über mehrere Filme und misst den
+Speicherverbrauch des Prozesses. Da die Wortwolken als PNG im begrenzten
+LRU-Cache liegen und keine matplotlib-Figuren mehr entstehen, darf der Speicher
+nach dem Aufwärmen nicht weiter wachsen.
+
+Ausführen aus dem Projektordner:
+    python -m benchmarks.bench_wordcloud
+"""
+
+import gc
+import random
+import resource
+import sys
+import time
+import tracemalloc
+
+from tabs.details import render_word_cloud
+
+PLOT_WORDS = (
+    "a young wizard discovers his destiny while a dark lord rises again and "
+    "friends must travel across the kingdom to recover the lost crown before "
+    "winter falls on the city and the ancient dragon wakes beneath the mountain"
+).split()
+
+# Erlaubtes Wachstum der Python-Allokationen nach dem Aufwärmen
+MAX_GROWTH_MB = 5
+
+
+def create_plots(movie_count: int) -> dict:
+    """
+    Erstellt synthetische Plots mit je 60 Wörtern.
+    """
+    random_generator = random.Random(42)
+    return {
+        f"tt{index:07d}": " ".join(random_generator.choices(PLOT_WORDS, k=60))
+        for index in range(movie_count)
+    }
+
+
+def move_slider(plots: dict, moves: int, random_generator: random.Random) -> float:
+    """
+    Rendert die Wortwolke für `moves` zufällige Kombinationen aus Film und
+    Reglerstellung und gibt die Laufzeit in Sekunden zurück.
+    """
+    imdb_ids = list(plots)
+    start = time.perf_counter()
+
+    for _ in range(moves):
+        imdb_id = random_generator.choice(imdb_ids)
+        render_word_cloud(imdb_id, plots[imdb_id], random_generator.randint(5, 40))
+
+    return time.perf_counter() - start
+
+
+def run_benchmark(moves: int = 500) -> bool:
+    plots = create_plots(movie_count=5)
+    random_generator = random.Random(7)
+
+    # Aufwärmen: füllt den Cache und lädt Schriftarten
+    warmup_duration = move_slider(plots, moves, random_generator)
+    gc.collect()
+
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    duration = move_slider(plots, moves, random_generator)
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    growth_mb = (current - baseline) / 1024**2
+    max_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    print(f"{'Aufwärmen':<28} {warmup_duration:>8.2f} s")
+    print(f"{f'{moves} Reglerbewegungen':<28} {duration:>8.2f} s")
+    print(f"{'Speicherwachstum':<28} {growth_mb:>8.2f} MB")
+    print(f"{'Spitzenwert (tracemalloc)':<28} {peak / 1024**2:>8.2f} MB")
+    print(f"{'Max. RSS':<28} {max_rss_mb:>8.2f} MB")
+    print(render_word_cloud.cache_info())
+
+    return growth_mb <= MAX_GROWTH_MB
+
+
+if __name__ == "__main__":
+    if not run_benchmark():
+        print(f"Speicher ist um mehr als {MAX_GROWTH_MB} MB gewachsen")
+        sys.exit(1)
@@ -19,3 +19,77 @@ class Config:
 
     # API URL
     api_url: str = "http://www.omdbapi.com/"
+
+    # Maximale Anzahl gleichzeitig laufender OMDb-Anfragen (1 = seriell)
+    omdb_max_workers: int = int(os.getenv("OMDB_MAX_WORKERS", 8))
+    # Rate Limit des API-Keys in Anfragen pro Sekunde (0 = kein Limit)
+    omdb_rate_limit: float = float(os.getenv("OMDB_RATE_LIMIT", 10))
+    # Anzahl der Anfragen, die kurzfristig ohne Wartezeit gesendet werden dürfen
+    omdb_rate_burst: int = int(os.getenv("OMDB_RATE_BURST", 10))
+    # Timeouts einer OMDb-Anfrage in Sekunden (Verbindungsaufbau, Antwort)
+    omdb_connect_timeout: float = float(os.getenv("OMDB_CONNECT_TIMEOUT", 3.05))
+    omdb_read_timeout: float = float(os.getenv("OMDB_READ_TIMEOUT", 10))
+    # Wiederholungen bei Timeouts, 429 und 5xx mit exponentiellem Backoff (Sekunden)
+    omdb_max_retries: int = int(os.getenv("OMDB_MAX_RETRIES", 3))
+    omdb_backoff_base: float = float(os.getenv("OMDB_BACKOFF_BASE", 0.5))
+    omdb_backoff_max: float = float(os.getenv("OMDB_BACKOFF_MAX", 8))
+    # Nach so vielen fehlgeschlagenen Anfragen in Folge werden für
+    # OMDB_BREAKER_COOLDOWN Sekunden nur noch gecachte Filme geliefert (0 = aus)
+    omdb_breaker_threshold: int = int(os.getenv("OMDB_BREAKER_THRESHOLD", 5))
+    omdb_breaker_cooldown: float = float(os.getenv("OMDB_BREAKER_COOLDOWN", 60))
+    # Sekunden, in denen ein nicht gefundener Titel nicht erneut angefragt wird
+    omdb_not_found_ttl: float = float(os.getenv("OMDB_NOT_FOUND_TTL", 3600))
+    # Anzahl der Filme, nach denen beim Laden jeweils ein Zwischenstand angezeigt wird
+    omdb_stream_chunk_size: int = int(os.getenv("OMDB_STREAM_CHUNK_SIZE", 25))
+    # Maximale Anzahl der Seiten (je 10 Treffer) einer OMDb-Suche, höchstens 100
+    omdb_search_max_pages: int = int(os.getenv("OMDB_SEARCH_MAX_PAGES", 100))
+    # Optionale Obergrenze für die Länge einer Filmliste (0 = unbegrenzt)
+    max_movie_list_length: int = int(os.getenv("MAX_MOVIE_LIST_LENGTH", 0))
+
+    # Cache-Backend für die Filmdaten: "sqlite" (Standard) oder "json"
+    movie_cache_backend: str = os.getenv("MOVIE_CACHE_BACKEND", "sqlite")
+    # Sekunden, die gecachte Filmdaten als aktuell gelten (Standard: 7 Tage)
+    movie_cache_ttl: float = float(os.getenv("MOVIE_CACHE_TTL", 7 * 24 * 3600))
+    # Zusätzliche Sekunden, in denen veraltete Daten noch angezeigt und
+    # im Hintergrund neu geladen werden (Standard: 30 Tage)
+    movie_cache_stale_ttl: float = float(
+        os.getenv("MOVIE_CACHE_STALE_TTL", 30 * 24 * 3600)
+    )
+    # Maximale Anzahl an Filmen im Speicher (LRU)
+    movie_cache_max_entries: int = int(os.getenv("MOVIE_CACHE_MAX_ENTRIES", 5000))
+    # Maximale Anzahl an Filmen im persistenten Cache
+    movie_cache_max_persisted_entries: int = int(
+        os.getenv("MOVIE_CACHE_MAX_PERSISTED_ENTRIES", 100_000)
+    )
+
+    # Maximale Anzahl gleichzeitiger Photon-Anfragen für unbekannte Ländernamen
+    geo_max_workers: int = int(os.getenv("GEO_MAX_WORKERS", 4))
+
+    # Ob die Suche im Overview-Tab auch die Plot-Texte durchsucht
+    search_include_plot: bool = os.getenv("SEARCH_INCLUDE_PLOT", "0") == "1"
+    # Anzahl der Filme, die die Tabelle im Overview-Tab je Seite anzeigt
+    overview_page_size: int = int(os.getenv("OVERVIEW_PAGE_SIZE", 50))
+
+    # Ordner mit den über ingest.py vorbereiteten Datensätzen
+    dataset_path: Path = project_path.joinpath("data")
+
+    # Anzahl der Datensätze, die ohne aktive Session im Speicher bleiben
+    dataset_registry_max_idle: int = int(os.getenv("DATASET_REGISTRY_MAX_IDLE", 4))
+    # Anzahl der Lade-Jobs, die gleichzeitig im Hintergrund laufen, weitere warten
+    load_job_workers: int = int(os.getenv("LOAD_JOB_WORKERS", 2))
+    # Anzahl fertiger Lade-Jobs, denen weitere Sessions noch beitreten können
+    load_job_max_finished: int = int(os.getenv("LOAD_JOB_MAX_FINISHED", 4))
+    # Sekunden zwischen zwei Abfragen des Fortschritts eines laufenden Jobs
+    load_job_poll_interval: float = float(os.getenv("LOAD_JOB_POLL_INTERVAL", 0.5))
+
+    # Ordner für die verkleinerten Poster
+    poster_cache_path: Path = project_path.joinpath("api", "poster.cache")
+    # Maximale Größe des Poster-Caches in MB
+    poster_cache_max_mb: float = float(os.getenv("POSTER_CACHE_MAX_MB", 200))
+    # Maximale Anzahl gleichzeitiger Poster-Downloads
+    poster_max_workers: int = int(os.getenv("POSTER_MAX_WORKERS", 8))
+
+    # Messwerte (Zeiten, Cache-Treffer, API-Aufrufe) sammeln und in der Sidebar anzeigen
+    metrics_enabled: bool = os.getenv("METRICS_ENABLED", "0") == "1"
+    # Port für den Prometheus-Endpunkt /metrics (0 = kein Endpunkt)
+    metrics_port: int = int(os.getenv("METRICS_PORT", 0))
@@ -0,0 +1,280 @@
+"""
+Kommandozeilen-Werkzeug, um eine IMDb-Liste ohne Browser-Session aufzubereiten.
+
+Die Filmdaten werden parallel über die OMDb API geholt, mit dem DataProcessor
+bereinigt und als typisierter Datensatz (Parquet oder Feather) gespeichert.
+Der Datensatz kann danach im Dashboard direkt geöffnet werden.
+
+Jeder abgefragte Film wird sofort in eine Checkpoint-Datei geschrieben. Bricht
+der Lauf ab, setzt ein erneuter Aufruf mit denselben Argumenten dort fort.
+
+Beispiel:
+    python ingest.py input/2023_Movie_List.csv
+    python ingest.py input/2023_Movie_List.csv --output data/2023.parquet --workers 4
+    python ingest.py --search "Star Wars" --type movie
+"""
+
+import argparse
+import json
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+import pandas as pd
+
+from config import Config
+from api.omdb import OmdbApiHandler, is_fetch_failure
+from process.processor import DataProcessor
+from process.movie_list import iter_movie_list_chunks
+from process.dataset_store import write_movie_dataset
+
+
+def _load_checkpoint(checkpoint_path: Path) -> Dict[str, Dict]:
+    """
+    Liest die bereits abgefragten Filme aus der Checkpoint-Datei.
+    Eine unvollständige letzte Zeile (Abbruch während des Schreibens) wird ignoriert.
+    """
+    fetched_movies = {}
+
+    if checkpoint_path.exists():
+        with open(checkpoint_path, "r") as file:
+            for line in file:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                fetched_movies[entry["query"]] = entry["movie"]
+
+    return fetched_movies
+
+
+def ingest_movies(
+    movie_chunks: Iterable[List[str]],
+    output_path: Path,
+    max_workers: int | None = None,
+    checkpoint_every: int = 25,
+    api: OmdbApiHandler | None = None,
+) -> pd.DataFrame:
+    """
+    Holt die Filmdaten einer Filmliste und speichert sie als Datensatz.
+    Die Liste wird blockweise übergeben, die Filme eines Blocks werden geladen,
+    bevor der nächste Block gelesen wird.
+
+    :param movie_chunks: Blöcke von Filmtiteln oder imdbIDs ohne Duplikate.
+    :param output_path: Zielpfad (.parquet, .feather oder .arrow).
+    :param max_workers: Maximale Anzahl paralleler API-Anfragen.
+    :param checkpoint_every: Nach wie vielen Filmen die Checkpoint-Datei auf die
+                             Festplatte geschrieben wird.
+    :param api: Optionaler, bereits erstellter OmdbApiHandler.
+    :return: DataFrame mit den gespeicherten, normalisierten Filmdaten (leer, wenn
+             Filme wegen Fehlern der API fehlen und der Datensatz nicht gespeichert wurde)
+    """
+    checkpoint_path = output_path.with_name(output_path.name + ".checkpoint.jsonl")
+    checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+    fetched_movies = _load_checkpoint(checkpoint_path)
+
+    if fetched_movies:
+        print(f"Checkpoint gefunden: {len(fetched_movies)} Filme bereits geladen")
+
+    movie_list = []
+    processed_count = 0
+    skipped_count = 0
+
+    with open(checkpoint_path, "a") as checkpoint_file:
+        for movie_chunk in movie_chunks:
+            movie_list.extend(movie_chunk)
+            missing_movies = [
+                movie for movie in movie_chunk if movie not in fetched_movies
+            ]
+            if not missing_movies:
+                continue
+
+            api = api or OmdbApiHandler()
+
+            for movie, movie_dict in api.iter_movie_data(
+                missing_movies, max_workers=max_workers
+            ):
+                processed_count += 1
+
+                # Nur "nicht gefunden" wird gespeichert. Scheitert die Abfrage an
+                # einem Fehler (z.B. 429/5xx nach allen Wiederholungen oder der
+                # Circuit Breaker ist offen), bleibt der Film für einen späteren
+                # Neustart offen
+                if is_fetch_failure(movie_dict):
+                    skipped_count += 1
+                    continue
+
+                fetched_movies[movie] = movie_dict or None
+                checkpoint_file.write(
+                    json.dumps({"query": movie, "movie": movie_dict or None}) + "\n"
+                )
+
+                if processed_count % checkpoint_every == 0:
+                    checkpoint_file.flush()
+                    print(
+                        f"{processed_count} Filme geladen "
+                        f"({len(movie_list)} Einträge bisher gelesen)"
+                    )
+
+    print(f"{len(movie_list)} Einträge, {processed_count} davon neu abgefragt")
+
+    if skipped_count:
+        print(
+            f"{skipped_count} Filme konnten wegen Fehlern der OMDb API nicht "
+            f"abgefragt werden. Der Checkpoint bleibt erhalten, bitte später erneut starten."
+        )
+        return pd.DataFrame()
+
+    # Reihenfolge der Liste beibehalten, jeden Film nur einmal übernehmen
+    movie_data_raw = list(
+        {
+            movie_dict.get("imdbID", movie): movie_dict
+            for movie in movie_list
+            if (movie_dict := fetched_movies.get(movie))
+        }.values()
+    )
+    print(f"{len(movie_data_raw)} von {len(movie_list)} Filmen gefunden")
+
+    movie_data_raw = DataProcessor.process_ratings_list(movie_data_raw)
+    normalized_data = DataProcessor.normalize_movie_data(pd.DataFrame(movie_data_raw))
+
+    write_movie_dataset(normalized_data.movies, output_path)
+    checkpoint_path.unlink()
+    print(f"Datensatz gespeichert: {output_path}")
+
+    return normalized_data.movies
+
+
+def ingest_movie_list(
+    input_path: Path,
+    output_path: Path,
+    max_workers: int | None = None,
+    checkpoint_every: int = 25,
+) -> pd.DataFrame:
+    """
+    Bereitet eine IMDb-Liste auf und speichert sie als Datensatz (siehe ingest_movies).
+    Die Datei wird blockweise gelesen, sodass auch Exporte mit mehreren hundert MB
+    verarbeitet werden können, ohne sie vollständig in den Speicher zu laden.
+
+    :param input_path: CSV- oder XLSX-Datei mit der Filmliste.
+    :param output_path: Zielpfad (.parquet, .feather oder .arrow).
+    :param max_workers: Maximale Anzahl paralleler API-Anfragen.
+    :param checkpoint_every: Nach wie vielen Filmen die Checkpoint-Datei auf die
+                             Festplatte geschrieben wird.
+    :return: DataFrame mit den gespeicherten, normalisierten Filmdaten
+    """
+    print(f"Lese {input_path.name}")
+
+    return ingest_movies(
+        iter_movie_list_chunks(input_path, file_name=input_path.name),
+        output_path,
+        max_workers=max_workers,
+        checkpoint_every=checkpoint_every,
+    )
+
+
+def ingest_search(
+    search_term: str,
+    output_path: Path,
+    media_type: str | None = None,
+    year: str | None = None,
+    max_workers: int | None = None,
+    checkpoint_every: int = 25,
+) -> pd.DataFrame:
+    """
+    Speichert alle Treffer einer OMDb-Suche als Datensatz. Die Suchseiten liefern
+    nur die imdbIDs, die vollständigen Daten werden danach nur für die Filme
+    angefragt, die noch nicht im Cache liegen (siehe OmdbApiHandler.search_movie_list).
+
+    :param search_term: Suchbegriff, z.B. "Star Wars".
+    :param output_path: Zielpfad (.parquet, .feather oder .arrow).
+    :param media_type: Optionaler Typ: "movie", "series" oder "episode".
+    :param year: Optionales Erscheinungsjahr.
+    :param max_workers: Maximale Anzahl paralleler API-Anfragen.
+    :param checkpoint_every: Nach wie vielen Filmen die Checkpoint-Datei auf die
+                             Festplatte geschrieben wird.
+    :return: DataFrame mit den gespeicherten, normalisierten Filmdaten
+    """
+    api = OmdbApiHandler()
+    movie_list = api.search_movie_list(search_term, media_type=media_type, year=year)
+    print(f'{len(movie_list)} Titel für die Suche "{search_term}" gefunden')
+
+    if not movie_list:
+        return pd.DataFrame()
+
+    return ingest_movies(
+        [movie_list],
+        output_path,
+        max_workers=max_workers,
+        checkpoint_every=checkpoint_every,
+        api=api,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Bereitet eine IMDb-Liste über die OMDb API als Datensatz auf."
+    )
+    parser.add_argument(
+        "input", type=Path, nargs="?", help="CSV- oder XLSX-Datei der Filmliste"
+    )
+    parser.add_argument(
+        "--search",
+        default=None,
+        help='Statt einer Datei alle Treffer einer OMDb-Suche laden, z.B. "Star Wars"',
+    )
+    parser.add_argument(
+        "--type",
+        choices=["movie", "series", "episode"],
+        default=None,
+        help="Nur Treffer dieses Typs (nur mit --search)",
+    )
+    parser.add_argument(
+        "--year", default=None, help="Nur Treffer dieses Jahres (nur mit --search)"
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help="Zieldatei (.parquet, .feather oder .arrow), "
+        "Standard: data/<Name der Eingabedatei bzw. Suche>.feather",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Maximale Anzahl paralleler API-Anfragen (Standard: OMDB_MAX_WORKERS)",
+    )
+    arguments = parser.parse_args()
+
+    if (arguments.input is None) == (arguments.search is None):
+        parser.error("Bitte entweder eine Eingabedatei oder --search angeben")
+
+    if arguments.search is not None:
+        output_name = "_".join(
+            filter(None, [arguments.search, arguments.type, arguments.year])
+        )
+        output_path = arguments.output or Config.dataset_path.joinpath(
+            output_name.replace(" ", "_") + ".feather"
+        )
+        ingest_search(
+            search_term=arguments.search,
+            output_path=output_path,
+            media_type=arguments.type,
+            year=arguments.year,
+            max_workers=arguments.workers,
+        )
+        return
+
+    output_path = arguments.output or Config.dataset_path.joinpath(
+        arguments.input.stem.replace(" ", "_") + ".feather"
+    )
+
+    ingest_movie_list(
+        input_path=arguments.input,
+        output_path=output_path,
+        max_workers=arguments.workers,
+    )
+
+
+if __name__ == "__main__":
+    main()
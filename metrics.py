@@ -0,0 +1,278 @@
+"""
+Leichtgewichtige Messwerte für die App: Zeiten je Verarbeitungsschritt, Treffer
+der Caches, API-Aufrufe und Fehler sowie die Anzahl verarbeiteter Zeilen.
+
+Alle Module verwenden die gemeinsame Instanz METRICS:
+
+    with METRICS.span("normalize_movie_data"):
+        ...
+    METRICS.increment("cache_requests_total", cache="movie", result="hit")
+
+Die Messung ist nur aktiv, wenn METRICS_ENABLED=1 gesetzt ist. Andernfalls
+kehren alle Aufrufe sofort zurück, span liefert einen leeren Kontextmanager.
+Die Werte können als Prometheus-Text oder JSON ausgegeben werden, optional auch
+über einen eigenen HTTP-Endpunkt (METRICS_PORT).
+"""
+
+import json
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterator, Tuple
+
+from config import Config
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+# Wird zurückgegeben, wenn die Messung deaktiviert ist
+_NO_SPAN = nullcontext()
+
+
+class StageTimer:
+    """
+    Misst aufeinanderfolgende Abschnitte einer Funktion, ohne dass die Abschnitte
+    eingerückt werden müssen. mark("table") erfasst die Zeit seit dem letzten mark
+    als Abschnitt "table" der Messung "tab_stage".
+    """
+
+    def __init__(self, registry: "MetricsRegistry", tab: str):
+        self.registry = registry
+        self.tab = tab
+        self._last_mark = time.perf_counter()
+
+    def mark(self, stage: str) -> None:
+        now = time.perf_counter()
+        self.registry.observe(
+            "tab_stage", now - self._last_mark, tab=self.tab, stage=stage
+        )
+        self._last_mark = now
+
+
+class _NoStageTimer:
+    def mark(self, stage: str) -> None:
+        pass
+
+
+_NO_STAGE_TIMER = _NoStageTimer()
+
+
+def _label_key(labels: Dict[str, object]) -> LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _format_labels(label_key: LabelKey) -> str:
+    if not label_key:
+        return ""
+    label_text = ",".join(
+        '{}="{}"'.format(
+            name, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        )
+        for name, value in label_key
+    )
+    return "{" + label_text + "}"
+
+
+class MetricsRegistry:
+    """
+    Sammelt Zähler und Zeitmessungen. Alle Methoden sind threadsicher, da die
+    OMDb-, Photon- und Poster-Anfragen in Thread-Pools laufen.
+    """
+
+    def __init__(self, enabled: bool = False):
+        """
+        Konstruktor für die MetricsRegistry-Klasse.
+        :param enabled: Ob Messwerte gesammelt werden.
+        """
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        # Je Zeitmessung: Anzahl, Summe und Maximum in Sekunden
+        self._timings: Dict[str, Dict[LabelKey, list]] = {}
+        self._server: ThreadingHTTPServer | None = None
+
+    def increment(self, name: str, value: float = 1, **labels) -> None:
+        """
+        Erhöht einen Zähler, z.B. increment("omdb_requests_total", status="ok").
+        """
+        if not self.enabled:
+            return
+
+        label_key = _label_key(labels)
+        with self._lock:
+            counter = self._counters.setdefault(name, {})
+            counter[label_key] = counter.get(label_key, 0) + value
+
+    def observe(self, name: str, seconds: float, **labels) -> None:
+        """
+        Erfasst eine Dauer in Sekunden.
+        """
+        if not self.enabled:
+            return
+
+        label_key = _label_key(labels)
+        with self._lock:
+            timing = self._timings.setdefault(name, {}).setdefault(
+                label_key, [0, 0.0, 0.0]
+            )
+            timing[0] += 1
+            timing[1] += seconds
+            timing[2] = max(timing[2], seconds)
+
+    def span(self, name: str, **labels):
+        """
+        Misst die Dauer eines Blocks:
+            with METRICS.span("overview_table"):
+                ...
+        """
+        if not self.enabled:
+            return _NO_SPAN
+        return self._span(name, labels)
+
+    @contextmanager
+    def _span(self, name: str, labels: Dict[str, object]) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def stages(self, tab: str):
+        """
+        Liefert einen StageTimer für die Abschnitte eines Tabs.
+        """
+        if not self.enabled:
+            return _NO_STAGE_TIMER
+        return StageTimer(self, tab)
+
+    def timed(self, name: str) -> Callable:
+        """
+        Dekorator, der jeden Aufruf einer Funktion als Zeitmessung erfasst.
+        """
+
+        def decorator(function: Callable) -> Callable:
+            @wraps(function)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+
+                with self._span(name, {}):
+                    return function(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._timings.clear()
+
+    def snapshot(self) -> Dict:
+        """
+        Liefert eine Kopie aller Messwerte.
+        :return: Dictionary mit den Schlüsseln "counters" und "timings", je Messwert
+                 eine Liste von Einträgen mit den Labels und Werten
+        """
+        with self._lock:
+            counters = {
+                name: [
+                    {"labels": dict(label_key), "value": value}
+                    for label_key, value in values.items()
+                ]
+                for name, values in self._counters.items()
+            }
+            timings = {
+                name: [
+                    {
+                        "labels": dict(label_key),
+                        "count": count,
+                        "sum_seconds": total,
+                        "max_seconds": maximum,
+                    }
+                    for label_key, (count, total, maximum) in values.items()
+                ]
+                for name, values in self._timings.items()
+            }
+
+        return {"counters": counters, "timings": timings}
+
+    def to_json(self) -> str:
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self) -> str:
+        """
+        Gibt alle Messwerte im Prometheus-Textformat aus. Zeitmessungen werden als
+        Summary (_count, _sum) und zusätzlich als Gauge mit dem Maximum ausgegeben.
+        """
+        lines = []
+        with self._lock:
+            for name, values in sorted(self._counters.items()):
+                lines.append(f"# TYPE {name} counter")
+                for label_key, value in values.items():
+                    lines.append(f"{name}{_format_labels(label_key)} {value:g}")
+
+            for name, values in sorted(self._timings.items()):
+                metric_name = f"{name}_seconds"
+                lines.append(f"# TYPE {metric_name} summary")
+                for label_key, (count, total, _) in values.items():
+                    labels = _format_labels(label_key)
+                    lines.append(f"{metric_name}_count{labels} {count}")
+                    lines.append(f"{metric_name}_sum{labels} {total:.6f}")
+
+                lines.append(f"# TYPE {metric_name}_max gauge")
+                for label_key, (_, _, maximum) in values.items():
+                    lines.append(
+                        f"{metric_name}_max{_format_labels(label_key)} {maximum:.6f}"
+                    )
+
+        return "\n".join(lines) + "\n"
+
+    def start_http_server(self, port: int) -> None:
+        """
+        Startet einmal pro Prozess einen HTTP-Endpunkt in einem Hintergrund-Thread:
+        /metrics liefert den Prometheus-Text, /metrics.json die JSON-Ausgabe.
+        """
+        if self._server is not None or not port:
+            return
+
+        registry = self
+
+        class MetricsRequestHandler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.startswith("/metrics.json"):
+                    body, content_type = registry.to_json(), "application/json"
+                elif self.path.startswith("/metrics"):
+                    body = registry.to_prometheus()
+                    content_type = "text/plain; version=0.0.4"
+                else:
+                    self.send_error(404)
+                    return
+
+                body = body.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+        with self._lock:
+            if self._server is not None:
+                return
+            try:
+                self._server = ThreadingHTTPServer(
+                    ("0.0.0.0", port), MetricsRequestHandler
+                )
+            except OSError as error:
+                # Der Port ist z.B. durch einen zweiten Prozess bereits belegt
+                print(f"Metrics endpoint could not be started on port {port}: {error}")
+                return
+
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+
+METRICS = MetricsRegistry(enabled=Config.metrics_enabled)
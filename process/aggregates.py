@@ -0,0 +1,176 @@
+from dataclasses import dataclass
+from typing import Tuple
+import pandas as pd
+import numpy as np
+
+from process.countries import canonical_country_name
+from process.processor import NormalizedMovieData
+
+
+@dataclass
+class OverviewAggregates:
+    """
+    Vorberechnete Kennzahlen für die Grafiken im Overview-Tab.
+    Sie hängen nur vom Datensatz ab und werden einmal pro Fingerabdruck berechnet,
+    sodass ein Rerun (z.B. durch die Suche oder die Spaltenauswahl) nur noch
+    die Grafiken aus diesen kleinen Tabellen zeichnet.
+
+    genre_counts: Anzahl der Filme je Genre (Spalten "Genre", "Count").
+    genre_ratings: Median IMDb-Bewertung je Genre (Spalten "Genre", "imdbRating").
+    box_office_points: Ein Punkt je Film (Spalten "Title", "BoxOffice", "imdbRating").
+    trendline: Zwei Punkte der OLS-Regressionsgeraden (Spalten "BoxOffice", "imdbRating").
+    trendline_slope / trendline_intercept: Parameter der Regressionsgeraden.
+    box_office_histogram: Klassen des Histogramms (Spalten "bin_start", "bin_end", "Count").
+    country_stats: Kennzahlen je Produktionsland (Spalten "Country", "Count",
+                   "imdbRating" als Median und "BoxOffice" als Summe in Millionen).
+    """
+
+    genre_counts: pd.DataFrame
+    genre_ratings: pd.DataFrame
+    box_office_points: pd.DataFrame
+    trendline: pd.DataFrame
+    trendline_slope: float | None
+    trendline_intercept: float | None
+    box_office_histogram: pd.DataFrame
+    country_stats: pd.DataFrame
+
+
+def _compute_trendline(
+    points: pd.DataFrame,
+) -> Tuple[pd.DataFrame, float | None, float | None]:
+    """
+    Berechnet die OLS-Regressionsgerade imdbRating ~ BoxOffice mit NumPy.
+    Das Ergebnis entspricht px.scatter(..., trendline="ols"), ohne dass die
+    Regression bei jedem Rerun neu mit statsmodels geschätzt wird.
+    """
+    valid_points = points.dropna(subset=["BoxOffice", "imdbRating"])
+
+    if len(valid_points) < 2 or valid_points["BoxOffice"].nunique() < 2:
+        return pd.DataFrame(columns=["BoxOffice", "imdbRating"]), None, None
+
+    x_values = valid_points["BoxOffice"].to_numpy(dtype="float64")
+    y_values = valid_points["imdbRating"].to_numpy(dtype="float64")
+    slope, intercept = np.polyfit(x_values, y_values, deg=1)
+
+    x_range = np.array([x_values.min(), x_values.max()])
+    trendline = pd.DataFrame(
+        {"BoxOffice": x_range, "imdbRating": slope * x_range + intercept}
+    )
+    return trendline, float(slope), float(intercept)
+
+
+def _compute_histogram(box_office: pd.Series, bin_width: float) -> pd.DataFrame:
+    """
+    Teilt die BoxOffice-Werte in Klassen mit der angegebenen Breite (in Millionen) ein.
+    """
+    values = box_office.dropna().to_numpy(dtype="float64")
+
+    if values.size == 0:
+        return pd.DataFrame(columns=["bin_start", "bin_end", "Count"])
+
+    bins = max(1, int((values.max() - values.min()) / bin_width))
+    counts, edges = np.histogram(values, bins=bins)
+
+    return pd.DataFrame(
+        {"bin_start": edges[:-1], "bin_end": edges[1:], "Count": counts}
+    )
+
+
+def _compute_country_stats(normalized_data: NormalizedMovieData) -> pd.DataFrame:
+    """
+    Berechnet die Kennzahlen je Produktionsland aus der langen Tabelle der Länder.
+    Abweichende Schreibweisen und historische Staaten werden auf das heutige Land
+    der Offline-Tabelle abgebildet (z.B. "West Germany" -> "Germany"). Ein Film
+    zählt je Land nur einmal, auch wenn er mehrere Namen desselben Landes enthält.
+    Unbekannte Namen bleiben unverändert.
+    """
+    if "Country" not in normalized_data.long_tables:
+        return pd.DataFrame(columns=["Country", "Count", "imdbRating", "BoxOffice"])
+
+    countries = normalized_data.long_tables["Country"]["Country"]
+
+    # Die Namen werden nur einmal je Kategorie aufgelöst, nicht je Zeile
+    categories = countries.cat.categories
+    canonical_names = pd.Series(
+        [canonical_country_name(country) or country for country in categories],
+        index=categories,
+    )
+
+    country_rows = pd.DataFrame(
+        {
+            "movie": countries.index.to_numpy(),
+            "Country": countries.map(canonical_names).astype(str).to_numpy(),
+        }
+    ).drop_duplicates()
+    country_rows = country_rows.join(
+        normalized_data.movies.reindex(columns=["imdbRating", "BoxOffice"]),
+        on="movie",
+    )
+
+    country_stats = (
+        country_rows.groupby("Country")
+        .agg(
+            Count=("movie", "size"),
+            imdbRating=("imdbRating", "median"),
+            BoxOffice=("BoxOffice", "sum"),
+        )
+        .round(2)
+        .reset_index()
+        .sort_values(by="Count", ascending=False, ignore_index=True)
+    )
+    return country_stats
+
+
+def compute_overview_aggregates(
+    normalized_data: NormalizedMovieData, bin_width: float = 20
+) -> OverviewAggregates:
+    """
+    Berechnet alle Kennzahlen der Overview-Grafiken aus den normalisierten Daten.
+
+    :param normalized_data: Ergebnis von DataProcessor.normalize_movie_data.
+    :param bin_width: Breite der Histogramm-Klassen in Millionen.
+    :return: OverviewAggregates mit den vorberechneten Tabellen
+    """
+    movies = normalized_data.movies
+
+    if "Genre" in normalized_data.long_tables:
+        genre_exploded = normalized_data.exploded("Genre")
+
+        genre_counts = genre_exploded["Genre"].value_counts().reset_index()
+        genre_counts.columns = ["Genre", "Count"]
+        genre_counts = genre_counts[genre_counts["Count"] > 0]
+
+        genre_ratings = (
+            genre_exploded.groupby("Genre", observed=True)["imdbRating"]
+            .median()
+            .reset_index()
+            .sort_values(by="imdbRating", ascending=False)
+        )
+    else:
+        genre_counts = pd.DataFrame(columns=["Genre", "Count"])
+        genre_ratings = pd.DataFrame(columns=["Genre", "imdbRating"])
+
+    point_columns = [
+        column
+        for column in ["Title", "BoxOffice", "imdbRating"]
+        if column in movies.columns
+    ]
+    box_office_points = movies[point_columns]
+
+    if "BoxOffice" in movies.columns and "imdbRating" in movies.columns:
+        trendline, slope, intercept = _compute_trendline(box_office_points)
+        box_office_histogram = _compute_histogram(movies["BoxOffice"], bin_width)
+    else:
+        trendline, slope, intercept = pd.DataFrame(), None, None
+        box_office_histogram = pd.DataFrame(columns=["bin_start", "bin_end", "Count"])
+
+    return OverviewAggregates(
+        genre_counts=genre_counts,
+        genre_ratings=genre_ratings,
+        box_office_points=box_office_points,
+        trendline=trendline,
+        trendline_slope=slope,
+        trendline_intercept=intercept,
+        box_office_histogram=box_office_histogram,
+        country_stats=_compute_country_stats(normalized_data),
+    )
@@ -0,0 +1,158 @@
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Callable, Dict
+
+import pandas as pd
+
+from metrics import METRICS
+from process.processor import NormalizedMovieData
+
+
+class SharedDataset:
+    """
+    Ein geladener Datensatz, der von allen Sessions gemeinsam verwendet wird.
+    Die Rohdaten und die normalisierten Daten liegen nur einmal im Speicher und
+    werden ohne Kopie an die Sessions ausgegeben, sie dürfen daher nicht verändert
+    werden. Filter erzeugen eigene Views bzw. Teilmengen (z.B. über .loc/.iloc).
+    """
+
+    def __init__(
+        self,
+        key: str,
+        movies: pd.DataFrame,
+        normalize: Callable[[pd.DataFrame], NormalizedMovieData],
+    ):
+        """
+        Konstruktor für die SharedDataset-Klasse.
+        :param key: Fingerabdruck des Datensatzes.
+        :param movies: DataFrame mit den Rohdaten der API.
+        :param normalize: Funktion, die die Rohdaten normalisiert.
+        """
+        self.key = key
+        self.movies = movies
+        self._normalize = normalize
+        self._normalized: NormalizedMovieData | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def normalized(self) -> NormalizedMovieData:
+        """
+        Die normalisierten Daten, sie werden beim ersten Zugriff einmal erstellt.
+        Greifen mehrere Sessions gleichzeitig zu, wartet die zweite auf das Ergebnis
+        der ersten.
+        """
+        if self._normalized is None:
+            with self._lock:
+                if self._normalized is None:
+                    self._normalized = self._normalize(self.movies)
+
+        return self._normalized
+
+
+class DatasetLease:
+    """
+    Referenz einer Session auf einen SharedDataset. Solange eine Lease besteht,
+    bleibt der Datensatz in der Registry. Die Lease wird mit release() freigegeben,
+    spätestens aber, wenn sie zusammen mit dem Session State gelöscht wird.
+    """
+
+    def __init__(self, registry: "DatasetRegistry", dataset: SharedDataset):
+        self.dataset = dataset
+        self._finalizer = weakref.finalize(self, registry.release, dataset.key)
+        self._finalizer.atexit = False
+
+    def release(self) -> None:
+        """Gibt die Referenz frei, mehrfaches Aufrufen hat keine Wirkung."""
+        self._finalizer()
+
+
+class DatasetRegistry:
+    """
+    Prozessweite Ablage der geladenen Datensätze. Laden mehrere Sessions dieselbe
+    Liste, erhalten alle denselben SharedDataset, statt je eine eigene Kopie zu
+    halten und die Daten erneut zu normalisieren.
+
+    Jede Session hält eine DatasetLease, die Registry zählt die Leases je
+    Datensatz. Datensätze ohne Lease bleiben noch als "inaktiv" erhalten, damit
+    ein erneutes Öffnen nicht neu normalisieren muss. Sind mehr als max_idle
+    Datensätze inaktiv, wird der am längsten ungenutzte entfernt.
+    """
+
+    def __init__(
+        self,
+        normalize: Callable[[pd.DataFrame], NormalizedMovieData],
+        max_idle: int = 4,
+    ):
+        """
+        Konstruktor für die DatasetRegistry-Klasse.
+        :param normalize: Funktion, die die Rohdaten normalisiert.
+        :param max_idle: Maximale Anzahl gehaltener Datensätze ohne Lease.
+        """
+        self.normalize = normalize
+        self.max_idle = max(0, max_idle)
+
+        self._lock = threading.Lock()
+        self._datasets: Dict[str, SharedDataset] = {}
+        self._ref_counts: Dict[str, int] = {}
+        # Datensätze ohne Lease, in der Reihenfolge ihrer Freigabe
+        self._idle: OrderedDict[str, None] = OrderedDict()
+
+    def acquire(self, key: str, movie_df: pd.DataFrame) -> DatasetLease:
+        """
+        Liefert eine Lease auf den Datensatz mit dem angegebenen Fingerabdruck.
+        Ist er bereits vorhanden, wird `movie_df` verworfen und der gemeinsame
+        Datensatz zurückgegeben.
+
+        :param key: Fingerabdruck des Datensatzes.
+        :param movie_df: DataFrame mit den Rohdaten, die Registry übernimmt es ohne Kopie.
+        :return: DatasetLease
+        """
+        with self._lock:
+            dataset = self._datasets.get(key)
+            if dataset is None:
+                dataset = SharedDataset(key, movie_df, self.normalize)
+                self._datasets[key] = dataset
+                METRICS.increment("dataset_registry_total", result="new")
+            else:
+                METRICS.increment("dataset_registry_total", result="shared")
+
+            self._ref_counts[key] = self._ref_counts.get(key, 0) + 1
+            self._idle.pop(key, None)
+
+        return DatasetLease(self, dataset)
+
+    def release(self, key: str) -> None:
+        """
+        Verringert die Anzahl der Leases eines Datensatzes. Wird von
+        DatasetLease.release aufgerufen.
+
+        :param key: Fingerabdruck des Datensatzes.
+        """
+        with self._lock:
+            ref_count = self._ref_counts.get(key, 0) - 1
+            if ref_count > 0:
+                self._ref_counts[key] = ref_count
+                return
+
+            self._ref_counts.pop(key, None)
+            if key not in self._datasets:
+                return
+
+            self._idle[key] = None
+            while len(self._idle) > self.max_idle:
+                evicted_key, _ = self._idle.popitem(last=False)
+                del self._datasets[evicted_key]
+                METRICS.increment("dataset_registry_evictions_total")
+
+    def ref_count(self, key: str) -> int:
+        with self._lock:
+            return self._ref_counts.get(key, 0)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._datasets
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._datasets)
@@ -0,0 +1,63 @@
+from pathlib import Path
+from typing import List
+import pandas as pd
+
+# Dateiendungen der unterstützten Datensatz-Formate
+DATASET_SUFFIXES = [".parquet", ".feather", ".arrow"]
+
+
+def write_movie_dataset(movie_df: pd.DataFrame, dataset_path: Path) -> None:
+    """
+    Speichert einen normalisierten Datensatz als typisierte Parquet- oder Feather-Datei.
+    Feather wird unkomprimiert geschrieben, damit die Datei beim Lesen per
+    Memory-Mapping ohne Dekodieren geöffnet werden kann.
+
+    :param movie_df: DataFrame mit den normalisierten Filmdaten.
+    :param dataset_path: Zielpfad, das Format ergibt sich aus der Dateiendung.
+    """
+    # pyarrow wird erst beim ersten Lesen oder Schreiben geladen, die Sidebar
+    # braucht beim Start nur list_movie_datasets
+    import pyarrow.feather as feather
+
+    dataset_path.parent.mkdir(parents=True, exist_ok=True)
+
+    if dataset_path.suffix == ".parquet":
+        movie_df.to_parquet(dataset_path, index=False)
+    elif dataset_path.suffix in (".feather", ".arrow"):
+        feather.write_feather(
+            movie_df.reset_index(drop=True), dataset_path, compression="uncompressed"
+        )
+    else:
+        raise ValueError(f"Unbekanntes Datensatz-Format: {dataset_path.suffix}")
+
+
+def load_movie_dataset(dataset_path: Path) -> pd.DataFrame:
+    """
+    Öffnet einen mit ingest.py erstellten Datensatz über Memory-Mapping.
+
+    :param dataset_path: Pfad der Parquet- oder Feather-Datei.
+    :return: DataFrame mit den normalisierten Filmdaten
+    """
+    import pyarrow.feather as feather
+    import pyarrow.parquet as parquet
+
+    if dataset_path.suffix == ".parquet":
+        table = parquet.read_table(dataset_path, memory_map=True)
+    else:
+        table = feather.read_table(dataset_path, memory_map=True)
+
+    return table.to_pandas()
+
+
+def list_movie_datasets(dataset_folder: Path) -> List[Path]:
+    """
+    Listet alle vorbereiteten Datensätze im angegebenen Ordner auf.
+    :param dataset_folder: Ordner mit den Datensätzen.
+    :return: Sortierte Liste der Dateipfade
+    """
+    if not dataset_folder.exists():
+        return []
+
+    return sorted(
+        path for path in dataset_folder.iterdir() if path.suffix in DATASET_SUFFIXES
+    )
@@ -0,0 +1,330 @@
+"""
+Lädt die Filmdaten im Hintergrund, damit der Streamlit-Skript-Thread nicht für
+die Dauer der API-Anfragen blockiert wird.
+
+Jeder Job wird über den Hash seiner Eingabe (Filmliste, Datei oder Suche) identifiziert.
+Senden mehrere Sessions dieselbe Liste, erhalten alle denselben Job und lesen
+dessen Zwischenstand, statt die Filme ein weiteres Mal zu laden.
+"""
+
+import dataclasses
+import hashlib
+import io
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Dict, List, Tuple
+
+import pandas as pd
+
+from api.omdb import OmdbApiHandler
+from metrics import METRICS
+from process.movie_list import iter_movie_list_chunks
+from process.processor import DataProcessor
+
+
+@dataclass(frozen=True)
+class MovieLoadRequest:
+    """
+    Eingabe eines Lade-Jobs: eine Filmliste, eine hochgeladene Datei oder eine
+    OMDb-Suche. Eine Datei wird erst im Job gelesen (siehe iter_movie_list_chunks).
+    """
+
+    movie_list: Tuple[str, ...] = ()
+    search_term: str = ""
+    search_type: str | None = None
+    search_year: str | None = None
+    movie_file: bytes | None = field(default=None, repr=False, compare=False)
+    file_name: str = ""
+
+    @cached_property
+    def key(self) -> str:
+        """Hash der Eingabe, dieselbe Liste bzw. Suche ergibt denselben Job."""
+        if self.movie_file is not None:
+            digest = hashlib.sha1(self.file_name.encode() + b"\x1f")
+            digest.update(self.movie_file)
+            return digest.hexdigest()
+
+        if self.search_term:
+            parts = [
+                "search",
+                self.search_term.strip().casefold(),
+                self.search_type or "",
+                self.search_year or "",
+            ]
+        else:
+            parts = ["list", *self.movie_list]
+
+        return hashlib.sha1("\x1f".join(parts).encode()).hexdigest()
+
+
+class MovieLoadJob:
+    """
+    Zustand eines Lade-Jobs. Der Worker-Thread hängt die geladenen Blöcke an,
+    die Sessions lesen Fortschritt und Zwischenstand über progress() und
+    movie_data. Das DataFrame wird ohne Kopie ausgegeben und darf nicht
+    verändert werden.
+    """
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+    def __init__(self, request: MovieLoadRequest):
+        """
+        Konstruktor für die MovieLoadJob-Klasse.
+        :param request: Eingabe des Jobs.
+        """
+        self.request = request
+        self.key = request.key
+        self.status = self.PENDING
+        # Nur die Länge der Liste wird gebraucht, die Titel selbst liegen im
+        # Request bzw. in der hochgeladenen Datei
+        self.movie_count = len(request.movie_list)
+        self.processed_count = 0
+        self.error: str | None = None
+        # Ob die OMDb API am Ende des Jobs nicht erreichbar war (Circuit Breaker offen)
+        self.api_unavailable = False
+        self.submitted_at = time.monotonic()
+
+        self._lock = threading.Lock()
+        self._movie_data_frames: List[pd.DataFrame] = []
+        self._movie_data_df = pd.DataFrame()
+        self._concatenated_count = 0
+        self._stop_event = threading.Event()
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (self.DONE, self.FAILED)
+
+    @property
+    def is_stopped(self) -> bool:
+        """Ob der Job vorzeitig beendet werden soll (siehe MovieLoadQueue.shutdown)."""
+        return self._stop_event.is_set()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+    def progress(self) -> Tuple[str, int, int]:
+        """
+        :return: Tuple aus Status, Anzahl verarbeiteter Titel und Länge der Liste
+        """
+        with self._lock:
+            return self.status, self.processed_count, self.movie_count
+
+    @property
+    def movie_data(self) -> pd.DataFrame:
+        """
+        Die bisher geladenen Filmdaten. Die Blöcke werden nur zusammengeführt,
+        wenn seit dem letzten Aufruf neue hinzugekommen sind.
+        """
+        with self._lock:
+            if self._concatenated_count != len(self._movie_data_frames):
+                self._movie_data_df = pd.concat(
+                    self._movie_data_frames, ignore_index=True
+                )
+                self._concatenated_count = len(self._movie_data_frames)
+
+            return self._movie_data_df
+
+    def start(self, movie_count: int) -> None:
+        with self._lock:
+            self.status = self.RUNNING
+            self.movie_count = movie_count
+
+    def extend_movie_count(self, movie_count: int) -> None:
+        """Erhöht die Länge der Liste, während eine hochgeladene Datei gelesen wird."""
+        with self._lock:
+            self.movie_count += movie_count
+
+    def add_chunk(
+        self, processed_count: int, movie_data_df: pd.DataFrame | None
+    ) -> None:
+        """
+        Übernimmt einen geladenen Block.
+        :param processed_count: Anzahl der bisher verarbeiteten Titel.
+        :param movie_data_df: Die gefundenen Filme des Blocks oder None.
+        """
+        with self._lock:
+            self.processed_count = processed_count
+            if movie_data_df is not None and not movie_data_df.empty:
+                self._movie_data_frames.append(movie_data_df)
+
+    def finish(self, api_unavailable: bool, error: Exception | None = None) -> None:
+        # Das Ergebnis wird einmal zusammengeführt, die einzelnen Blöcke werden
+        # danach nicht mehr gebraucht
+        movie_data_df = self.movie_data
+
+        with self._lock:
+            self._movie_data_frames = [movie_data_df] if not movie_data_df.empty else []
+            self._concatenated_count = len(self._movie_data_frames)
+            self.api_unavailable = api_unavailable
+            self.error = str(error) if error is not None else None
+            self.status = self.FAILED if error is not None else self.DONE
+
+
+class MovieLoadQueue:
+    """
+    Prozessweite Warteschlange der Lade-Jobs. Die Jobs laufen in einem
+    Thread-Pool mit `max_workers` gleichzeitigen Jobs, weitere warten als
+    PENDING. Fertige Jobs bleiben für später beitretende Sessions erhalten,
+    sind mehr als `max_finished` fertig, wird der älteste entfernt.
+    """
+
+    def __init__(
+        self, api: OmdbApiHandler, max_workers: int = 2, max_finished: int = 4
+    ):
+        """
+        Konstruktor für die MovieLoadQueue-Klasse.
+        :param api: Gemeinsamer OmdbApiHandler für alle Jobs.
+        :param max_workers: Maximale Anzahl gleichzeitig laufender Jobs.
+        :param max_finished: Maximale Anzahl gehaltener, fertiger Jobs.
+        """
+        self.api = api
+        self.max_finished = max(0, max_finished)
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="movie-load"
+        )
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, MovieLoadJob] = {}
+        # Fertige Jobs in der Reihenfolge ihres Abschlusses
+        self._finished: OrderedDict[str, None] = OrderedDict()
+
+    def submit(self, request: MovieLoadRequest) -> MovieLoadJob:
+        """
+        Reiht einen Job ein und kehrt sofort zurück. Läuft bereits ein Job mit
+        derselben Eingabe oder ist er erfolgreich beendet, wird dieser geliefert.
+        Fehlgeschlagene Jobs und Jobs, bei denen die API nicht erreichbar war,
+        werden neu gestartet.
+
+        :param request: Eingabe des Jobs.
+        :return: MovieLoadJob
+        """
+        with self._lock:
+            job = self._jobs.get(request.key)
+            if job is not None and not (
+                job.status == MovieLoadJob.FAILED or job.api_unavailable
+            ):
+                METRICS.increment("load_jobs_total", result="joined")
+                return job
+
+            job = MovieLoadJob(request)
+            self._jobs[job.key] = job
+            self._finished.pop(job.key, None)
+            METRICS.increment("load_jobs_total", result="new")
+
+        self._executor.submit(self._run, job)
+        return job
+
+    def get(self, key: str) -> MovieLoadJob | None:
+        with self._lock:
+            return self._jobs.get(key)
+
+    def shutdown(self) -> None:
+        """Beendet alle Jobs nach dem aktuellen Block und wartet nicht auf sie."""
+        with self._lock:
+            for job in self._jobs.values():
+                job.stop()
+
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _should_stop(self, job: MovieLoadJob) -> bool:
+        # Beim Beenden des Prozesses soll ein laufender Job das Herunterfahren
+        # nicht bis zum Ende der Liste aufhalten
+        return job.is_stopped or not threading.main_thread().is_alive()
+
+    def _load_movie_chunk(
+        self, job: MovieLoadJob, movie_list: List[str], processed_offset: int = 0
+    ) -> None:
+        for processed_count, movie_data_chunk in self.api.iter_movie_info_chunks(
+            movie_title_list=movie_list
+        ):
+            # Die Ratings-Liste wird vor dem Erstellen des DataFrames aufgelöst
+            job.add_chunk(
+                processed_offset + processed_count,
+                (
+                    pd.DataFrame(DataProcessor.process_ratings_list(movie_data_chunk))
+                    if movie_data_chunk
+                    else None
+                ),
+            )
+
+            if self._should_stop(job):
+                break
+
+    def _load_movie_file(self, job: MovieLoadJob) -> None:
+        """
+        Liest die hochgeladene Datei blockweise und lädt die Filme jedes Blocks,
+        bevor der nächste gelesen wird. Die Länge der Liste wächst dabei mit.
+        """
+        request = job.request
+        max_list_length = self.api.config.max_movie_list_length
+        job.start(0)
+
+        for movie_chunk in iter_movie_list_chunks(
+            io.BytesIO(request.movie_file), file_name=request.file_name
+        ):
+            processed_offset = job.movie_count
+            if max_list_length:
+                movie_chunk = movie_chunk[: max_list_length - processed_offset]
+
+            job.extend_movie_count(len(movie_chunk))
+            self._load_movie_chunk(job, movie_chunk, processed_offset)
+
+            if self._should_stop(job) or (
+                max_list_length and job.movie_count >= max_list_length
+            ):
+                break
+
+        # Die Datei wird nach dem Lesen nicht mehr gebraucht und soll nicht mit
+        # dem fertigen Job im Speicher bleiben
+        job.request = dataclasses.replace(request, movie_file=None)
+
+    def _load_movies(self, job: MovieLoadJob) -> None:
+        request = job.request
+
+        if request.movie_file is not None:
+            self._load_movie_file(job)
+            return
+
+        if request.search_term:
+            movie_list = self.api.search_movie_list(
+                request.search_term,
+                media_type=request.search_type,
+                year=request.search_year,
+            )
+        else:
+            movie_list = list(request.movie_list)
+
+        # Optional kann die Liste über die Config begrenzt werden, um beim
+        # Testen das Überschreiten der API-Limits zu verhindern
+        max_list_length = self.api.config.max_movie_list_length
+        if max_list_length and len(movie_list) > max_list_length:
+            movie_list = movie_list[0:max_list_length]
+
+        job.start(len(movie_list))
+        self._load_movie_chunk(job, movie_list)
+
+    def _run(self, job: MovieLoadJob) -> None:
+        error = None
+
+        try:
+            with METRICS.span("load_job"):
+                self._load_movies(job)
+        except Exception as exception:
+            print(f"Loading job {job.key} failed: {exception}")
+            METRICS.increment("load_job_errors_total", error=type(exception).__name__)
+            error = exception
+
+        job.finish(api_unavailable=self.api.circuit_breaker.is_open, error=error)
+
+        with self._lock:
+            self._finished[job.key] = None
+            while len(self._finished) > self.max_finished:
+                evicted_key, _ = self._finished.popitem(last=False)
+                self._jobs.pop(evicted_key, None)
@@ -0,0 +1,145 @@
+from typing import Iterator, List
+import pandas as pd
+
+# Spalten eines IMDb-Exports, die für die Filmliste gebraucht werden. Alle
+# anderen Spalten (Beschreibung, URL, Genres, ...) werden beim Lesen übersprungen.
+MOVIE_LIST_COLUMNS = ["Const", "Title", "Year"]
+# Größe der Blöcke, in denen eine CSV-Datei gelesen wird (in Bytes). Der
+# pyarrow-Reader liest mehrere Blöcke voraus, der Speicherbedarf beim Lesen
+# beträgt daher ein Vielfaches davon.
+CSV_BLOCK_SIZE = 1024 * 1024
+# Anzahl der Zeilen, die aus einer XLSX-Datei jeweils zusammengefasst werden
+XLSX_CHUNK_ROWS = 50_000
+
+
+def _iter_csv_chunks(movie_file) -> Iterator[pd.DataFrame]:
+    """
+    Liest die benötigten Spalten einer CSV-Datei blockweise mit dem
+    pyarrow-CSV-Reader. Fehlende Spalten werden als leere Spalten ergänzt.
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+
+    reader = pa_csv.open_csv(
+        movie_file,
+        read_options=pa_csv.ReadOptions(block_size=CSV_BLOCK_SIZE),
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=MOVIE_LIST_COLUMNS,
+            include_missing_columns=True,
+            column_types={column: pa.string() for column in MOVIE_LIST_COLUMNS},
+        ),
+    )
+
+    for record_batch in reader:
+        yield record_batch.to_pandas()
+
+
+def _iter_xlsx_chunks(movie_file) -> Iterator[pd.DataFrame]:
+    """
+    Liest die benötigten Spalten einer XLSX-Datei zeilenweise im read-only-Modus
+    von openpyxl, ohne das ganze Tabellenblatt in den Speicher zu laden.
+    """
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(movie_file, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = next(rows, None) or ()
+        column_positions = [
+            (column, list(header).index(column))
+            for column in MOVIE_LIST_COLUMNS
+            if column in header
+        ]
+
+        chunk_rows = []
+        for row in rows:
+            chunk_rows.append(
+                {
+                    column: row[position] if position < len(row) else None
+                    for column, position in column_positions
+                }
+            )
+
+            if len(chunk_rows) >= XLSX_CHUNK_ROWS:
+                yield pd.DataFrame(chunk_rows, columns=MOVIE_LIST_COLUMNS)
+                chunk_rows = []
+
+        if chunk_rows:
+            yield pd.DataFrame(chunk_rows, columns=MOVIE_LIST_COLUMNS)
+    finally:
+        workbook.close()
+
+
+def _movie_keys(chunk_df: pd.DataFrame) -> pd.Series:
+    """
+    Ermittelt für jede Zeile eines Blocks den Eintrag der Filmliste: die imdbID
+    aus "Const", sonst den Titel mit angehängtem Jahr wie in "Dune (2021)".
+    Zeilen ohne ID und Titel werden verworfen.
+    """
+    chunk_df = chunk_df.astype("string")
+
+    titles = chunk_df["Title"].str.strip()
+    titles = titles.where(titles != "")
+    years = chunk_df["Year"].str.extract(r"^\s*(\d{4})", expand=False)
+    titles = titles.where(years.isna(), titles + " (" + years + ")")
+
+    # IMDb-Exporte enthalten die imdbID in der Spalte "Const". Die ID ist
+    # eindeutig, fehlt sie in einer Zeile, wird stattdessen der Titel verwendet
+    movie_ids = chunk_df["Const"].str.strip()
+    movie_keys = movie_ids.where(movie_ids.str.match(r"^tt\d+$", na=False), titles)
+
+    return movie_keys.dropna()
+
+
+def iter_movie_list_chunks(movie_file, file_name: str) -> Iterator[List[str]]:
+    """
+    Liest eine Filmliste (z.B. einen IMDb-Export) blockweise aus einer CSV- oder
+    XLSX-Datei. Es werden nur die Spalten "Const", "Title" und "Year" gelesen,
+    sodass auch sehr große Exporte mit gleichbleibendem Speicherbedarf verarbeitet
+    werden. Einträge, die bereits in einem früheren Block vorkamen, werden
+    übersprungen.
+
+    :param movie_file: Pfad oder Datei-Objekt (z.B. ein Streamlit-Upload).
+    :param file_name: Dateiname, anhand dessen Endung das Format erkannt wird.
+    :return: Ein Iterator über die neuen imdbIDs bzw. Titel je Block
+    """
+    # Datei basierend auf dem Dateityp lesen
+    if file_name.endswith(".csv"):
+        chunks = _iter_csv_chunks(movie_file)
+
+    elif file_name.endswith(".xlsx"):
+        chunks = _iter_xlsx_chunks(movie_file)
+
+    else:
+        # Unbekanntes Format: die Filmliste bleibt leer
+        return
+
+    seen_keys = set()
+
+    for chunk_df in chunks:
+        new_keys = []
+
+        for movie_key in _movie_keys(chunk_df):
+            if movie_key not in seen_keys:
+                seen_keys.add(movie_key)
+                new_keys.append(movie_key)
+
+        if new_keys:
+            yield new_keys
+
+
+def read_movie_list(movie_file, file_name: str) -> List[str]:
+    """
+    Liest eine Filmliste (z.B. einen IMDb-Export) aus einer CSV- oder XLSX-Datei.
+    Enthält die Datei die IMDb-Spalte "Const", werden die eindeutigen imdbIDs statt
+    der Titel verwendet (siehe iter_movie_list_chunks).
+
+    :param movie_file: Pfad oder Datei-Objekt (z.B. ein Streamlit-Upload).
+    :param file_name: Dateiname, anhand dessen Endung das Format erkannt wird.
+    :return: Liste der Filmtitel bzw. imdbIDs ohne Duplikate.
+    """
+    return [
+        movie_key
+        for movie_chunk in iter_movie_list_chunks(movie_file, file_name=file_name)
+        for movie_key in movie_chunk
+    ]
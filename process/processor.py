@@ -1,12 +1,48 @@
+import hashlib
 import json
-import time
-from typing import List, Tuple
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
 import pandas as pd
 import numpy as np
 
-from pyphoton import Photon
-
 from config import Config
+from metrics import METRICS
+from process.countries import lookup_country_centroid
+
+
+# Spalten der OMDb API, die mehrere durch Kommas getrennte Werte enthalten
+MULTI_VALUE_COLUMNS = ["Genre", "Country", "Actors", "Director", "Writer", "Language"]
+
+
+@dataclass
+class NormalizedMovieData:
+    """
+    Ergebnis der einmaligen Normalisierung eines Datensatzes.
+
+    movies: Eine Zeile je Film mit typisierten Spalten (float32, Int32, datetime64, category).
+    long_tables: Je mehrwertiger Spalte eine lange Tabelle mit einer Zeile je Wert.
+                 Der Index verweist auf die Zeile des Films in `movies`.
+    """
+
+    movies: pd.DataFrame
+    long_tables: Dict[str, pd.DataFrame] = field(default_factory=dict)
+
+    def exploded(self, column_name: str) -> pd.DataFrame:
+        """
+        Liefert die Filme mit einer Zeile je Wert der angegebenen mehrwertigen Spalte,
+        wie `DataFrame.explode`, aber ohne die Werte erneut zu parsen.
+        :param column_name: Name der mehrwertigen Spalte, z.B. "Genre".
+        :return: DataFrame mit einer Zeile je (Film, Wert)
+        """
+        if column_name not in self.long_tables:
+            return self.movies
+
+        return self.movies.drop(columns=[column_name]).join(
+            self.long_tables[column_name], how="left"
+        )
 
 
 class DataProcessor:
@@ -21,26 +57,58 @@ class DataProcessor:
             "location.cache.json"
         )
 
-        self.geo_locator = Photon()
-
         self.features_list = features_list
 
-        self._load_cached_locations()
+        # Photon-Client und Cache-Datei werden erst bei der ersten Abfrage von
+        # Koordinaten geladen, damit der Start der App nicht darauf wartet
+        self._geo_locator = None
+        self._geocache: Dict[str, List[float]] | None = None
+        # Der DataProcessor wird von allen Sessions geteilt, der Cache wird nur
+        # unter diesem Lock gelesen, ergänzt und geschrieben
+        self._geocache_lock = threading.Lock()
+
+    @property
+    def geo_locator(self):
+        """Der Photon-Client, er wird beim ersten Zugriff erstellt."""
+        if self._geo_locator is None:
+            from pyphoton import Photon
+
+            self._geo_locator = Photon()
+
+        return self._geo_locator
+
+    @property
+    def geocache(self) -> Dict[str, List[float]]:
+        """Kopie der gecachten Koordinaten, die Datei wird beim ersten Zugriff gelesen."""
+        with self._geocache_lock:
+            return dict(self._loaded_geocache())
+
+    def _loaded_geocache(self) -> Dict[str, List[float]]:
+        # Nur mit gehaltenem self._geocache_lock aufrufen
+        if self._geocache is None:
+            self._load_cached_locations()
+
+        return self._geocache
 
     def _load_cached_locations(self):
-        self.geocache = {}
+        self._geocache = {}
 
         if self.cache_file_path.exists():
             with open(self.cache_file_path, "r") as file:
                 try:
-                    self.geocache = json.loads(file.read())
+                    self._geocache = json.loads(file.read())
 
                 except json.JSONDecodeError:
                     print("Could not read cache file")
 
     def _update_cached_locations(self):
-        with open(self.cache_file_path, "w") as file:
-            file.write(json.dumps(self.geocache))
+        # Nur mit gehaltenem self._geocache_lock aufrufen. Die Datei wird über eine
+        # temporäre Datei ersetzt, damit sie nie halb geschrieben gelesen wird.
+        self.cache_file_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = self.cache_file_path.with_suffix(".json.tmp")
+        with open(temporary_path, "w") as file:
+            file.write(json.dumps(self._geocache))
+        os.replace(temporary_path, self.cache_file_path)
 
     def invalidate_cached_locations(self):
         self.cache_file_path.unlink()
@@ -106,26 +174,68 @@ class DataProcessor:
             return df
 
     @staticmethod
+    @METRICS.timed("process_ratings_list")
     def process_ratings_list(movie_list: List[dict]) -> List[dict]:
         """
         Verarbeitet die Bewertungen der Filme.
         Die Bewertungen sind in einer einzelnen Liste mit einem Dictionary je Bewertung
-        im Filmdaten-Dictionary hinterlegt.
-        Diese Funktion hebt alle Bewertungen als eigenes key-value-pair auf die oberste Ebene.
+        ({"Source": ..., "Value": ...}) im Filmdaten-Dictionary hinterlegt.
+        Diese Funktion hebt alle Bewertungen als eigene numerische Spalte
+        "<Source> Rating" auf die oberste Ebene, z.B. "Rotten Tomatoes Rating" (Prozent),
+        "Metacritic Rating" (von 100) und "Internet Movie Database Rating" (von 10).
+
+        Die Texte werden zuerst je Quelle gesammelt und danach für alle Filme
+        gemeinsam vektorisiert in Zahlen umgewandelt. Die Dictionaries der
+        Eingabe werden nicht verändert, da sie auch im Cache liegen können.
 
         :param movie_list: Liste von Filmdaten.
         :return: Liste von Filmdaten mit verarbeiteten Bewertungen.
         """
-        for movie in movie_list:
-            if "Ratings" in movie.keys() and isinstance(movie["Ratings"], list):
-                movie.update(
-                    {
-                        str(key) + " Rating": value
-                        for key, value in movie["Ratings"].items()
-                    }
-                )
-                del movie["Ratings"]
-        return movie_list
+        movie_count = len(movie_list)
+        METRICS.increment(
+            "rows_processed_total", movie_count, stage="process_ratings_list"
+        )
+        rating_values = {}
+
+        # 1. Durchlauf: die Bewertungstexte je Quelle einsammeln
+        for position, movie in enumerate(movie_list):
+            ratings = movie.get("Ratings")
+
+            if not isinstance(ratings, list):
+                continue
+
+            for rating in ratings:
+                if not isinstance(rating, dict) or "Source" not in rating:
+                    continue
+
+                source = str(rating["Source"])
+                if source not in rating_values:
+                    rating_values[source] = [None] * movie_count
+                rating_values[source][position] = rating.get("Value")
+
+        # Vektorisierte Umwandlung: "7.8/10" -> 7.8, "87%" -> 87.0, "74/100" -> 74.0
+        rating_columns = {
+            source + " Rating": pd.to_numeric(
+                pd.Series(values, dtype=object).str.extract(
+                    r"^\s*(\d+(?:\.\d+)?)", expand=False
+                ),
+                errors="coerce",
+            ).tolist()
+            for source, values in rating_values.items()
+        }
+
+        # 2. Durchlauf: neue Dictionaries ohne die verschachtelte "Ratings"-Liste
+        processed_movie_list = []
+        for position, movie in enumerate(movie_list):
+            processed_movie = {
+                key: value for key, value in movie.items() if key != "Ratings"
+            }
+            for column_name, values in rating_columns.items():
+                processed_movie[column_name] = values[position]
+
+            processed_movie_list.append(processed_movie)
+
+        return processed_movie_list
 
     @staticmethod
     def clean_int_values(movie_df: pd.DataFrame) -> pd.DataFrame:
@@ -161,27 +271,230 @@ class DataProcessor:
 
         return movie_df
 
-    def get_coordinates(self, country: str) -> Tuple[None | int, None | int]:
+    @staticmethod
+    def dataset_fingerprint(movie_df: pd.DataFrame) -> str:
         """
-        Für das Land werden die Koordinaten über die API ermittelt.
-        Ein dictionary als Instanzvariable dient als eigener Cache, um
-        wiederholte API-Aufrufe für dasselbe Land zu verhindern.
-        :param country:
-        :return: Ein Tuple mit den Lat und Lon Werten des Landes
+        Berechnet einen kurzen Fingerabdruck eines Datensatzes aus seinen Spalten
+        und allen Werten. Er dient als Cache-Schlüssel für alle Ergebnisse, die nur
+        vom Datensatz abhängen. Neu geladene Filme mit denselben imdbIDs, aber
+        geänderten Daten (z.B. nach einer Revalidierung) ergeben einen neuen Schlüssel.
+        :param movie_df: DataFrame mit den Filmdaten.
+        :return: Hex-String des Fingerabdrucks
         """
-        # Nur wenn das Land nicht bereits im Cache ist, wird eine API Anfrage ausgesendet.
-        if country not in self.geocache:
-            try:
-                location = self.geo_locator.query(
-                    country, limit=1, osm_tags=["place:country"]
+        digest = hashlib.sha1()
+        digest.update("\x1f".join(map(str, movie_df.columns)).encode())
+
+        for position in range(movie_df.shape[1]):
+            column = movie_df.iloc[:, position]
+
+            if column.dtype == object:
+                # Listen und Dictionaries (z.B. "Ratings") sind nicht hashbar und
+                # werden als Text gehasht
+                column = column.map(
+                    lambda value: (
+                        str(value)
+                        if isinstance(value, (list, tuple, set, dict, np.ndarray))
+                        else value
+                    )
                 )
-                time.sleep(0.1)
 
-                if location:
-                    self.geocache[country] = (location.latitude, location.longitude)
-                    self._update_cached_locations()
+            digest.update(
+                pd.util.hash_pandas_object(column, index=False).to_numpy().tobytes()
+            )
+
+        return digest.hexdigest()
+
+    @staticmethod
+    def _to_number(series: pd.Series, pattern: str = r"[$,]") -> pd.Series:
+        """
+        Wandelt als Text gespeicherte Zahlen ("$1,234", "N/A") vektorisiert in Zahlen um.
+        Nicht lesbare Werte werden zu NaN.
+        """
+        return pd.to_numeric(
+            series.astype(str).str.replace(pattern, "", regex=True), errors="coerce"
+        )
 
-            except Exception as e:
-                print(f"Fehler beim Abrufen der Koordinaten für {country}: {e}")
+    @staticmethod
+    @METRICS.timed("normalize_movie_data")
+    def normalize_movie_data(movie_df: pd.DataFrame) -> NormalizedMovieData:
+        """
+        Normalisiert die Rohdaten der API in einem einzigen Durchlauf.
+        Alle Umwandlungen sind vektorisierte pandas-Operationen und müssen nur
+        einmal pro Datensatz ausgeführt werden:
+          - BoxOffice (in Millionen) und imdbRating als float32,
+          - imdbVotes, Metascore, Year und Runtime (RuntimeMinutes) als Int32,
+          - Released als datetime64 (ReleasedDate),
+          - Rated und Type als category,
+          - die mehrwertigen Spalten (Genre, Country, Actors, ...) als lange Tabellen.
+        Wie in clean_int_values werden Filme ohne imdbRating entfernt.
+
+        :param movie_df: DataFrame mit den Rohdaten der API.
+        :return: NormalizedMovieData mit den typisierten Filmdaten und den langen Tabellen
+        """
+        METRICS.increment(
+            "rows_processed_total", len(movie_df), stage="normalize_movie_data"
+        )
+        movies = movie_df.reset_index(drop=True).copy()
+
+        if movies.empty:
+            return NormalizedMovieData(movies=movies)
+
+        # Bereits normalisierte Spalten (z.B. aus einem mit ingest.py erstellten
+        # Datensatz) sind numerisch und werden nicht erneut umgewandelt
+        def is_text(column_name: str) -> bool:
+            return column_name in movies.columns and not pd.api.types.is_numeric_dtype(
+                movies[column_name]
+            )
+
+        if is_text("BoxOffice"):
+            # Werte in Millionen umwandeln
+            movies["BoxOffice"] = (
+                (DataProcessor._to_number(movies["BoxOffice"]) / 1_000_000)
+                .round(2)
+                .astype("float32")
+            )
+
+        if is_text("imdbRating"):
+            movies["imdbRating"] = DataProcessor._to_number(
+                movies["imdbRating"]
+            ).astype("float32")
+
+        if "imdbRating" in movies.columns:
+            # Zeilen mit NaN-Werten in der 'imdbRating' Spalte werden entfernt
+            movies = movies[movies["imdbRating"].notna()].reset_index(drop=True)
+
+        # Die Spalten aus process_ratings_list sind bereits numerisch
+        for column_name in movies.columns[movies.columns.str.endswith(" Rating")]:
+            movies[column_name] = movies[column_name].astype("float32")
+
+        for column_name in ["imdbVotes", "Metascore"]:
+            if is_text(column_name):
+                movies[column_name] = DataProcessor._to_number(
+                    movies[column_name]
+                ).astype("Int32")
+
+        if is_text("Year"):
+            # Serien haben Zeiträume wie "2011–2019", verwendet wird das erste Jahr
+            movies["Year"] = pd.to_numeric(
+                movies["Year"].astype(str).str.extract(r"(\d{4})", expand=False),
+                errors="coerce",
+            ).astype("Int32")
+
+        if "Runtime" in movies.columns:
+            movies["RuntimeMinutes"] = pd.to_numeric(
+                movies["Runtime"].astype(str).str.extract(r"(\d+)", expand=False),
+                errors="coerce",
+            ).astype("Int32")
+
+        if "Released" in movies.columns:
+            movies["ReleasedDate"] = pd.to_datetime(
+                movies["Released"], format="%d %b %Y", errors="coerce"
+            )
+
+        for column_name in ["Rated", "Type"]:
+            if column_name in movies.columns:
+                movies[column_name] = movies[column_name].astype("category")
+
+        long_tables = {}
+        for column_name in MULTI_VALUE_COLUMNS:
+            if column_name not in movies.columns:
+                continue
+
+            values = (
+                movies[column_name]
+                .where(movies[column_name] != "N/A")
+                .str.split(",")
+                .explode()
+                .str.strip()
+            )
+            values = values[values.notna() & (values != "")]
+            long_tables[column_name] = values.astype("category").to_frame(column_name)
+
+        return NormalizedMovieData(movies=movies, long_tables=long_tables)
+
+    def _query_photon(self, country: str) -> Tuple[float, float] | None:
+        """
+        Fragt die Koordinaten eines Landes bei der Photon API an.
+        :param country: Ländername.
+        :return: Ein Tuple mit den Lat und Lon Werten oder None
+        """
+        try:
+            location = self.geo_locator.query(
+                country, limit=1, osm_tags=["place:country"]
+            )
 
-        return self.geocache.get(country, (None, None))
+            if location:
+                METRICS.increment("photon_requests_total", status="found")
+                return location.latitude, location.longitude
+
+            METRICS.increment("photon_requests_total", status="not_found")
+
+        except Exception as e:
+            METRICS.increment("photon_requests_total", status="error")
+            METRICS.increment("photon_errors_total", error=type(e).__name__)
+
+        return None
+
+    def get_coordinates_batch(
+        self, country_list: List[str]
+    ) -> Dict[str, Tuple[None | float, None | float]]:
+        """
+        Ermittelt die Koordinaten für mehrere Länder auf einmal.
+        Die Länder werden zuerst in der mitgelieferten Offline-Tabelle
+        (process/countries.py) und im eigenen Cache gesucht. Nur unbekannte
+        Namen werden parallel bei der Photon API angefragt, danach wird die
+        Cache-Datei einmal geschrieben.
+        :param country_list: Liste an Ländernamen (Duplikate sind erlaubt).
+        :return: Ein Dictionary mit dem Ländernamen als key und einem Tuple
+                 der Lat und Lon Werte als value
+        """
+        coordinates = {}
+        unknown_countries = []
+        geocache = self.geocache
+
+        for country in dict.fromkeys(country_list):
+            centroid = lookup_country_centroid(country)
+
+            if centroid is not None:
+                coordinates[country] = centroid
+                METRICS.increment("cache_requests_total", cache="geo", result="table")
+            elif country in geocache:
+                coordinates[country] = tuple(geocache[country])
+                METRICS.increment("cache_requests_total", cache="geo", result="hit")
+            elif isinstance(country, str) and country:
+                unknown_countries.append(country)
+                METRICS.increment("cache_requests_total", cache="geo", result="miss")
+
+        if unknown_countries:
+            with METRICS.span("photon_batch"), ThreadPoolExecutor(
+                max_workers=self.config.geo_max_workers
+            ) as executor:
+                locations = list(executor.map(self._query_photon, unknown_countries))
+
+            # Andere Sessions können den Cache gleichzeitig ergänzen, ergänzt und
+            # geschrieben wird deshalb unter dem Lock
+            with self._geocache_lock:
+                geocache = self._loaded_geocache()
+                for country, location in zip(unknown_countries, locations):
+                    if location:
+                        geocache[country] = location
+                        coordinates[country] = location
+
+                self._update_cached_locations()
+
+        return {
+            country: coordinates.get(country, (None, None))
+            for country in dict.fromkeys(country_list)
+        }
+
+    def get_coordinates(self, country: str) -> Tuple[None | float, None | float]:
+        """
+        Für das Land werden die Koordinaten ermittelt. Bekannte Länder kommen
+        direkt aus der Offline-Tabelle, nur für unbekannte Namen wird die
+        Photon API angefragt.
+        Ein dictionary als Instanzvariable dient als eigener Cache, um
+        wiederholte API-Aufrufe für dasselbe Land zu verhindern.
+        :param country:
+        :return: Ein Tuple mit den Lat und Lon Werten des Landes
+        """
+        return self.get_coordinates_batch([country])[country]
@@ -0,0 +1,146 @@
+import re
+from bisect import bisect_left
+from typing import Dict, List
+import pandas as pd
+import numpy as np
+
+import unicodedata
+
+# Ein Token ist eine zusammenhängende Folge von Buchstaben oder Ziffern
+TOKEN_PATTERN = r"\w+"
+# Akzente, die nach der NFKD-Zerlegung als eigene Zeichen übrig bleiben
+ACCENT_PATTERN = r"[\u0300-\u036f]"
+
+
+def _as_text(series: pd.Series) -> pd.Series:
+    """
+    Wandelt eine Spalte in Text um. Listen (z.B. nach explode_column) werden
+    zusammengefügt, fehlende Werte werden zu leeren Texten.
+    """
+    return (
+        series.apply(
+            lambda value: (
+                ", ".join(map(str, value)) if isinstance(value, list) else value
+            )
+        )
+        .fillna("")
+        .astype(str)
+    )
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Zerlegt einen Suchtext in normalisierte Tokens (Kleinschreibung, ohne Akzente).
+    :param text: Suchtext, z.B. "Tom Han".
+    :return: Liste der Tokens, z.B. ["tom", "han"]
+    """
+    text = re.sub(ACCENT_PATTERN, "", unicodedata.normalize("NFKD", text.casefold()))
+    return re.findall(TOKEN_PATTERN, text)
+
+
+class MovieSearchIndex:
+    """
+    Invertierter Index für die Textsuche im Overview-Tab.
+    Beim Laden des Datensatzes werden alle Texte einmal in Tokens zerlegt und
+    für jedes Token die Zeilennummern der Filme gespeichert, in denen es vorkommt.
+    Eine Suche ist danach nur noch eine Schnittmenge der Zeilennummern aller
+    Such-Tokens. Jedes Such-Token wird als Präfix behandelt, "tom han" findet
+    also auch "Tom Hanks".
+    """
+
+    def __init__(self, movie_df: pd.DataFrame, column_name_list: List[str]):
+        """
+        Konstruktor für die MovieSearchIndex-Klasse.
+        :param movie_df: DataFrame mit den Filmdaten. Die Zeilennummern der
+                         Suchergebnisse beziehen sich auf die Position in diesem DataFrame.
+        :param column_name_list: Spalten, die durchsucht werden sollen (Text oder Listen).
+        """
+        self.row_count = len(movie_df)
+
+        token_series_list = []
+        for column_name in column_name_list:
+            if column_name not in movie_df.columns:
+                continue
+
+            tokens = (
+                _as_text(movie_df[column_name].reset_index(drop=True))
+                .str.casefold()
+                .str.normalize("NFKD")
+                .str.replace(ACCENT_PATTERN, "", regex=True)
+                .str.findall(TOKEN_PATTERN)
+                .explode()
+                .dropna()
+            )
+            token_series_list.append(tokens)
+
+        if token_series_list:
+            all_tokens = pd.concat(token_series_list)
+            postings_df = (
+                pd.DataFrame(
+                    {"token": all_tokens.to_numpy(), "row": all_tokens.index.to_numpy()}
+                )
+                .drop_duplicates()
+                .sort_values(["token", "row"])
+            )
+        else:
+            postings_df = pd.DataFrame({"token": [], "row": []})
+
+        # Sortierte Liste aller Tokens und je Token ein sortiertes Array der Zeilennummern
+        token_values = postings_df["token"].to_numpy()
+        row_values = postings_df["row"].to_numpy(dtype=np.int64)
+
+        self.tokens, token_starts = np.unique(token_values, return_index=True)
+        self.tokens = self.tokens.tolist()
+        self.postings = np.split(row_values, token_starts[1:])
+
+        # Kurze Präfixe (beim Tippen der ersten Buchstaben) treffen viele Tokens,
+        # ihre Ergebnisse werden deshalb zwischengespeichert
+        self._prefix_cache: Dict[str, np.ndarray] = {}
+
+    def _rows_for_prefix(self, prefix: str) -> np.ndarray:
+        """
+        Liefert die Zeilennummern aller Filme mit einem Token, das mit `prefix` beginnt.
+        Da die Tokens sortiert sind, liegen alle passenden Tokens direkt hintereinander.
+        """
+        if prefix in self._prefix_cache:
+            return self._prefix_cache[prefix]
+
+        start = bisect_left(self.tokens, prefix)
+        end = bisect_left(self.tokens, prefix + "\U0010ffff", lo=start)
+
+        if start == end:
+            rows = np.empty(0, dtype=np.int64)
+        elif end - start == 1:
+            rows = self.postings[start]
+        else:
+            rows = np.unique(np.concatenate(self.postings[start:end]))
+
+        if len(prefix) <= 2:
+            self._prefix_cache[prefix] = rows
+
+        return rows
+
+    def search(self, text: str) -> np.ndarray:
+        """
+        Sucht alle Filme, die jedes Token des Suchtextes (als Präfix) enthalten.
+        :param text: Suchtext.
+        :return: Sortiertes Array der Zeilennummern der gefundenen Filme
+        """
+        query_tokens = tokenize(text)
+
+        if not query_tokens:
+            return np.arange(self.row_count)
+
+        # Kurze Ergebnislisten zuerst, damit die Schnittmenge schnell klein wird
+        rows_per_token = sorted(
+            (self._rows_for_prefix(token) for token in dict.fromkeys(query_tokens)),
+            key=len,
+        )
+
+        result = rows_per_token[0]
+        for rows in rows_per_token[1:]:
+            if result.size == 0:
+                break
+            result = np.intersect1d(result, rows, assume_unique=True)
+
+        return result
@@ -0,0 +1,185 @@
+from typing import Dict
+import pandas as pd
+import numpy as np
+from scipy import sparse
+
+from process.processor import NormalizedMovieData
+from process.text_analytics import PlotTermMatrix
+
+# Gewicht jedes Merkmals an der Gesamtähnlichkeit. Die Ähnlichkeit zweier Filme
+# ist die gewichtete Summe der Kosinus-Ähnlichkeiten je Merkmal.
+FEATURE_WEIGHTS: Dict[str, float] = {
+    "Genre": 1.0,
+    "Director": 0.5,
+    "Actors": 0.75,
+    "Plot": 1.0,
+    "Year": 0.25,
+    "imdbRating": 0.25,
+}
+
+# Breite der Klassen für Jahr und Bewertung. Benachbarte Klassen zählen zur Hälfte,
+# sodass z.B. 1999 und 2001 ähnlich sind, obwohl sie in verschiedenen Klassen liegen.
+NUMERIC_BIN_WIDTHS: Dict[str, float] = {"Year": 5, "imdbRating": 1}
+NEIGHBOUR_WEIGHT = 0.5
+
+
+def _normalize_rows(matrix: sparse.csr_matrix) -> sparse.csr_matrix:
+    """
+    Normiert jede Zeile auf die Länge 1, leere Zeilen bleiben leer.
+    """
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1
+    return (sparse.diags(1 / norms) @ matrix).tocsr()
+
+
+def _one_hot(long_table: pd.DataFrame, row_count: int) -> sparse.csr_matrix:
+    """
+    Erstellt eine Indikatormatrix (Film x Wert) aus einer langen Tabelle von
+    normalize_movie_data. Der Index der langen Tabelle ist die Zeile des Films.
+    """
+    values = long_table.iloc[:, 0]
+    value_codes, value_names = pd.factorize(values.astype(object))
+
+    return sparse.csr_matrix(
+        (
+            np.ones(len(value_codes), dtype=np.float32),
+            (values.index.to_numpy(dtype=np.int64), value_codes),
+        ),
+        shape=(row_count, len(value_names)),
+    )
+
+
+def _soft_bins(values: pd.Series, bin_width: float) -> sparse.csr_matrix:
+    """
+    Teilt eine Zahl in Klassen ein und setzt neben der eigenen Klasse auch die beiden
+    Nachbarklassen (mit NEIGHBOUR_WEIGHT). Das Skalarprodukt zweier Zeilen sinkt so
+    mit dem Abstand der Werte, Filme ohne Wert erhalten eine leere Zeile.
+    """
+    numbers = pd.to_numeric(values, errors="coerce").astype("float64").to_numpy()
+    known_rows = np.flatnonzero(~np.isnan(numbers))
+
+    if known_rows.size == 0:
+        return sparse.csr_matrix((len(numbers), 0), dtype=np.float32)
+
+    bins = np.floor(numbers[known_rows] / bin_width).astype(np.int64)
+    bins -= bins.min() - 1
+
+    offsets = np.array([-1, 0, 1])
+    weights = np.array([NEIGHBOUR_WEIGHT, 1, NEIGHBOUR_WEIGHT], dtype=np.float32)
+
+    return sparse.csr_matrix(
+        (
+            np.tile(weights, len(known_rows)),
+            (
+                np.repeat(known_rows, len(offsets)),
+                (bins[:, None] + offsets).ravel(),
+            ),
+        ),
+        shape=(len(numbers), bins.max() + 2),
+    )
+
+
+class MovieSimilarityIndex:
+    """
+    Nächste-Nachbarn-Suche für das Panel "Ähnliche Filme" im Detail-Tab.
+    Für jeden Film wird einmal pro Datensatz ein dünnbesetzter Merkmalsvektor
+    erstellt: Genres, Regie und Besetzung als One-Hot, der Plot als TF-IDF, Jahr
+    und Bewertung als weiche Klassen. Jeder Block ist auf die Länge 1 normiert
+    und mit der Wurzel seines Gewichts skaliert, sodass das Skalarprodukt zweier
+    Filme die gewichtete Summe der Kosinus-Ähnlichkeiten je Merkmal ergibt.
+    Eine Anfrage ist ein einziges Matrix-Vektor-Produkt und eine Top-k-Auswahl
+    mit np.argpartition.
+    """
+
+    def __init__(
+        self,
+        normalized_data: NormalizedMovieData,
+        term_matrix: PlotTermMatrix | None = None,
+        weights: Dict[str, float] | None = None,
+    ):
+        """
+        Konstruktor für die MovieSimilarityIndex-Klasse.
+        :param normalized_data: Ergebnis von DataProcessor.normalize_movie_data.
+        :param term_matrix: PlotTermMatrix mit den Plots der Filme, None ohne Plot-Merkmal.
+        :param weights: Gewicht je Merkmal, Standard: FEATURE_WEIGHTS.
+        """
+        self.movies = normalized_data.movies
+        self.weights = {**FEATURE_WEIGHTS, **(weights or {})}
+        row_count = len(self.movies)
+
+        feature_blocks = {}
+        for column_name in ["Genre", "Director", "Actors"]:
+            if column_name in normalized_data.long_tables:
+                feature_blocks[column_name] = _one_hot(
+                    normalized_data.long_tables[column_name], row_count
+                )
+
+        if term_matrix is not None and "imdbID" in self.movies.columns:
+            feature_blocks["Plot"] = term_matrix.tfidf_rows(self.movies["imdbID"])
+
+        for column_name, bin_width in NUMERIC_BIN_WIDTHS.items():
+            if column_name in self.movies.columns:
+                feature_blocks[column_name] = _soft_bins(
+                    self.movies[column_name], bin_width
+                )
+
+        # Spaltenbereich je Merkmal, um die Ähnlichkeit später aufzuschlüsseln
+        self.block_slices: Dict[str, slice] = {}
+        scaled_blocks = []
+        column_offset = 0
+        for feature_name, block in feature_blocks.items():
+            weight = self.weights.get(feature_name, 0)
+            if weight <= 0 or block.shape[1] == 0:
+                continue
+
+            scaled_blocks.append(_normalize_rows(block) * np.float32(np.sqrt(weight)))
+            self.block_slices[feature_name] = slice(
+                column_offset, column_offset + block.shape[1]
+            )
+            column_offset += block.shape[1]
+
+        if scaled_blocks:
+            self.features = sparse.hstack(scaled_blocks, format="csr", dtype=np.float32)
+        else:
+            self.features = sparse.csr_matrix((row_count, 0), dtype=np.float32)
+
+        # Maximal erreichbare Ähnlichkeit, um die Werte auf 0 bis 1 zu skalieren
+        self.total_weight = sum(
+            self.weights[feature_name] for feature_name in self.block_slices
+        )
+
+    def similar_movies(self, row: int, top_k: int = 10) -> pd.DataFrame:
+        """
+        Sucht die `top_k` ähnlichsten Filme zu einem Film.
+        :param row: Zeilennummer des Films in `normalized_data.movies`.
+        :param top_k: Anzahl der Ergebnisse.
+        :return: Die gefundenen Zeilen aus `movies`, ergänzt um die Spalte "Similarity"
+                 (0 bis 1) und je Merkmal den Anteil an der Ähnlichkeit
+        """
+        if self.total_weight == 0 or not 0 <= row < len(self.movies):
+            return self.movies.iloc[0:0].assign(Similarity=pd.Series(dtype="float32"))
+
+        query = self.features[row]
+        scores = self.features @ query.toarray().ravel()
+        scores[row] = -np.inf
+
+        top_k = min(top_k, len(scores) - 1)
+        if top_k <= 0:
+            return self.movies.iloc[0:0].assign(Similarity=pd.Series(dtype="float32"))
+
+        # Nur die top_k besten Werte werden sortiert
+        candidates = np.argpartition(scores, -top_k)[-top_k:]
+        candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+        candidates = candidates[scores[candidates] > 0]
+
+        result = self.movies.iloc[candidates].copy()
+        result["Similarity"] = scores[candidates] / self.total_weight
+
+        # Anteil jedes Merkmals, nur für die gefundenen Filme berechnet
+        candidate_features = self.features[candidates]
+        for feature_name, block_slice in self.block_slices.items():
+            result[f"{feature_name} Similarity"] = (
+                candidate_features[:, block_slice] @ query[:, block_slice].T
+            ).toarray().ravel() / self.weights[feature_name]
+
+        return result
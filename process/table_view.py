@@ -0,0 +1,173 @@
+import math
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+import pandas as pd
+import numpy as np
+
+# Auswählbare Seitengrößen der Filmtabelle im Overview-Tab
+TABLE_PAGE_SIZES = [25, 50, 100, 250]
+
+
+@dataclass
+class TablePage:
+    """
+    Eine Seite der Filmtabelle im Overview-Tab.
+
+    rows: Die Zeilen der Seite mit den angezeigten Spalten.
+    page: Nummer der Seite, beginnend bei 1.
+    page_count: Anzahl der Seiten nach dem Filtern.
+    row_count: Anzahl der Zeilen nach dem Filtern.
+    first_row: Position der ersten Zeile der Seite, beginnend bei 0.
+    """
+
+    rows: pd.DataFrame
+    page: int
+    page_count: int
+    row_count: int
+    first_row: int
+
+
+def count_pages(row_count: int, page_size: int) -> int:
+    """Anzahl der Seiten für `row_count` Zeilen, mindestens eine (leere) Seite."""
+    return max(1, math.ceil(row_count / max(1, page_size)))
+
+
+def _is_nested(value) -> bool:
+    return isinstance(value, (list, tuple, set, dict, np.ndarray))
+
+
+def _display_text(value) -> str | None:
+    """
+    Fügt einen Listenwert (z.B. nach explode_column oder aus einem Parquet-Datensatz)
+    zu einem kurzen Anzeigetext zusammen: ["Drama", "Comedy"] -> "Drama, Comedy".
+    """
+    if isinstance(value, dict):
+        return ", ".join(f"{key}: {item}" for key, item in value.items())
+
+    if _is_nested(value):
+        return ", ".join(_display_text(item) or "" for item in value)
+
+    return None if pd.isna(value) else str(value)
+
+
+def prepare_table_data(movie_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Bereitet die Filmdaten einmal pro Datensatz für die Tabelle vor. Spalten mit
+    Listen oder Dictionaries werden zu Texten zusammengefügt, damit sie beim
+    Anzeigen nicht verschachtelt serialisiert werden und sortierbar sind.
+    Alle anderen Spalten werden ohne Kopie übernommen.
+
+    :param movie_df: DataFrame mit den normalisierten Filmdaten.
+    :return: DataFrame mit fortlaufendem Index und flachen Spalten
+    """
+    movie_df = movie_df.reset_index(drop=True)
+
+    nested_columns = {
+        column_name: movie_df[column_name].map(_display_text).astype("string")
+        for column_name in movie_df.columns
+        if movie_df[column_name].dtype == object
+        and movie_df[column_name].map(_is_nested).any()
+    }
+
+    return movie_df.assign(**nested_columns) if nested_columns else movie_df
+
+
+class MovieTableView:
+    """
+    Serverseitig sortierte, gefilterte und geblätterte Ansicht der Filmtabelle.
+    Statt bei jedem Rerun die ganze Tabelle an den Browser zu senden, wird nur
+    die sichtbare Seite ausgewählt. Die Sortierreihenfolge je Spalte wird beim
+    ersten Gebrauch berechnet und für alle weiteren Reruns gespeichert, ein
+    Filter (z.B. die Zeilennummern einer Suche) wählt daraus nur noch Positionen aus.
+    """
+
+    def __init__(self, movie_df: pd.DataFrame):
+        """
+        Konstruktor für die MovieTableView-Klasse.
+        :param movie_df: DataFrame mit den Filmdaten. Die Zeilennummern der Filter
+                         beziehen sich auf die Position in diesem DataFrame.
+        """
+        self.table_df = prepare_table_data(movie_df)
+        self.row_count = len(self.table_df)
+        self._sort_orders: Dict[Tuple[str, bool], np.ndarray] = {}
+
+    def sort_order(self, column_name: str, ascending: bool = True) -> np.ndarray:
+        """
+        Liefert die Zeilennummern aller Filme sortiert nach einer Spalte.
+        Fehlende Werte stehen immer am Ende, gleiche Werte behalten ihre Reihenfolge.
+        """
+        key = (column_name, ascending)
+        if key not in self._sort_orders:
+            self._sort_orders[key] = (
+                self.table_df[column_name]
+                .reset_index(drop=True)
+                .sort_values(ascending=ascending, na_position="last", kind="stable")
+                .index.to_numpy()
+            )
+
+        return self._sort_orders[key]
+
+    def row_order(
+        self,
+        row_positions: np.ndarray | None = None,
+        sort_column: str | None = None,
+        ascending: bool = True,
+    ) -> np.ndarray:
+        """
+        Filtert und sortiert die Zeilen, ohne Daten zu kopieren.
+
+        :param row_positions: Optionale Zeilennummern der angezeigten Filme,
+                              z.B. das Ergebnis von MovieSearchIndex.search.
+        :param sort_column: Optionale Spalte, nach der sortiert wird.
+        :param ascending: Aufsteigend oder absteigend sortieren.
+        :return: Array der Zeilennummern in Anzeigereihenfolge
+        """
+        if sort_column is None or sort_column not in self.table_df.columns:
+            if row_positions is None:
+                return np.arange(self.row_count)
+            return np.asarray(row_positions, dtype=np.int64)
+
+        order = self.sort_order(sort_column, ascending)
+        if row_positions is None:
+            return order
+
+        selected = np.zeros(self.row_count, dtype=bool)
+        selected[row_positions] = True
+        return order[selected[order]]
+
+    def page(
+        self,
+        row_order: np.ndarray,
+        column_names: List[str],
+        page: int = 1,
+        page_size: int = 50,
+    ) -> TablePage:
+        """
+        Schneidet eine Seite aus den sortierten Zeilen. Nur die Zeilen und
+        Spalten der Seite werden kopiert.
+
+        :param row_order: Ergebnis von row_order.
+        :param column_names: Angezeigte Spalten.
+        :param page: Nummer der Seite, wird auf die vorhandenen Seiten begrenzt.
+        :param page_size: Anzahl der Zeilen je Seite.
+        :return: TablePage
+        """
+        page_size = max(1, page_size)
+        row_count = len(row_order)
+        page_count = count_pages(row_count, page_size)
+        page = min(max(1, page), page_count)
+        first_row = (page - 1) * page_size
+
+        column_positions = self.table_df.columns.get_indexer(column_names)
+        rows = self.table_df.iloc[
+            row_order[first_row : first_row + page_size],
+            column_positions[column_positions >= 0],
+        ]
+
+        return TablePage(
+            rows=rows,
+            page=page,
+            page_count=page_count,
+            row_count=row_count,
+            first_row=first_row,
+        )
@@ -0,0 +1,243 @@
+from typing import Dict, Iterable, List, Sequence
+import pandas as pd
+import numpy as np
+from scipy import sparse
+
+# Ein Wort besteht aus Buchstaben oder Ziffern und darf Apostrophe enthalten ("don't")
+WORD_PATTERN = r"\w+(?:'\w+)*"
+# Wie bei wordcloud wird das Genitiv-s entfernt ("hero's" -> "hero")
+GENITIVE_PATTERN = r"'s\b"
+
+
+class PlotTermMatrix:
+    """
+    Dokument-Term-Matrix über die Plots aller geladenen Filme.
+    Jeder Plot wird genau einmal in Wörter zerlegt, die Anzahl je (Film, Wort)
+    liegt in einer dünnbesetzten CSR-Matrix (Zeile = Film, Spalte = Wort).
+    Auswertungen über mehrere Filme (häufigste Wörter einer Auswahl oder je Genre,
+    Plot-Ähnlichkeit in MovieSimilarityIndex) sind danach reine Matrixoperationen,
+    die Texte werden dafür nicht erneut zusammengefügt oder zerlegt.
+
+    Die Matrix wird mit from_movies einmal pro Datensatz erstellt und danach nicht
+    mehr verändert, ein anderer Datensatz ergibt eine neue Matrix.
+    """
+
+    def __init__(self, stopwords: Iterable[str]):
+        """
+        Konstruktor für die PlotTermMatrix-Klasse.
+        :param stopwords: Wörter, die nicht gezählt werden (z.B. CLOUD_STOPWORDS aus
+                          tabs/details.py). Der Vergleich erfolgt in Kleinschreibung.
+        """
+        self.stopwords = frozenset(word.casefold() for word in stopwords)
+
+        self.imdb_ids = np.empty(0, dtype=object)
+        self.terms: List[str] = []
+        self.term_positions: Dict[str, int] = {}
+        self.counts = sparse.csr_matrix((0, 0), dtype=np.int32)
+        self._row_positions: Dict[str, int] = {}
+        self._tfidf: sparse.csr_matrix | None = None
+
+    @classmethod
+    def from_movies(
+        cls, movie_df: pd.DataFrame, stopwords: Iterable[str]
+    ) -> "PlotTermMatrix":
+        """
+        Erstellt die Matrix für alle Filme eines DataFrames.
+        :param movie_df: DataFrame mit den Spalten "imdbID" und "Plot".
+        :param stopwords: Wörter, die nicht gezählt werden.
+        :return: PlotTermMatrix
+        """
+        term_matrix = cls(stopwords)
+        term_matrix._build(movie_df)
+        return term_matrix
+
+    def __len__(self) -> int:
+        return len(self.imdb_ids)
+
+    def _tokenize(self, plots: pd.Series) -> pd.Series:
+        """
+        Zerlegt alle Plots vektorisiert in Wörter. Der Index des Ergebnisses ist die
+        Position des Plots in `plots`, die Werte sind die Wörter ohne Stopwords.
+        """
+        tokens = (
+            plots.where(plots != "N/A")
+            .fillna("")
+            .astype(str)
+            .str.casefold()
+            .str.replace(GENITIVE_PATTERN, "", regex=True)
+            .str.findall(WORD_PATTERN)
+            .explode()
+            .dropna()
+        )
+
+        # Die Filter werden nur einmal je unterschiedlichem Wort ausgewertet
+        token_codes, unique_tokens = pd.factorize(tokens)
+        unique_tokens = pd.Series(unique_tokens, dtype=object)
+        keep = (
+            (unique_tokens.str.len() > 1)
+            & ~unique_tokens.str.isdigit()
+            & ~unique_tokens.isin(self.stopwords)
+        ).to_numpy()
+
+        return tokens[keep[token_codes]]
+
+    def _build(self, movie_df: pd.DataFrame) -> None:
+        """
+        Zerlegt die Plots aller Filme und erstellt Vokabular und Matrix.
+        :param movie_df: DataFrame mit den Spalten "imdbID" und "Plot".
+        """
+        if movie_df.empty or "imdbID" not in movie_df.columns:
+            return
+
+        movies = movie_df.drop_duplicates(subset="imdbID").reset_index(drop=True)
+
+        if "Plot" in movies.columns:
+            tokens = self._tokenize(movies["Plot"])
+        else:
+            tokens = pd.Series([], dtype=object)
+
+        token_codes, unique_tokens = pd.factorize(tokens)
+        self.terms = list(unique_tokens)
+        self.term_positions = {term: column for column, term in enumerate(self.terms)}
+
+        # Doppelte (Film, Wort)-Paare werden beim Umwandeln in CSR aufsummiert
+        self.counts = sparse.coo_matrix(
+            (
+                np.ones(len(token_codes), dtype=np.int32),
+                (tokens.index.to_numpy(dtype=np.int64), token_codes),
+            ),
+            shape=(len(movies), len(self.terms)),
+        ).tocsr()
+
+        self.imdb_ids = movies["imdbID"].to_numpy(dtype=object)
+        self._row_positions = {
+            imdb_id: row for row, imdb_id in enumerate(self.imdb_ids)
+        }
+
+    def rows_for(self, imdb_ids: Iterable[str]) -> np.ndarray:
+        """
+        Liefert die Zeilennummern der angegebenen Filme. Unbekannte imdbIDs werden
+        übersprungen.
+        """
+        return np.fromiter(
+            (
+                self._row_positions[imdb_id]
+                for imdb_id in imdb_ids
+                if imdb_id in self._row_positions
+            ),
+            dtype=np.int64,
+        )
+
+    def term_frequencies(self, rows: np.ndarray | None = None) -> pd.Series:
+        """
+        Summiert die Wortanzahlen über eine Auswahl von Filmen.
+        :param rows: Zeilennummern der Filme, None für alle Filme.
+        :return: Series Wort -> Anzahl, absteigend sortiert, ohne Nullen
+        """
+        counts = self.counts if rows is None else self.counts[rows]
+        totals = np.asarray(counts.sum(axis=0)).ravel()
+
+        used_columns = np.flatnonzero(totals)
+        frequencies = pd.Series(
+            totals[used_columns],
+            index=np.asarray(self.terms, dtype=object)[used_columns],
+        )
+        return frequencies.sort_values(ascending=False, kind="stable")
+
+    def top_terms_by_group(
+        self, imdb_ids: Sequence[str], groups: Sequence[str], top_n: int = 10
+    ) -> pd.DataFrame:
+        """
+        Häufigste Wörter je Gruppe, z.B. je Genre. Die Zuordnung Film -> Gruppe wird
+        als dünnbesetzte Indikatormatrix (Gruppe x Film) mit der Dokument-Term-Matrix
+        multipliziert, das Ergebnis enthält die Wortanzahlen je Gruppe.
+
+        :param imdb_ids: imdbID je Zuordnung, ein Film darf mehrfach vorkommen.
+        :param groups: Gruppe je Zuordnung, gleiche Länge wie `imdb_ids`.
+        :param top_n: Anzahl der Wörter je Gruppe.
+        :return: DataFrame mit den Spalten "Group", "Term" und "Count"
+        """
+        assignments = pd.DataFrame({"imdbID": imdb_ids, "Group": groups}).dropna()
+        assignments["row"] = assignments["imdbID"].map(self._row_positions)
+        assignments = assignments.dropna(subset=["row"]).drop_duplicates(
+            subset=["row", "Group"]
+        )
+
+        if assignments.empty or not self.terms:
+            return pd.DataFrame(columns=["Group", "Term", "Count"])
+
+        group_codes, group_names = pd.factorize(assignments["Group"])
+        indicator = sparse.csr_matrix(
+            (
+                np.ones(len(assignments), dtype=np.int32),
+                (group_codes, assignments["row"].to_numpy(dtype=np.int64)),
+            ),
+            shape=(len(group_names), len(self)),
+        )
+        group_counts = (indicator @ self.counts).tocsr()
+
+        result_frames = []
+        for group_index, group_name in enumerate(group_names):
+            start, end = group_counts.indptr[group_index : group_index + 2]
+            counts = group_counts.data[start:end]
+            columns = group_counts.indices[start:end]
+
+            # Nur die top_n größten Werte werden sortiert
+            if len(counts) > top_n:
+                selected = np.argpartition(counts, -top_n)[-top_n:]
+                counts, columns = counts[selected], columns[selected]
+            order = np.argsort(-counts, kind="stable")
+
+            result_frames.append(
+                pd.DataFrame(
+                    {
+                        "Group": group_name,
+                        "Term": np.asarray(self.terms, dtype=object)[columns[order]],
+                        "Count": counts[order],
+                    }
+                )
+            )
+
+        return pd.concat(result_frames, ignore_index=True)
+
+    @property
+    def tfidf(self) -> sparse.csr_matrix:
+        """
+        TF-IDF-Gewichte der Matrix, je Zeile auf die Länge 1 normiert, sodass das
+        Skalarprodukt zweier Zeilen ihrer Kosinus-Ähnlichkeit entspricht.
+        Wird beim ersten Zugriff einmal berechnet.
+        """
+        if self._tfidf is None:
+            document_count = self.counts.shape[0]
+            document_frequency = np.bincount(
+                self.counts.indices, minlength=self.counts.shape[1]
+            )
+            # Geglättete IDF wie in scikit-learn
+            idf = np.log((1 + document_count) / (1 + document_frequency)) + 1
+
+            weights = self.counts.astype(np.float32) @ sparse.diags(
+                idf.astype(np.float32)
+            )
+            weights = weights.tocsr()
+            norms = np.sqrt(np.asarray(weights.multiply(weights).sum(axis=1)).ravel())
+            norms[norms == 0] = 1
+            self._tfidf = (sparse.diags(1 / norms) @ weights).tocsr()
+
+        return self._tfidf
+
+    def tfidf_rows(self, imdb_ids: Sequence[str]) -> sparse.csr_matrix:
+        """
+        TF-IDF-Zeilen in der Reihenfolge der angegebenen Filme, z.B. passend zu den
+        Zeilen eines anderen DataFrames. Unbekannte Filme erhalten eine leere Zeile.
+        """
+        positions = pd.Series(imdb_ids, dtype=object).map(self._row_positions)
+        known = positions.notna().to_numpy()
+
+        selection = sparse.csr_matrix(
+            (
+                np.ones(known.sum(), dtype=np.float32),
+                (np.flatnonzero(known), positions[known].to_numpy(dtype=np.int64)),
+            ),
+            shape=(len(positions), len(self)),
+        )
+        return (selection @ self.tfidf).tocsr()
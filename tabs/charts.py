@@ -0,0 +1,233 @@
+"""
+Erstellt die Plotly-Grafiken des Overview-Tabs. Die Funktionen enthalten keine
+Streamlit-Aufrufe, sie liefern nur die fertigen Figures. So können die Grafiken
+auch ohne laufende App erstellt werden, z.B. in benchmarks/bench_pipeline.py.
+"""
+
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+from process.aggregates import OverviewAggregates
+from process.countries import CHOROPLETH_NAMES, COUNTRY_CENTROIDS
+
+# Kennzahlen, nach denen die Länderkarte gewichtet werden kann (Spalte -> Beschriftung)
+COUNTRY_MAP_METRICS = {
+    "Count": "Anzahl der Filme",
+    "imdbRating": "Median IMDb-Bewertung",
+    "BoxOffice": "BoxOffice gesamt (Mio.)",
+}
+
+
+def loading_preview_figure(movie_data_df: pd.DataFrame) -> go.Figure | None:
+    """
+    Genre-Verteilung der bisher geladenen Filme für die Vorschau während des Ladens.
+    :param movie_data_df: Die bisher geladenen Filmdaten.
+    :return: Figure oder None, wenn noch keine Genres vorhanden sind
+    """
+    if movie_data_df.empty or "Genre" not in movie_data_df.columns:
+        return None
+
+    genre_counts = (
+        movie_data_df["Genre"].str.split(", ").explode().value_counts().reset_index()
+    )
+    genre_counts.columns = ["Genre", "Count"]
+
+    fig = px.bar(
+        genre_counts,
+        x="Count",
+        y="Genre",
+        orientation="h",
+        title=f"Anzahl der Genres ({len(movie_data_df)} Filme geladen)",
+    )
+    fig.update_traces(marker_color="purple", opacity=0.6)
+    return fig
+
+
+def genre_counts_figure(genre_counts: pd.DataFrame) -> go.Figure:
+    """
+    Anzahl der Filme je Genre.
+    :param genre_counts: OverviewAggregates.genre_counts
+    :return: Figure
+    """
+    fig = px.bar(
+        genre_counts,
+        x="Count",
+        y="Genre",
+        orientation="h",
+        title="Anzahl der Genres",
+    )
+
+    # Aktualisierung der x-Achse, um nur ganze Zahlen als Ticks anzuzeigen
+    fig.update_layout(
+        height=600,
+        xaxis=dict(
+            dtick=1,  # Setzt die Tick-Intervalle auf ganze Zahlen
+            tick0=0,  # Beginnt die Ticks bei 0
+            range=[
+                0,
+                genre_counts["Count"].max() + 2,
+            ],  # Setzt die Reichweite der x-Achse
+        ),
+        yaxis=dict(
+            tickfont=dict(size=12),  # Schriftgröße der Tick-Labels anpassen
+        ),
+    )
+
+    fig.update_traces(marker_color="purple", opacity=0.6)
+    return fig
+
+
+def genre_ratings_figure(genre_ratings: pd.DataFrame) -> go.Figure:
+    """
+    Median IMDb-Bewertung pro Genre.
+    :param genre_ratings: OverviewAggregates.genre_ratings
+    :return: Figure
+    """
+    fig = px.bar(
+        genre_ratings,
+        x="imdbRating",
+        y="Genre",
+        orientation="h",
+        title="Median IMDb-Bewertung pro Genre",
+    )
+
+    fig.update_layout(height=600)
+    fig.update_traces(marker_color="navy", opacity=0.9)
+    return fig
+
+
+def box_office_scatter_figure(aggregates: OverviewAggregates) -> go.Figure:
+    """
+    Korrelation zwischen Box-Office und IMDb-Bewertung. Die OLS-Trendlinie ist
+    bereits berechnet und wird nur noch eingezeichnet.
+    :param aggregates: Die vorberechneten Kennzahlen des Datensatzes.
+    :return: Figure
+    """
+    fig = px.scatter(
+        aggregates.box_office_points,
+        x="BoxOffice",
+        y="imdbRating",
+        hover_data=["Title"],
+        title="Box-Office-Einnahmen vs. IMDb Bewertungen",
+        width=500,
+        height=400,
+    )
+    if not aggregates.trendline.empty:
+        fig.add_trace(
+            go.Scatter(
+                x=aggregates.trendline["BoxOffice"],
+                y=aggregates.trendline["imdbRating"],
+                mode="lines",
+                name="OLS trendline",
+                showlegend=False,
+            )
+        )
+    fig.update_layout(
+        xaxis_title="Box Office (in Millionen)",
+        yaxis_title="IMDb Bewertung",
+    )
+    return fig
+
+
+def box_office_histogram_figure(box_office_histogram: pd.DataFrame) -> go.Figure:
+    """
+    Histogramm der BoxOffice-Einnahmen aus den vorberechneten Klassen.
+    :param box_office_histogram: OverviewAggregates.box_office_histogram
+    :return: Figure
+    """
+    bin_width = box_office_histogram["bin_end"] - box_office_histogram["bin_start"]
+    fig = go.Figure(
+        go.Bar(
+            x=box_office_histogram["bin_start"] + bin_width / 2,
+            y=box_office_histogram["Count"],
+            width=bin_width,
+        )
+    )
+    fig.update_layout(
+        width=500,
+        height=400,
+        xaxis_title="Box Office (in Millionen)",
+        yaxis_title="Anzahl der Filme",
+    )
+    return fig
+
+
+def country_map_figure(
+    country_map_df: pd.DataFrame, metric: str = "Count", bubbles: bool = False
+) -> go.Figure:
+    """
+    Karte mit den Produktionsländern der Filme, gewichtet nach einer Kennzahl.
+    Die Karte braucht keine Kacheln eines Kartendienstes: als Choropleth werden
+    die Länderflächen eingefärbt, als Blasenkarte wird je Land ein Kreis mit
+    einer Fläche proportional zur Kennzahl gezeichnet. Die Ländergrenzen
+    (topojson) lädt Plotly.js im Browser vom Plotly-CDN (cdn.plot.ly), ohne
+    Netzwerk bleibt die Karte leer.
+
+    :param country_map_df: Ergebnis von create_geo_map_data (Kennzahlen je Land
+                           mit latitude und longitude).
+    :param metric: Spalte aus COUNTRY_MAP_METRICS, nach der gewichtet wird.
+    :param bubbles: Blasenkarte statt Choropleth zeichnen.
+    :return: Figure
+    """
+    metric_label = COUNTRY_MAP_METRICS[metric]
+    hover_template = (
+        "<b>%{text}</b><br>"
+        "Filme: %{customdata[0]}<br>"
+        "Median IMDb-Bewertung: %{customdata[1]:.1f} ⭐<br>"
+        "BoxOffice gesamt: %{customdata[2]:.1f}M"
+        "<extra></extra>"
+    )
+    color_bar = {"title": metric_label}
+
+    if bubbles:
+        points = country_map_df.dropna(subset=["latitude", "longitude"])
+        sizes = points[metric].fillna(0).clip(lower=0)
+        # Die größte Blase hat einen Durchmesser von etwa 40 Pixeln
+        size_reference = 2 * sizes.max() / 40**2 if sizes.max() > 0 else 1
+
+        trace = go.Scattergeo(
+            lat=points["latitude"],
+            lon=points["longitude"],
+            text=points["Country"],
+            customdata=points[["Count", "imdbRating", "BoxOffice"]],
+            hovertemplate=hover_template,
+            marker={
+                "size": sizes,
+                "sizemode": "area",
+                "sizeref": size_reference,
+                "sizemin": 3,
+                "color": points[metric],
+                "colorscale": "Purples",
+                "colorbar": color_bar,
+                "line": {"width": 0.5, "color": "white"},
+                "opacity": 0.8,
+            },
+        )
+    else:
+        # Unbekannte Namen hat Plotly keine Fläche zugeordnet
+        areas = country_map_df[country_map_df["Country"].isin(COUNTRY_CENTROIDS)]
+
+        trace = go.Choropleth(
+            locations=areas["Country"].replace(CHOROPLETH_NAMES),
+            locationmode="country names",
+            z=areas[metric],
+            text=areas["Country"],
+            customdata=areas[["Count", "imdbRating", "BoxOffice"]],
+            hovertemplate=hover_template,
+            colorscale="Purples",
+            colorbar=color_bar,
+            marker_line_width=0.5,
+        )
+
+    fig = go.Figure(trace)
+    fig.update_geos(
+        projection_type="natural earth",
+        showframe=False,
+        showcountries=True,
+        countrycolor="lightgray",
+        showland=True,
+        landcolor="rgb(243, 243, 243)",
+    )
+    fig.update_layout(height=500, margin={"r": 0, "t": 0, "l": 0, "b": 0})
+    return fig
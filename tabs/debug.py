@@ -0,0 +1,67 @@
+import streamlit as st
+import pandas as pd
+
+from metrics import METRICS
+
+
+def _format_labels(labels: dict) -> str:
+    return ", ".join(f"{name}={value}" for name, value in labels.items())
+
+
+def create_metrics_panel() -> None:
+    """
+    Zeigt die gesammelten Messwerte in einem aufklappbaren Bereich der Sidebar an.
+    Wird nur angezeigt, wenn METRICS_ENABLED=1 gesetzt ist.
+
+    :return: None
+    """
+    if not METRICS.enabled:
+        return
+
+    with st.sidebar.expander("Debug: Messwerte"):
+        snapshot = METRICS.snapshot()
+
+        timings_df = pd.DataFrame(
+            [
+                {
+                    "Messung": name,
+                    "Labels": _format_labels(entry["labels"]),
+                    "Anzahl": entry["count"],
+                    "Ø ms": entry["sum_seconds"] / entry["count"] * 1000,
+                    "Max ms": entry["max_seconds"] * 1000,
+                    "Summe s": entry["sum_seconds"],
+                }
+                for name, entries in sorted(snapshot["timings"].items())
+                for entry in entries
+            ]
+        )
+        counters_df = pd.DataFrame(
+            [
+                {
+                    "Zähler": name,
+                    "Labels": _format_labels(entry["labels"]),
+                    "Wert": entry["value"],
+                }
+                for name, entries in sorted(snapshot["counters"].items())
+                for entry in entries
+            ]
+        )
+
+        st.write("**Zeiten**")
+        if not timings_df.empty:
+            st.dataframe(timings_df.round(2), hide_index=True, use_container_width=True)
+
+        st.write("**Zähler**")
+        if not counters_df.empty:
+            st.dataframe(counters_df, hide_index=True, use_container_width=True)
+
+        st.download_button(
+            "JSON herunterladen", METRICS.to_json(), file_name="metrics.json"
+        )
+        st.download_button(
+            "Prometheus-Text herunterladen",
+            METRICS.to_prometheus(),
+            file_name="metrics.txt",
+        )
+        if st.button("Messwerte zurücksetzen"):
+            METRICS.reset()
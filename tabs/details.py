@@ -1,67 +1,253 @@
+import io
+from functools import lru_cache
+from typing import Dict, FrozenSet, Tuple
+
 import streamlit as st
-import matplotlib.pyplot as plt
+import pandas as pd
+import numpy as np
+from PIL import Image
 from wordcloud import WordCloud, STOPWORDS
 
+from metrics import METRICS
+from process.dataset_registry import SharedDataset
+from process.processor import NormalizedMovieData
+from process.similarity import MovieSimilarityIndex
+from process.text_analytics import PlotTermMatrix
+from tabs.overview import get_poster_cache, get_session_dataset
+
+# STOPWORDS von wordcloud, ergänzt um eigene Füllwörter
+CLOUD_STOPWORDS: FrozenSet[str] = frozenset(STOPWORDS) | {
+    "us",
+    "one",
+    "will",
+    "said",
+    "now",
+    "well",
+    "man",
+    "may",
+    "little",
+    "say",
+    "must",
+    "way",
+    "long",
+    "yet",
+    "mean",
+    "put",
+    "seem",
+    "asked",
+    "made",
+    "half",
+    "much",
+    "certainly",
+    "might",
+    "came",
+}
+
+# Größe der Wortwolke in Pixeln, ausreichend für die halbe Seitenbreite
+CLOUD_WIDTH = 800
+CLOUD_HEIGHT = 400
+
 
-def _create_cloud(text: str, max_word: int) -> None:
+@lru_cache(maxsize=128)
+def _word_frequencies(
+    imdb_id: str, text: str, stopwords: FrozenSet[str]
+) -> Dict[str, float]:
     """
-    Erstellt eine Wortwolke aus gegebenem Text.
+    Zählt die Wörter eines Plots einmal pro Film, unabhängig von der Stellung
+    des Schiebereglers.
 
-    :param text: Der zu visualisierende Text.
-    :param max_word: Maximale Anzahl von Wörtern in der Wortwolke.
-    :return: None
+    :param imdb_id: imdbID des Films.
+    :param text: Plot des Films.
+    :param stopwords: Wörter, die nicht gezählt werden.
+    :return: Relative Häufigkeit je Wort
     """
-    stopwords = set(STOPWORDS)
-
-    # Ergänzen von eigenen STOPWORDS
-    stopwords.update(
-        {
-            "us",
-            "one",
-            "will",
-            "said",
-            "now",
-            "well",
-            "man",
-            "may",
-            "little",
-            "say",
-            "must",
-            "way",
-            "long",
-            "yet",
-            "mean",
-            "put",
-            "seem",
-            "asked",
-            "made",
-            "half",
-            "much",
-            "certainly",
-            "might",
-            "came",
-        }
-    )
+    return WordCloud(stopwords=set(stopwords)).process_text(text)
 
+
+def _cloud_png(frequencies: Dict[str, float], max_words: int) -> bytes:
+    """
+    Zeichnet eine Wortwolke aus Worthäufigkeiten und gibt sie als PNG zurück.
+    Das Bild wird direkt mit Pillow erzeugt, es entsteht keine matplotlib-Figur,
+    die wieder geschlossen werden müsste.
+    """
     w_cloud = WordCloud(
+        width=CLOUD_WIDTH,
+        height=CLOUD_HEIGHT,
         background_color="black",
-        max_words=max_word,
+        max_words=max_words,
         colormap="tab20c",
-        stopwords=stopwords,
     )  # ,random_state=random
 
-    # word cloud erstellen
-    w_cloud.generate(text)
+    # word cloud erstellen, besteht der Text nur aus Stopwords bleibt das Bild leer
+    if frequencies:
+        image = w_cloud.generate_from_frequencies(frequencies).to_image()
+    else:
+        image = Image.new("RGB", (CLOUD_WIDTH, CLOUD_HEIGHT), "black")
+
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+@lru_cache(maxsize=256)
+def render_word_cloud(
+    imdb_id: str,
+    text: str,
+    max_words: int,
+    stopwords: FrozenSet[str] = CLOUD_STOPWORDS,
+) -> bytes:
+    """
+    Erstellt die Wortwolke eines Plots als PNG.
+    Die Bilder werden prozessweit je (imdbID, max_words, stopwords) zwischengespeichert,
+    ist der Cache voll, wird das am längsten nicht verwendete Bild verdrängt.
+
+    :param imdb_id: imdbID des Films.
+    :param text: Der zu visualisierende Text.
+    :param max_words: Maximale Anzahl von Wörtern in der Wortwolke.
+    :param stopwords: Wörter, die nicht in der Wortwolke erscheinen.
+    :return: PNG-Bild als Bytes
+    """
+    return _cloud_png(_word_frequencies(imdb_id, text, stopwords), max_words)
+
+
+@lru_cache(maxsize=32)
+def render_frequency_cloud(top_frequencies: Tuple[Tuple[str, int], ...]) -> bytes:
+    """
+    Erstellt eine Wortwolke aus bereits gezählten Wörtern, z.B. für eine Auswahl
+    von Filmen aus der PlotTermMatrix. Die Wortwolke zeigt ohnehin nur die häufigsten
+    Wörter, sie sind daher zugleich der Cache-Schlüssel.
+
+    :param top_frequencies: Tuple aus (Wort, Anzahl), absteigend sortiert.
+    :return: PNG-Bild als Bytes
+    """
+    return _cloud_png(dict(top_frequencies), max(len(top_frequencies), 1))
+
+
+# Die Plots werden einmal pro Datensatz zerlegt, alle Sessions mit demselben
+# Datensatz teilen sich die Matrix
+@st.cache_resource(max_entries=8)
+def get_plot_term_matrix(
+    fingerprint: str, _movie_data_df: pd.DataFrame
+) -> PlotTermMatrix:
+    """Wrapper Funktion um PlotTermMatrix.from_movies mit caching"""
+    return PlotTermMatrix.from_movies(_movie_data_df, CLOUD_STOPWORDS)
+
+
+# Der Merkmalsvektor jedes Films wird einmal pro Datensatz erstellt
+@st.cache_resource(max_entries=8)
+def get_similarity_index(
+    fingerprint: str,
+    _normalized_data: NormalizedMovieData,
+    _term_matrix: PlotTermMatrix,
+) -> MovieSimilarityIndex:
+    """Wrapper Funktion um MovieSimilarityIndex mit caching"""
+    return MovieSimilarityIndex(_normalized_data, _term_matrix)
+
 
-    # diagram in streamlit anzeigen
-    plt.figure(figsize=(100, 100))
+def _create_similar_movies(dataset: SharedDataset, imdb_id: str) -> None:
+    """
+    Zeigt die ähnlichsten Filme zum ausgewählten Film. Die Ähnlichkeit setzt sich
+    aus Genre, Regie, Besetzung, Plot, Jahr und Bewertung zusammen.
+
+    :param dataset: Der Datensatz der aktuellen Session.
+    :param imdb_id: imdbID des ausgewählten Films.
+    :return: None
+    """
+    normalized_data = dataset.normalized
+    similarity_index = get_similarity_index(
+        dataset.key, normalized_data, get_plot_term_matrix(dataset.key, dataset.movies)
+    )
+
+    rows = np.flatnonzero(normalized_data.movies["imdbID"].to_numpy() == imdb_id)
+    if rows.size == 0:
+        return
+
+    similar_movies = similarity_index.similar_movies(rows[0], top_k=10)
+    if similar_movies.empty:
+        return
 
-    fig, ax = plt.subplots()
-    ax.imshow(w_cloud, interpolation="bilinear")
-    ax.axis("off")
-    st.pyplot(fig)
+    st.subheader("Ähnliche Filme")
+    feature_columns = [
+        column_name
+        for column_name in similar_movies.columns
+        if column_name.endswith(" Similarity")
+    ]
+    st.dataframe(
+        similar_movies[
+            ["Title", "Year", "Genre", "imdbRating", "Similarity"] + feature_columns
+        ],
+        hide_index=True,
+        use_container_width=True,
+        column_config={
+            "Similarity": st.column_config.ProgressColumn(
+                "Similarity", min_value=0, max_value=1, format="%.2f"
+            ),
+            **{
+                column_name: st.column_config.NumberColumn(format="%.2f")
+                for column_name in feature_columns
+            },
+        },
+    )
+
+
+def _create_catalogue_analysis(dataset: SharedDataset) -> None:
+    """
+    Erstellt die Textanalyse über alle geladenen Plots: eine Wortwolke für eine
+    Auswahl von Genres und die häufigsten Wörter je Genre.
+
+    :param dataset: Der Datensatz der aktuellen Session.
+    :return: None
+    """
+    term_matrix = get_plot_term_matrix(dataset.key, dataset.movies)
+    normalized_data = dataset.normalized
 
+    if "Genre" in normalized_data.long_tables:
+        genre_assignments = normalized_data.exploded("Genre")[["imdbID", "Genre"]]
+    else:
+        genre_assignments = pd.DataFrame(columns=["imdbID", "Genre"])
 
+    st.subheader("Plot Analyse aller Filme")
+    catalogue_col1, catalogue_col2 = st.columns(2)
+
+    with catalogue_col1:
+        selected_genres = st.multiselect(
+            "Genres (leer = alle Filme):",
+            sorted(genre_assignments["Genre"].dropna().unique()),
+        )
+        max_word = st.slider(
+            "maximale Anzahl an Wörter in der Katalog-Wordcloud:", 5, 200, 50
+        )
+
+        if selected_genres:
+            selected_ids = genre_assignments.loc[
+                genre_assignments["Genre"].isin(selected_genres), "imdbID"
+            ].unique()
+            frequencies = term_matrix.term_frequencies(
+                term_matrix.rows_for(selected_ids)
+            )
+        else:
+            frequencies = term_matrix.term_frequencies()
+
+        st.image(
+            render_frequency_cloud(tuple(frequencies.head(max_word).items())),
+            use_column_width=True,
+        )
+
+    with catalogue_col2:
+        top_terms = term_matrix.top_terms_by_group(
+            genre_assignments["imdbID"], genre_assignments["Genre"].astype(object)
+        )
+        if selected_genres:
+            top_terms = top_terms[top_terms["Group"].isin(selected_genres)]
+
+        st.dataframe(
+            top_terms.rename(columns={"Group": "Genre", "Term": "Wort"}),
+            hide_index=True,
+            use_container_width=True,
+        )
+
+
+@METRICS.timed("tab_details")
 def create_details() -> None:
     """
     Erstellt den Detail-Tab für die Streamlit-App.
@@ -69,19 +255,27 @@ def create_details() -> None:
     :return: None
     """
     st.session_state["active_tab"] = "Detail"
+    dataset = get_session_dataset()
 
-    if not st.session_state.movie_data_raw_df.empty:
+    if dataset is not None:
+        stage_timer = METRICS.stages("details")
         details_col1, details_col2 = st.columns(2)
 
         with details_col1:
             selected_title = st.selectbox(
                 "Wählen Sie einen Film aus, um Details zu sehen:",
-                st.session_state.movie_data_raw_df["Title"].unique(),
+                dataset.movies["Title"].unique(),
             )
-            movie_data = st.session_state["movie_data_raw_df"].copy()
-            movie_details = movie_data[movie_data["Title"] == selected_title].iloc[0]
+            # Nur die Zeile des ausgewählten Films wird gelesen, der gemeinsame
+            # Datensatz wird nicht kopiert
+            movie_data = dataset.movies
+            movie_details = movie_data.loc[movie_data["Title"] == selected_title].iloc[
+                0
+            ]
 
-            st.image(movie_details["Poster"])
+            poster = get_poster_cache().thumbnail(movie_details["Poster"], "detail")
+            if poster is not None:
+                st.image(poster)
             st.subheader(movie_details["Title"])
             st.write(f"**Year:** {movie_details['Year']}")
             st.write(f"**Rating:** {movie_details['Rated']}")
@@ -93,6 +287,8 @@ def create_details() -> None:
             st.write(f"**Awards:** {movie_details['Awards']}")
             st.write(f"**BoxOffice:** {movie_details['BoxOffice']}")
 
+        stage_timer.mark("movie_details")
+
         with details_col2:
             if movie_details["Plot"] != "N/A" and movie_details["Plot"] is not None:
                 st.subheader("Word Cloud Analyse")
@@ -110,9 +306,22 @@ def create_details() -> None:
                     int((max_text_len - 5) / 2),
                 )
 
-                _create_cloud(text=movie_details["Plot"], max_word=max_word)
+                st.image(
+                    render_word_cloud(
+                        movie_details["imdbID"], str(movie_details["Plot"]), max_word
+                    ),
+                    use_column_width=True,
+                )
 
             else:
                 st.markdown(
                     '<p class="font">Plot not fount!</p>', unsafe_allow_html=True
                 )
+
+        stage_timer.mark("word_cloud")
+
+        _create_similar_movies(dataset, movie_details["imdbID"])
+        stage_timer.mark("similar_movies")
+
+        _create_catalogue_analysis(dataset)
+        stage_timer.mark("catalogue_analysis")
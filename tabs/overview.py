@@ -1,66 +1,166 @@
 import streamlit as st
 import pandas as pd
 
+from pathlib import Path
 from typing import List
-import plotly.express as px
-import plotly.graph_objects as go
-from process.processor import DataProcessor
+from process.processor import DataProcessor, NormalizedMovieData
+from process.aggregates import OverviewAggregates, compute_overview_aggregates
+from process.search import MovieSearchIndex
+from process.table_view import MovieTableView, TABLE_PAGE_SIZES, count_pages
+from process.movie_list import read_movie_list
+from process.dataset_store import load_movie_dataset
+from process.dataset_registry import DatasetRegistry, SharedDataset
+from process.load_jobs import MovieLoadJob, MovieLoadQueue, MovieLoadRequest
 from api.omdb import OmdbApiHandler
+from api.posters import PosterCache
+from metrics import METRICS
 
 
 processor = DataProcessor([])
 
 
-# Da die Ausführung dieser Funktion lange dauert, wird
-# caching mit @st.cache_data verwendet, damit Länder nicht mehrfach verarbeitet werden
-@st.cache_data
-def get_country_coordinates(country: str):
-    """Wrapper Funktion um get_coordinates mit caching"""
-    return processor.get_coordinates(country)
+# Der Poster-Cache wird von allen Sessions geteilt
+@st.cache_resource
+def get_poster_cache() -> PosterCache:
+    """Erstellt den PosterCache einmal pro Prozess."""
+    return PosterCache(
+        cache_path=processor.config.poster_cache_path,
+        max_bytes=int(processor.config.poster_cache_max_mb * 1024 * 1024),
+        max_workers=processor.config.poster_max_workers,
+    )
+
+
+# Die geladenen Datensätze werden von allen Sessions geteilt. Jede Session hält nur
+# eine Lease im Session State, die Normalisierung wird einmal pro Datensatz ausgeführt.
+@st.cache_resource
+def get_dataset_registry() -> DatasetRegistry:
+    """Erstellt die DatasetRegistry einmal pro Prozess."""
+    return DatasetRegistry(
+        normalize=processor.normalize_movie_data,
+        max_idle=processor.config.dataset_registry_max_idle,
+    )
+
+
+# Der API-Handler wird von allen Sessions geteilt: Verbindungspool, Rate Limit,
+# Circuit Breaker und die Liste nicht gefundener Titel gelten für den ganzen Prozess.
+# Er wird erst beim ersten Laden einer Liste erstellt, nicht schon beim Start der App.
+@st.cache_resource(show_spinner=False)
+def get_api_handler() -> OmdbApiHandler:
+    """Erstellt den OmdbApiHandler einmal pro Prozess."""
+    return OmdbApiHandler()
+
+
+# Die Lade-Jobs laufen prozessweit im Hintergrund, damit der Skript-Thread nicht
+# blockiert und mehrere Sessions mit derselben Liste einem Job beitreten können
+@st.cache_resource(show_spinner=False)
+def get_load_queue() -> MovieLoadQueue:
+    """Erstellt die MovieLoadQueue einmal pro Prozess."""
+    return MovieLoadQueue(
+        get_api_handler(),
+        max_workers=processor.config.load_job_workers,
+        max_finished=processor.config.load_job_max_finished,
+    )
+
+
+def set_session_dataset(movie_df: pd.DataFrame) -> None:
+    """
+    Legt die geladenen Filmdaten als Datensatz der aktuellen Session fest.
+    Die Lease auf den bisherigen Datensatz wird freigegeben.
+
+    :param movie_df: DataFrame mit den Rohdaten, ein leeres DataFrame entfernt den Datensatz.
+    """
+    lease = st.session_state.get("dataset_lease")
+    if lease is not None:
+        lease.release()
+
+    if movie_df.empty:
+        st.session_state["dataset_lease"] = None
+        return
 
+    st.session_state["dataset_lease"] = get_dataset_registry().acquire(
+        processor.dataset_fingerprint(movie_df), movie_df
+    )
 
-def create_geo_map_data(country_list: List[str]) -> pd.DataFrame:
+
+def get_session_dataset() -> SharedDataset | None:
     """
-    Erstellt aus einer Liste an Ländern ein DataFrame mit den Ländern und zugehörigen
-    Lat und Lon Werten
-    :param country_list: List an Länder-Codes
-    :return: DataFrame
+    Liefert den Datensatz der aktuellen Session ohne Kopie.
+    :return: SharedDataset oder None, wenn noch keine Filme geladen wurden
     """
-    result_list = []
-    for country in country_list:
-        lat, lon = get_country_coordinates(country)
-        if lat is not None and lon is not None:
-            result_list.append({"country": country, "latitude": lat, "longitude": lon})
+    lease = st.session_state.get("dataset_lease")
+    return lease.dataset if lease is not None else None
+
+
+# Die Kennzahlen der Grafiken hängen nur vom Datensatz ab und werden ebenfalls
+# nur einmal pro Fingerabdruck berechnet
+@st.cache_resource(max_entries=8)
+def get_overview_aggregates(
+    fingerprint: str, _normalized_data: NormalizedMovieData
+) -> OverviewAggregates:
+    """Wrapper Funktion um compute_overview_aggregates mit caching"""
+    return compute_overview_aggregates(_normalized_data)
 
-    return pd.DataFrame(result_list)
+
+# Der Suchindex wird beim Laden eines Datensatzes einmal aufgebaut
+@st.cache_resource(max_entries=8)
+def get_search_index(
+    fingerprint: str, _normalized_data: NormalizedMovieData
+) -> MovieSearchIndex:
+    """Wrapper Funktion um den MovieSearchIndex mit caching"""
+    search_columns = ["Title", "Genre", "Actors", "Director"]
+    if processor.config.search_include_plot:
+        search_columns.append("Plot")
+
+    return MovieSearchIndex(_normalized_data.movies, column_name_list=search_columns)
+
+
+# Die Tabelle wird einmal pro Datensatz vorbereitet, ein Rerun sortiert und
+# blättert nur noch über Zeilennummern
+@st.cache_resource(max_entries=8)
+def get_table_view(
+    fingerprint: str, _normalized_data: NormalizedMovieData
+) -> MovieTableView:
+    """Wrapper Funktion um die MovieTableView mit caching"""
+    return MovieTableView(_normalized_data.movies)
+
+
+def create_geo_map_data(country_stats: pd.DataFrame) -> pd.DataFrame:
+    """
+    Ergänzt die Kennzahlen je Land um die Lat und Lon Werte für die Blasenkarte.
+    Bekannte Länder kommen aus der Offline-Tabelle, nur unbekannte Namen werden
+    bei der Photon API angefragt.
+    :param country_stats: Kennzahlen je Land aus OverviewAggregates.country_stats.
+    :return: DataFrame mit den Kennzahlen und den Spalten latitude und longitude
+    """
+    coordinates = processor.get_coordinates_batch(country_stats["Country"].tolist())
+
+    return country_stats.assign(
+        latitude=[coordinates[country][0] for country in country_stats["Country"]],
+        longitude=[coordinates[country][1] for country in country_stats["Country"]],
+    )
+
+
+# Die Koordinaten der Länder werden einmal pro Datensatz ermittelt
+@st.cache_resource(max_entries=8)
+def get_geo_map_data(fingerprint: str, _country_stats: pd.DataFrame) -> pd.DataFrame:
+    """Wrapper Funktion um create_geo_map_data mit caching"""
+    return create_geo_map_data(_country_stats)
 
 
 def update_movie_data(movie_titles_input: str, uploaded_file) -> List:
     """
     Aktualisiert die Filmdaten basierend auf dem eingegebenen Titel oder der hochgeladenen Datei.
+    Enthält die Datei die IMDb-Spalte "Const", werden die eindeutigen imdbIDs statt
+    der Titel verwendet.
 
     :param movie_titles_input: String mit durch Kommas getrennten Filmtiteln.
     :param uploaded_file: Hochgeladene Datei mit Filmtiteln.
-    :return: Liste der Filmtitel.
+    :return: Liste der Filmtitel bzw. imdbIDs.
     """
     movie_list = []
 
     if uploaded_file:
-        # Datei basierend auf dem Dateityp lesen
-        if uploaded_file.name.endswith(".csv"):
-            movie_df = pd.read_csv(uploaded_file)
-
-        elif uploaded_file.name.endswith(".xlsx"):
-            movie_df = pd.read_excel(uploaded_file)
-
-        else:
-            # Erstellt ein leeres DataFrame, falls die Datei kein bekanntes Format hat
-            movie_df = pd.DataFrame()
-
-        # Wenn das DataFrame nicht leer ist und es eine "title" Spalte enthält
-        # wird es weiter verwendet
-        if not movie_df.empty and "Title" in movie_df.columns:
-            movie_list = movie_df["Title"].tolist()
+        movie_list = read_movie_list(uploaded_file, file_name=uploaded_file.name)
 
     # Wenn kein File hochgeladen wurde und stattdessen ein Filmtitel eingegeben wurde
     if not movie_list and movie_titles_input:
@@ -70,72 +170,190 @@ def update_movie_data(movie_titles_input: str, uploaded_file) -> List:
     return movie_list
 
 
-def initial_setup(movie_titles: str, api: OmdbApiHandler, movie_file_upload) -> None:
+def _render_loading_preview(job: MovieLoadJob, processed_count: int, container) -> None:
+    """
+    Zeigt während des Ladens einen Zwischenstand mit der Genre-Verteilung der
+    bisher geladenen Filme an. Die Grafik wird nur neu erstellt, wenn seit dem
+    letzten Rerun weitere Titel verarbeitet wurden, sonst wird die gespeicherte
+    Grafik der Session erneut angezeigt.
+
+    :param job: Der laufende Lade-Job der Session.
+    :param processed_count: Anzahl der bisher verarbeiteten Titel.
+    :param container: st.empty()-Platzhalter für die Vorschau.
+    """
+    # plotly wird erst geladen, wenn die erste Grafik angezeigt wird
+    from tabs import charts
+
+    preview_key = (job.key, processed_count)
+    preview = st.session_state.get("loading_preview")
+    if preview is None or preview[0] != preview_key:
+        preview = (preview_key, charts.loading_preview_figure(job.movie_data))
+        st.session_state["loading_preview"] = preview
+
+    fig = preview[1]
+    if fig is not None:
+        container.plotly_chart(fig, use_container_width=True)
+
+
+@METRICS.timed("initial_setup")
+def initial_setup(
+    movie_titles: str,
+    movie_file_upload,
+    search_term: str = "",
+    search_type: str | None = None,
+    search_year: str | None = None,
+) -> None:
     """
     Initialisiert die Datenverarbeitung für die Streamlit-App.
+    Die Filmdaten werden nicht im Skript-Thread geladen: die Eingabe wird als
+    Job in die MovieLoadQueue eingereiht und die Funktion kehrt sofort zurück.
+    Fortschritt und Ergebnis zeigt show_load_job bei den folgenden Reruns an.
 
     :param movie_titles: Eingegebene Filmtitel.
-    :param api: Instanz der OmdbApiHandler-Klasse.
     :param movie_file_upload: Hochgeladene Datei mit Filmtiteln.
+    :param search_term: Optionaler Suchbegriff. Ist er gesetzt, werden statt der
+                        Titel alle Treffer der OMDb-Suche geladen.
+    :param search_type: Optionaler Typ der Suche: "movie", "series" oder "episode".
+    :param search_year: Optionales Erscheinungsjahr der Suche.
     """
     if (
         movie_titles != "Geben Sie die Filmtitel ein, getrennt durch Kommas"
         or movie_file_upload is not None
+        or search_term.strip()
     ):
-        movie_list = update_movie_data(
-            movie_titles_input=movie_titles, uploaded_file=movie_file_upload
-        )
-
-        # Hier wird die Liste manuell reduziert, um das Testen der Applikation
-        # zu erleichtern und das Überschreiten der API-Limits zu verhindern
-        if len(movie_list) > 40:
-            movie_list = movie_list[0:40]
-
-        if movie_list and movie_list[0] != "":
-            movie_data_raw = api.get_movie_info_from_list(movie_title_list=movie_list)
+        if search_term.strip():
+            request = MovieLoadRequest(
+                search_term=search_term.strip(),
+                search_type=search_type,
+                search_year=search_year,
+            )
+        elif movie_file_upload is not None:
+            # Die Datei wird erst im Job blockweise gelesen, die ersten Filme
+            # werden schon geladen, während der Rest der Datei noch gelesen wird
+            request = MovieLoadRequest(
+                movie_file=movie_file_upload.getvalue(),
+                file_name=movie_file_upload.name,
+            )
+        else:
+            movie_list = update_movie_data(
+                movie_titles_input=movie_titles, uploaded_file=None
+            )
 
-            if movie_data_raw:
-                st.session_state["movie_data_raw_df"] = pd.DataFrame(movie_data_raw)
-                print(
-                    f"st.session_state.movie_data_raw_df {st.session_state.movie_data_raw_df}"
-                )
-                st.session_state.input_movie_titles = movie_list
-            else:
+            if not movie_list or movie_list[0] == "":
+                set_session_dataset(pd.DataFrame())
+                st.session_state.input_movie_titles = ""
                 st.markdown(
-                    '<p class="font">Movie not found!</p>', unsafe_allow_html=True
+                    '<p class="font">Your movie list is empty</p>',
+                    unsafe_allow_html=True,
                 )
+                return
+
+            request = MovieLoadRequest(movie_list=tuple(movie_list))
+
+        # Lädt eine andere Session dieselbe Liste, wird deren Job verwendet
+        job = get_load_queue().submit(request)
+        st.session_state["load_job_key"] = job.key
+
+    else:
+        st.markdown('<p class="font">User input is missing</p>', unsafe_allow_html=True)
+
 
+def show_load_job() -> bool:
+    """
+    Zeigt den Fortschritt und eine Vorschau des Lade-Jobs der Session an.
+    Ist der Job fertig, wird sein Ergebnis als Datensatz der Session in der
+    DatasetRegistry abgelegt.
+
+    :return: True, solange der Job noch läuft und erneut abgefragt werden muss
+    """
+    job_key = st.session_state.get("load_job_key")
+    if job_key is None:
+        return False
+
+    job = get_load_queue().get(job_key)
+    if job is None:
+        st.session_state["load_job_key"] = None
+        return False
+
+    if not job.is_finished:
+        status, processed_count, total_count = job.progress()
+
+        if status == MovieLoadJob.PENDING:
+            st.progress(0.0, text="Warten auf einen freien Ladeplatz ...")
+        elif total_count == 0:
+            st.progress(0.0, text="OMDb-Suche läuft ...")
         else:
-            st.session_state["movie_data_raw_df"] = pd.DataFrame()
-            st.session_state.input_movie_titles = ""
-            st.markdown(
-                '<p class="font">Your movie list is empty</p>', unsafe_allow_html=True
+            st.progress(
+                processed_count / total_count,
+                text=f"{processed_count} von {total_count} Filmen geladen",
             )
 
+        _render_loading_preview(job, processed_count, st.empty())
+        return True
+
+    st.session_state["load_job_key"] = None
+    st.session_state.pop("loading_preview", None)
+    movie_data_df = job.movie_data
+    set_session_dataset(movie_data_df)
+
+    if job.status == MovieLoadJob.FAILED:
+        st.error(f"Die Filmdaten konnten nicht geladen werden: {job.error}")
+
+    if job.api_unavailable:
+        st.warning(
+            "Die OMDb API ist zurzeit nicht erreichbar, es werden nur bereits "
+            "gespeicherte Filme angezeigt."
+        )
+
+    if not movie_data_df.empty:
+        st.session_state.input_movie_titles = movie_data_df["Title"].tolist()
     else:
-        st.markdown('<p class="font">User input is missing</p>', unsafe_allow_html=True)
+        st.markdown('<p class="font">Movie not found!</p>', unsafe_allow_html=True)
 
+    return False
+
+
+@METRICS.timed("load_prepared_dataset")
+def load_prepared_dataset(dataset_path: Path) -> None:
+    """
+    Lädt einen mit ingest.py vorbereiteten Datensatz in die Streamlit-App.
+    Die Datei wird über Memory-Mapping geöffnet, es sind keine API-Aufrufe nötig.
 
+    :param dataset_path: Pfad der Parquet- oder Feather-Datei.
+    """
+    movie_data_df = load_movie_dataset(dataset_path)
+
+    if movie_data_df.empty:
+        st.markdown('<p class="font">Movie not found!</p>', unsafe_allow_html=True)
+        return
+
+    set_session_dataset(movie_data_df)
+    st.session_state.input_movie_titles = movie_data_df["Title"].tolist()
+
+
+@METRICS.timed("tab_overview")
 def create_overview_graphs() -> None:
     """
     Erstellt die Übersichtsgrafiken im Overview-Tab.
     """
+    dataset = get_session_dataset()
+
+    if dataset is not None:
+        from tabs import charts
 
-    if not st.session_state.movie_data_raw_df.empty:
         st.session_state["active_tab"] = "Overview"
+        stage_timer = METRICS.stages("overview")
 
         st.subheader("Data Overview")
         st.markdown("<br>", unsafe_allow_html=True)
 
-        st.session_state.movie_data_raw_df = processor.explode_column(
-            df=st.session_state.movie_data_raw_df,
-            column_name_list=["Genre", "Country", "Actors", "Country"],
-        )
-        if not st.session_state["cleaned"]:
-            st.session_state["movie_data_raw_df"] = processor.clean_int_values(
-                movie_df=st.session_state["movie_data_raw_df"]
-            )
-            st.session_state["cleaned"] = True
+        # Die typisierten Daten und die Kennzahlen werden einmal pro Datensatz
+        # erstellt, bei einem Rerun wird nur der Cache gelesen
+        fingerprint = dataset.key
+        normalized_data = dataset.normalized
+        aggregates = get_overview_aggregates(fingerprint, normalized_data)
+        movie_data_df = normalized_data.movies
+        stage_timer.mark("prepare")
 
         # Geschützte Spalten:
         protected_columns = ["Poster", "Title", "Genre", "imdbRating", "BoxOffice"]
@@ -146,39 +364,74 @@ def create_overview_graphs() -> None:
             "**Angezeigte Spalten**:",
             [
                 column
-                for column in st.session_state.movie_data_raw_df.columns
+                for column in movie_data_df.columns
                 if column not in protected_columns
             ],
         )
-        print(f"selected columns {selected_columns}")
 
         text_search = filter_col2.text_input(
             "Suchen Sie Filme nach Titel, Genre oder Schauspieler", value=""
         )
 
-        movie_data_raw_df = st.session_state["movie_data_raw_df"].copy()
-        print(f"movie data columns {movie_data_raw_df.columns}")
         if selected_columns:
-            movie_data_raw_df = movie_data_raw_df[protected_columns + selected_columns]
+            table_columns = protected_columns + selected_columns
         else:
-            movie_data_raw_df = st.session_state.movie_data_raw_df
+            table_columns = list(movie_data_df.columns)
 
+        row_positions = None
         if text_search:
-            title_search = st.session_state.movie_data_raw_df.Title.str.contains(
-                text_search, case=False
-            )
-            genre_search = st.session_state.movie_data_raw_df.Genre.str.contains(
-                text_search, case=False
-            )
+            # Suche über den invertierten Index (Titel, Genre, Schauspieler, Regie),
+            # das Ergebnis sind die Zeilennummern der gefundenen Filme
+            search_index = get_search_index(fingerprint, normalized_data)
+            row_positions = search_index.search(text_search)
+
+        # Sortieren, Filtern und Blättern passiert auf dem Server, an den Browser
+        # wird nur die sichtbare Seite gesendet
+        table_view = get_table_view(fingerprint, normalized_data)
+        sort_col1, sort_col2, page_col1, page_col2 = st.columns([2, 1, 1, 1])
+        sort_column = sort_col1.selectbox(
+            "**Sortieren nach**:", ["-"] + list(table_view.table_df.columns)
+        )
+        ascending = (
+            sort_col2.selectbox("**Reihenfolge**:", ["aufsteigend", "absteigend"])
+            == "aufsteigend"
+        )
+        page_sizes = sorted(
+            set(TABLE_PAGE_SIZES + [processor.config.overview_page_size])
+        )
+        page_size = page_col1.selectbox(
+            "**Filme je Seite**:",
+            page_sizes,
+            index=page_sizes.index(processor.config.overview_page_size),
+        )
 
-            actor_search = st.session_state.movie_data_raw_df.Actors.str.contains(
-                text_search, case=False
-            )
+        row_order = table_view.row_order(
+            row_positions,
+            sort_column=sort_column if sort_column != "-" else None,
+            ascending=ascending,
+        )
+        page_count = count_pages(len(row_order), page_size)
+        # Nach einer neuen Suche kann die gespeicherte Seite nicht mehr existieren
+        if st.session_state.get("overview_table_page", 1) > page_count:
+            st.session_state["overview_table_page"] = page_count
+        page_number = page_col2.number_input(
+            "**Seite**:",
+            min_value=1,
+            max_value=page_count,
+            step=1,
+            key="overview_table_page",
+        )
+        table_page = table_view.page(
+            row_order, table_columns, page=page_number, page_size=page_size
+        )
+        movie_data_raw_df = table_page.rows
 
-            movie_data_raw_df_filtered = st.session_state.movie_data_raw_df[
-                title_search | genre_search | actor_search
-            ]
-            movie_data_raw_df = movie_data_raw_df_filtered[movie_data_raw_df.columns]
+        # Statt der Originalbilder von Amazon werden lokale Vorschaubilder angezeigt,
+        # umgewandelt werden nur die Poster der sichtbaren Seite
+        with st.spinner("Poster loading..."):
+            movie_data_raw_df = movie_data_raw_df.assign(
+                Poster=get_poster_cache().data_urls(movie_data_raw_df["Poster"])
+            )
 
         column_order = list(movie_data_raw_df.columns)
 
@@ -202,106 +455,39 @@ def create_overview_graphs() -> None:
             },
             hide_index=True,
         )
+        st.caption(
+            f"Filme {min(table_page.first_row + 1, table_page.row_count)}–"
+            f"{table_page.first_row + len(movie_data_raw_df)} von {table_page.row_count}"
+        )
+        stage_timer.mark("table")
 
         st.subheader("Genre Analyse")
         graph_column_1, graph_column_2 = st.columns(2)
         graph_column_3, graph_column_4 = st.columns(2)
 
         with graph_column_1:
-            # Die Spalte "Genre" in eine lange Reihe auflösen
-            genre_exploded = st.session_state["movie_data_raw_df"].explode("Genre")
-            genre_counts = genre_exploded["Genre"].value_counts().reset_index()
-            genre_counts.columns = ["Genre", "Count"]
-
-            fig = px.bar(
-                genre_counts,
-                x="Count",
-                y="Genre",
-                orientation="h",
-                title="Anzahl der Genres",
+            # Anzahl der Filme je Genre (vorberechnet)
+            st.plotly_chart(
+                charts.genre_counts_figure(aggregates.genre_counts),
+                use_container_width=True,
             )
 
-            # Aktualisierung der x-Achse, um nur ganze Zahlen als Ticks anzuzeigen
-            fig.update_layout(
-                height=600,
-                xaxis=dict(
-                    dtick=1,  # Setzt die Tick-Intervalle auf ganze Zahlen
-                    tick0=0,  # Beginnt die Ticks bei 0
-                    range=[
-                        0,
-                        genre_counts["Count"].max() + 2,
-                    ],  # Setzt die Reichweite der x-Achse
-                ),
-                yaxis=dict(
-                    tickfont=dict(size=12),  # Schriftgröße der Tick-Labels anpassen
-                ),
+            # Median IMDb-Bewertung pro Genre (vorberechnet)
+            graph_column_2.plotly_chart(
+                charts.genre_ratings_figure(aggregates.genre_ratings),
+                use_container_width=True,
             )
-
-            fig.update_traces(marker_color="purple", opacity=0.6)
-            st.plotly_chart(fig, use_container_width=True)
-
-            # Median IMDb-Bewertung pro Genre
-            # Data-Bereinigen mit clean_int_values:
-            # genre_exploded = processor.clean_int_values(movie_df=genre_exploded)
-
-            genre_ratings = (
-                genre_exploded.groupby("Genre")["imdbRating"].median().reset_index()
-            )
-
-            genre_ratings = genre_ratings.sort_values(by="imdbRating", ascending=False)
-
-            fig = px.bar(
-                genre_ratings,
-                x="imdbRating",
-                y="Genre",
-                orientation="h",
-                title="Median IMDb-Bewertung pro Genre",
-            )
-
-            fig.update_layout(height=600)
-            fig.update_traces(marker_color="navy", opacity=0.9)
-            graph_column_2.plotly_chart(fig, use_container_width=True)
+            stage_timer.mark("genre_charts")
 
             # Korrelation zwischen Box-Office und Imdb Rating
+            graph_column_3.plotly_chart(charts.box_office_scatter_figure(aggregates))
 
-            fig = px.scatter(
-                genre_exploded,
-                x="BoxOffice",
-                y="imdbRating",
-                hover_data=["Title"],
-                title="Box-Office-Einnahmen vs. IMDb Bewertungen",
-                trendline="ols",
-                width=500,
-                height=400,
-            )
-            fig.update_layout(
-                xaxis_title="Box Office (in Millionen)",
-                yaxis_title="IMDb Bewertung",
-            )
-            graph_column_3.plotly_chart(fig)
-
-            # Histogramm
-            # Anzahl der Datenpunkte bestimmen
-            # movie_data_raw_df = processor.clean_int_values(movie_data_raw_df)
-            bin_width = 20  # bin Breite - 10M
-            bins = int(
-                (
-                    movie_data_raw_df["BoxOffice"].max()
-                    - float(movie_data_raw_df["BoxOffice"].min())
-                )
-                / bin_width
-            )
-
-            print(f"n_bins {bins}")
+            # Histogramm mit vorberechneten Klassen (bin Breite - 20M)
             graph_column_4.write("Verteilung der BoxOffice Einnahmen:")
-            fig_hist = px.histogram(
-                movie_data_raw_df, x="BoxOffice", nbins=bins, width=500, height=400
-            )
-            fig_hist.update_layout(
-                xaxis_title="Box Office (in Millionen)",
-                yaxis_title="Anzahl der Filme",
+            graph_column_4.plotly_chart(
+                charts.box_office_histogram_figure(aggregates.box_office_histogram)
             )
-            graph_column_4.plotly_chart(fig_hist)
+            stage_timer.mark("box_office_charts")
 
             """
             # ADVANCE RESULTS 
@@ -318,45 +504,32 @@ def create_overview_graphs() -> None:
 
         # ----------  COUNTRIES MAP --------------
 
-        # a dedicated single loader
-        with st.spinner("Bitte warten ..."):
-            countries = st.session_state["movie_data_raw_df"]["Country"].apply(
-                lambda x: x.split(",") if isinstance(x, str) else x
-            )
-            processed_countries = list(
-                set(country.strip() for country in set(countries.explode()))
-            )
+        st.markdown("<br>", unsafe_allow_html=True)
+        st.markdown(
+            "<strong>Länderverteilung der Filme</strong>",
+            unsafe_allow_html=True,
+        )
 
-            geo_map_df = create_geo_map_data(country_list=processed_countries)
-
-            # Erstellung der Mapbox-Karte
-            fig = px.scatter_mapbox(
-                geo_map_df,
-                lat="latitude",
-                lon="longitude",
-                hover_data={"latitude": False, "longitude": False},
-                zoom=1,
-                height=500,
-                title="Länderverteilung der Filme",
-                color_discrete_sequence=["fuchsia"],
-            )
+        map_col1, map_col2 = st.columns([2, 1])
+        metric_columns = {
+            label: metric for metric, label in charts.COUNTRY_MAP_METRICS.items()
+        }
+        map_metric = metric_columns[
+            map_col1.radio("**Gewichtung**:", list(metric_columns), horizontal=True)
+        ]
+        map_type = map_col2.radio(
+            "**Darstellung**:", ["Flächen", "Blasen"], horizontal=True
+        )
 
-            fig.add_trace(
-                go.Scattermapbox(
-                    mode="markers",
-                    marker=go.scattermapbox.Marker(
-                        size=15, color="rgb(242, 177, 172)", opacity=0.7
-                    ),
-                    hoverinfo="none",
-                )
-            )
+        # a dedicated single loader
+        with st.spinner("Bitte warten ..."):
+            # Die Kennzahlen je Land sind Teil der Aggregate des Datensatzes
+            geo_map_df = get_geo_map_data(fingerprint, aggregates.country_stats)
 
-            fig.update_layout(mapbox_style="open-street-map")
-            fig.update_layout(margin={"r": 0, "t": 0, "l": 0, "b": 0})
-            st.markdown("<br>", unsafe_allow_html=True)
-            st.markdown(
-                "<strong>Länderverteilung der Filme</strong>",
-                unsafe_allow_html=True,
+            # Erstellung der Karte
+            fig = charts.country_map_figure(
+                geo_map_df, metric=map_metric, bubbles=map_type == "Blasen"
             )
 
             st.plotly_chart(fig, use_container_width=True)
+            stage_timer.mark("map")